@@ -0,0 +1,105 @@
+"""Cart pricing and validation.
+
+Carts store the price each item had when it was added. ``price_cart`` re-prices the
+lines against the current catalog, flags what changed or can no longer be bought,
+and computes the totals the API returns, so the frontend never adds prices up itself.
+All products of a cart are fetched with a single ``$in`` query through
+``ProductLookup``, which also keeps them for a short TTL across requests.
+"""
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List
+
+# Fields needed to price and display a cart line
+PRICING_PROJECTION = {
+    "_id": 0, "id": 1, "name": 1, "price": 1, "stock": 1, "sizes": 1, "colors": 1,
+    "images": {"$slice": 1},
+}
+
+# Issues that keep a line out of the totals and block checkout
+BLOCKING_ISSUES = {"unavailable", "out_of_stock", "insufficient_stock", "option_unavailable"}
+
+_MISSING = object()
+
+
+class ProductLookup:
+    """Short-lived cache of pricing fields by product id, misses included."""
+
+    def __init__(self, collection, ttl: float = 30.0, max_entries: int = 10_000):
+        self.collection = collection
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    async def get_many(self, product_ids: Iterable[str], fresh: bool = False) -> Dict[str, dict]:
+        """Products by id; ids that do not exist are left out. ``fresh`` skips the cache."""
+        now = time.monotonic()
+        found, missing = {}, []
+        for product_id in set(product_ids):
+            cached = None if fresh else self._entries.get(product_id)
+            if cached is not None and cached[0] > now:
+                if cached[1] is not _MISSING:
+                    found[product_id] = cached[1]
+            else:
+                missing.append(product_id)
+        if missing:
+            loaded = {
+                p["id"]: p
+                async for p in self.collection.find({"id": {"$in": missing}}, PRICING_PROJECTION)
+            }
+            for product_id in missing:
+                product = loaded.get(product_id, _MISSING)
+                self._entries[product_id] = (now + self.ttl, product)
+                self._entries.move_to_end(product_id)
+                if product is not _MISSING:
+                    found[product_id] = product
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return found
+
+    def clear(self):
+        self._entries.clear()
+
+
+def price_line(item: dict, product: dict) -> dict:
+    line = dict(item)
+    issues = []
+    if product is None:
+        issues.append("unavailable")
+    else:
+        line["product_name"] = product["name"]
+        images = product.get("images") or []
+        line["image"] = images[0]["url"] if images else None
+        if product["price"] != item["price"]:
+            line["previous_price"] = item["price"]
+            line["price"] = product["price"]
+            issues.append("price_changed")
+        stock = product.get("stock", 0)
+        line["available_quantity"] = max(stock, 0)
+        if stock <= 0:
+            issues.append("out_of_stock")
+        elif item["quantity"] > stock:
+            issues.append("insufficient_stock")
+        if item["size"] not in product.get("sizes", []) or item["color"] not in product.get("colors", []):
+            issues.append("option_unavailable")
+    line["issues"] = issues
+    line["line_total"] = round(line["price"] * item["quantity"], 2)
+    return line
+
+
+def price_cart(items: List[dict], products: Dict[str, dict]) -> dict:
+    """Re-priced lines plus a summary; only lines without blocking issues are totalled."""
+    lines = [price_line(item, products.get(item["product_id"])) for item in items]
+    payable = [line for line in lines if not BLOCKING_ISSUES.intersection(line["issues"])]
+    subtotal = round(sum(line["line_total"] for line in payable), 2)
+    return {
+        "items": lines,
+        "summary": {
+            "item_count": sum(line["quantity"] for line in payable),
+            "subtotal": subtotal,
+            "shipping": 0.0,
+            "total": subtotal,
+            "price_changed": any("price_changed" in line["issues"] for line in lines),
+            "can_checkout": bool(lines) and len(payable) == len(lines),
+        },
+    }
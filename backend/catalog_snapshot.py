@@ -0,0 +1,234 @@
+"""Read-only catalog snapshot shared by all API workers through ``mmap``.
+
+``write_snapshot`` serializes the products (as the API returns them) and the
+categories into a single file with offset indexes, writes it next to the live file
+and swaps it in with ``os.replace``. ``SnapshotStore`` maps the live file read-only;
+every worker maps the same pages of the page cache, so memory stays flat as workers
+are added and a freshly started worker serves catalog reads without warming up.
+When the file is replaced, workers notice the new inode and remap - mappings of the
+old file stay valid until they are closed.
+
+Layout (little-endian)::
+
+    MAGIC | u32 header length | header JSON | 8-byte aligned sections
+
+The header lists each section's ``[offset, length]`` plus, per category, the
+``[start, count]`` of its slice in ``by_category``. Sections:
+
+* ``docs`` - product JSON documents back to back; ``doc_offsets`` (u64, n + 1)
+  delimits them, in catalog (natural) order
+* ``ids`` / ``id_offsets`` (u64, n + 1) - product ids sorted, ``id_order`` (u32)
+  maps each to its document, for binary search by id
+* ``prices`` (f64) - price of each document
+* ``by_price`` (u32) - document numbers sorted by price; ``by_category`` the same
+  per category, so a price range is two binary searches
+* ``categories`` - the categories list JSON
+"""
+import bisect
+import fcntl
+import heapq
+import json
+import mmap
+import os
+import struct
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"CATSNAP1"
+_HEADER_LENGTH = struct.Struct("<I")
+
+
+def _aligned(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_snapshot(path: Path, version: int, products: Iterable[Tuple[str, str, float, bytes]],
+                   categories_json: bytes):
+    """Write a snapshot of ``(id, category, price, json)`` products and swap it in atomically."""
+    products = list(products)
+    docs = [doc for _, _, _, doc in products]
+    prices = array("d", (price for _, _, price, _ in products))
+    doc_offsets = array("Q", [0])
+    for doc in docs:
+        doc_offsets.append(doc_offsets[-1] + len(doc))
+
+    id_order = sorted(range(len(products)), key=lambda i: products[i][0])
+    ids = [products[i][0].encode() for i in id_order]
+    id_offsets = array("Q", [0])
+    for product_id in ids:
+        id_offsets.append(id_offsets[-1] + len(product_id))
+
+    by_price = sorted(range(len(products)), key=lambda i: prices[i])
+    by_category, category_slices = array("I"), {}
+    groups: Dict[str, List[int]] = {}
+    for i in by_price:
+        groups.setdefault(products[i][1], []).append(i)
+    for category, members in groups.items():
+        category_slices[category] = [len(by_category), len(members)]
+        by_category.extend(members)
+
+    sections = [
+        ("docs", b"".join(docs)),
+        ("doc_offsets", doc_offsets.tobytes()),
+        ("ids", b"".join(ids)),
+        ("id_offsets", id_offsets.tobytes()),
+        ("id_order", array("I", id_order).tobytes()),
+        ("prices", prices.tobytes()),
+        ("by_price", array("I", by_price).tobytes()),
+        ("by_category", by_category.tobytes()),
+        ("categories", categories_json),
+    ]
+    layout, offset = {}, 0
+    for name, data in sections:
+        offset = _aligned(offset)
+        layout[name] = [offset, len(data)]
+        offset += len(data)
+    header = json.dumps({
+        "version": version,
+        "built_at": time.time(),
+        "count": len(products),
+        "sections": layout,
+        "by_category": category_slices,
+    }).encode()
+    # Section offsets are relative to the aligned start of the data area
+    data_start = _aligned(len(MAGIC) + _HEADER_LENGTH.size + len(header))
+
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+        for name, data in sections:
+            f.seek(data_start + layout[name][0])
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def acquire_build_lock(path: Path):
+    """Block until no other worker is building ``path``; closing the returned file releases it."""
+    lock = open(path.with_name(f"{path.name}.lock"), "a")
+    fcntl.flock(lock, fcntl.LOCK_EX)
+    return lock
+
+
+class CatalogSnapshot:
+    """One mapped snapshot file. Reads are synchronous and return copies."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self.inode = os.fstat(f.fileno()).st_ino
+        if self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a catalog snapshot")
+        header_start = len(MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._map, len(MAGIC))
+        header = json.loads(self._map[header_start:header_start + header_length])
+        self.version: int = header["version"]
+        self.count: int = header["count"]
+        self._category_slices = header["by_category"]
+
+        data_start = _aligned(header_start + header_length)
+        view = memoryview(self._map)
+        self._views = [view]
+
+        def section(name: str, fmt: Optional[str] = None) -> memoryview:
+            offset, length = header["sections"][name]
+            data = view[data_start + offset:data_start + offset + length]
+            self._views.append(data)
+            if fmt is not None:
+                data = data.cast(fmt)
+                self._views.append(data)
+            return data
+
+        self._docs = section("docs")
+        self._doc_offsets = section("doc_offsets", "Q")
+        self._ids = section("ids")
+        self._id_offsets = section("id_offsets", "Q")
+        self._id_order = section("id_order", "I")
+        self._prices = section("prices", "d")
+        self._by_price = section("by_price", "I")
+        self._by_category = section("by_category", "I")
+        self._categories = section("categories")
+
+    def _doc(self, i: int) -> memoryview:
+        return self._docs[self._doc_offsets[i]:self._doc_offsets[i + 1]]
+
+    def _id(self, position: int) -> bytes:
+        return self._ids[self._id_offsets[position]:self._id_offsets[position + 1]].tobytes()
+
+    def product(self, product_id: str) -> Optional[bytes]:
+        target = product_id.encode()
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._id(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count and self._id(lo) == target:
+            return self._doc(self._id_order[lo]).tobytes()
+        return None
+
+    def products(self, category: Optional[str] = None, min_price: Optional[float] = None,
+                 max_price: Optional[float] = None, limit: int = 1000) -> bytes:
+        """JSON list of the first ``limit`` matching products, in the same order as the collection."""
+        if category is None:
+            order, start, end = self._by_price, 0, self.count
+        else:
+            start, count = self._category_slices.get(category, (0, 0))
+            order, end = self._by_category, start + count
+        price = self._prices.__getitem__
+        if min_price is not None:
+            start = bisect.bisect_left(order, min_price, start, end, key=price)
+        if max_price is not None:
+            end = bisect.bisect_right(order, max_price, start, end, key=price)
+        selected = heapq.nsmallest(limit, order[start:end])
+        return b"[" + b",".join(self._doc(i) for i in selected) + b"]"
+
+    def categories(self) -> bytes:
+        return self._categories.tobytes()
+
+    def close(self):
+        for view in reversed(self._views):
+            view.release()
+        self._map.close()
+
+
+class SnapshotStore:
+    """The live snapshot of this worker, remapped when the file is replaced."""
+
+    def __init__(self, path: Path, check_interval: float = 1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self.snapshot: Optional[CatalogSnapshot] = None
+        # Set by a worker after its own catalog write, until its rebuild lands
+        self.stale = False
+        self._checked_at = 0.0
+
+    def current(self) -> Optional[CatalogSnapshot]:
+        now = time.monotonic()
+        if now - self._checked_at >= self.check_interval:
+            self._checked_at = now
+            self.refresh()
+        return None if self.stale else self.snapshot
+
+    def refresh(self):
+        try:
+            inode = os.stat(self.path).st_ino
+        except FileNotFoundError:
+            return
+        if self.snapshot is not None and self.snapshot.inode == inode:
+            return
+        # Callers read right after current(), without an await in between (coalesced
+        # loads call it again inside their task), so nothing is using the old mapping here
+        previous, self.snapshot = self.snapshot, CatalogSnapshot(self.path)
+        if previous is not None:
+            previous.close()
+
+    def close(self):
+        if self.snapshot is not None:
+            self.snapshot.close()
+            self.snapshot = None
@@ -0,0 +1,141 @@
+"""Catalog versions for delta sync.
+
+Every product write takes the next value of a single counter and stores it on the
+product as ``version``; deleting a product leaves a tombstone with its own version
+in ``product_tombstones``. A client that remembers the highest version it has seen
+asks for everything above it and gets the changed products and the deleted ids,
+read through indexes on ``version``, so staying in sync costs work proportional to
+the number of changes rather than the size of the catalog.
+
+Versions are taken before the write that carries them lands, so two concurrent
+writes can become visible out of order: N+1 before N. Every stamped write also
+records ``versioned_at``, the time just after its version was reserved, and
+``changes`` stops at the first change younger than ``settle_seconds``. A version
+older than that was reserved after every lower one, which has had the settle
+period to land: a client never moves its cursor past a change still in flight,
+as long as writes land within the settle period and worker clocks roughly agree.
+
+Tombstones are pruned after a retention period. The counter document records the
+highest pruned version: a client asking from below it may have missed a deletion
+and is told to reload the catalog from scratch.
+"""
+from datetime import datetime, timedelta, timezone
+from itertools import takewhile
+from typing import List
+
+from pymongo import ReturnDocument, UpdateOne
+
+COUNTER_ID = "catalog"
+
+
+class CatalogVersions:
+    def __init__(self, db, settle_seconds: float = 5.0):
+        self.db = db
+        self.settle_seconds = settle_seconds
+
+    async def ensure_indexes(self):
+        await self.db.products.create_index("version")
+        await self.db.product_tombstones.create_index("version")
+        await self.db.product_tombstones.create_index("deleted_at")
+
+    async def next(self) -> dict:
+        """``version`` and ``versioned_at`` fields for a single product write."""
+        return (await self.stamps(1))[0]
+
+    async def stamps(self, count: int) -> List[dict]:
+        """Fields for ``count`` product writes, one counter step for all of them."""
+        first = await self.reserve(count)
+        # Taken after the reservation, see ``changes``
+        versioned_at = datetime.now(timezone.utc).isoformat()
+        return [{"version": first + i, "versioned_at": versioned_at} for i in range(count)]
+
+    async def reserve(self, count: int) -> int:
+        """Take ``count`` consecutive versions in one step; returns the first.
+
+        Bulk writes give every product a version of its own: ``changes`` pages by
+        version, so products sharing one could be split across a page boundary.
+        """
+        counter = await self.db.counters.find_one_and_update(
+            {"_id": COUNTER_ID},
+            {"$inc": {"value": count}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return counter["value"] - count + 1
+
+    async def current(self) -> dict:
+        counter = await self.db.counters.find_one({"_id": COUNTER_ID}) or {}
+        return {"version": counter.get("value", 0), "pruned_through": counter.get("pruned_through", 0)}
+
+    async def stamp_unversioned(self) -> int:
+        """Give products written before versioning a version of their own (one-time)."""
+        ids = [
+            product["_id"]
+            async for product in self.db.products.find({"version": {"$exists": False}}, {"_id": 1})
+        ]
+        if not ids:
+            return 0
+        stamps = await self.stamps(len(ids))
+        # Another worker stamping at the same time only wastes versions, never overwrites
+        result = await self.db.products.bulk_write([
+            UpdateOne({"_id": _id, "version": {"$exists": False}}, {"$set": stamp})
+            for _id, stamp in zip(ids, stamps)
+        ], ordered=False)
+        return result.modified_count
+
+    async def tombstone(self, product_id: str, stamp: dict):
+        await self.db.product_tombstones.insert_one({
+            "id": product_id,
+            **stamp,
+            "deleted_at": datetime.now(timezone.utc).isoformat(),
+        })
+
+    async def changes(self, since: int, limit: int) -> dict:
+        """Products and tombstones with a version above ``since``, oldest change first."""
+        state = await self.current()
+        if since > 0 and since < state["pruned_through"]:
+            return {
+                "version": state["version"], "changes": [], "deleted": [], "has_more": False, "reset": True,
+                "settling": False,
+            }
+
+        query = {"version": {"$gt": since}}
+        products = await self.db.products.find(query, {"_id": 0}).sort("version", 1).limit(limit + 1).to_list(limit + 1)
+        # A mirror starting from scratch has nothing to delete
+        tombstones = []
+        if since > 0:
+            tombstones = await self.db.product_tombstones.find(query, {"_id": 0, "id": 1, "version": 1, "versioned_at": 1}) \
+                .sort("version", 1).limit(limit + 1).to_list(limit + 1)
+
+        merged = sorted(
+            [(p["version"], "changed", p) for p in products] + [(t["version"], "deleted", t) for t in tombstones],
+            key=lambda entry: entry[0],
+        )
+        # Stop before the first change that a lower, still unwritten version may precede;
+        # products stamped before versioning had no writes in flight
+        cutoff = (datetime.now(timezone.utc) - timedelta(seconds=self.settle_seconds)).isoformat()
+        settled = list(takewhile(lambda entry: entry[2].get("versioned_at", "") <= cutoff, merged))
+        page, has_more = settled[:limit], len(settled) > limit
+        changes: List[dict] = [doc for _, kind, doc in page if kind == "changed"]
+        deleted: List[str] = [doc["id"] for _, kind, doc in page if kind == "deleted"]
+        # Resume from the last change returned; never skip ahead to the counter, whose
+        # newest values may belong to writes that have not landed yet
+        version = page[-1][0] if page else since
+        return {
+            "version": version, "changes": changes, "deleted": deleted, "has_more": has_more, "reset": False,
+            "settling": len(settled) < len(merged),
+        }
+
+    async def prune_tombstones(self, older_than_days: int) -> dict:
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).isoformat()
+        newest = await self.db.product_tombstones.find({"deleted_at": {"$lt": cutoff}}, {"version": 1}) \
+            .sort("version", -1).limit(1).to_list(1)
+        if not newest:
+            return {"pruned": 0}
+        pruned_through = newest[0]["version"]
+        # Record the boundary first, so a client is never told it is in sync across a gap
+        await self.db.counters.update_one(
+            {"_id": COUNTER_ID}, {"$max": {"pruned_through": pruned_through}}, upsert=True
+        )
+        result = await self.db.product_tombstones.delete_many({"version": {"$lte": pruned_through}})
+        return {"pruned": result.deleted_count}
@@ -0,0 +1,111 @@
+"""Per-route counts of the MongoDB commands each request issues.
+
+``CommandStats`` is a pymongo ``CommandListener``: registered on the client, it
+sees every command sent to the server. Requests are tied to commands through a
+context variable holding a per-request counter. Motor runs pymongo calls with a
+copy of the caller's context, so commands issued by a handler land in its
+request's counter, while background loops (no counter set) are not counted.
+
+``CommandStatsMiddleware`` sets the counter, and once the response starts
+folds it into the totals of the matched route template (``/api/products/{product_id}``)
+and reports it in an ``X-DB-Commands`` header. Tests can assert the round trips a
+route makes, and ``snapshot`` shows the per-route averages, so a handler that
+gains an extra read shows up directly.
+"""
+import threading
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from pymongo import monitoring
+from starlette.datastructures import MutableHeaders
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+_request_commands: ContextVar[Optional[Counter]] = ContextVar("request_commands", default=None)
+
+# Handshake and keep-alive commands, not issued by application code
+_IGNORED = frozenset({"hello", "ismaster", "isMaster", "ping", "endSessions", "saslStart", "saslContinue"})
+
+
+class CommandStats(monitoring.CommandListener):
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests: Counter = Counter()
+        self._commands: Dict[str, Counter] = {}
+
+    # Listener callbacks run on Motor's executor threads
+
+    def started(self, event):
+        counter = _request_commands.get()
+        if counter is not None and event.command_name not in _IGNORED:
+            counter[event.command_name] += 1
+
+    def succeeded(self, event):
+        pass
+
+    def failed(self, event):
+        pass
+
+    def begin_request(self) -> Counter:
+        """Start counting the commands of the current request; returns its counter."""
+        counter = Counter()
+        _request_commands.set(counter)
+        return counter
+
+    def detach(self):
+        """Stop counting in the current context (for tasks spawned by a request)."""
+        _request_commands.set(None)
+
+    def end_request(self, route: str, counter: Counter) -> int:
+        with self._lock:
+            self._requests[route] += 1
+            self._commands.setdefault(route, Counter()).update(counter)
+        return sum(counter.values())
+
+    def snapshot(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                route: {
+                    "requests": requests,
+                    "commands": sum(self._commands[route].values()),
+                    "per_request": round(sum(self._commands[route].values()) / requests, 2),
+                    "by_command": dict(self._commands[route]),
+                }
+                for route, requests in sorted(self._requests.items())
+            }
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._commands.clear()
+
+
+def route_template(scope: Scope) -> str:
+    """``METHOD /path/{param}`` of the route that handled a request."""
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return f"{scope['method']} {route.path}"
+    return f"{scope['method']} (unmatched)"
+
+
+class CommandStatsMiddleware:
+    def __init__(self, app: ASGIApp, stats: CommandStats):
+        self.app = app
+        self.stats = stats
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        counter = self.stats.begin_request()
+
+        async def send_with_count(message: Message):
+            if message["type"] == "http.response.start":
+                # Counted when the response starts; a streamed body's later commands are not
+                total = self.stats.end_request(route_template(scope), counter)
+                MutableHeaders(scope=message)["X-DB-Commands"] = str(total)
+            await send(message)
+
+        await self.app(scope, receive, send_with_count)
@@ -0,0 +1,125 @@
+"""Colour palette and blur placeholder computed once per uploaded image.
+
+Both work on a copy of the image shrunk to at most ``SAMPLE_SIZE`` pixels a side;
+for JPEGs ``Image.draft`` lets the decoder produce it at reduced scale directly,
+so the full-size bitmap is never built.
+
+* ``palette`` - the dominant colours with their share of the (opaque) pixels,
+  from a weighted k-means over the image's distinct 4-bit-per-channel colours.
+* ``blurhash`` - a `BlurHash <https://blurha.sh>`_ string: a few DCT components
+  packed into ~30 characters that the storefront decodes into a blurred
+  placeholder without fetching anything.
+"""
+import math
+from typing import BinaryIO, List, Tuple
+
+import numpy as np
+from PIL import Image
+
+SAMPLE_SIZE = 64
+PALETTE_SIZE = 5
+BLURHASH_COMPONENTS = (4, 3)
+
+_BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def _base83(value: int, length: int) -> str:
+    return "".join(_BASE83[(value // 83 ** (length - 1 - i)) % 83] for i in range(length))
+
+
+def _srgb_to_linear(values: np.ndarray) -> np.ndarray:
+    values = values / 255.0
+    return np.where(values <= 0.04045, values / 12.92, ((values + 0.055) / 1.055) ** 2.4)
+
+
+def _linear_to_srgb(value: float) -> int:
+    value = min(max(value, 0.0), 1.0)
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash(pixels: np.ndarray, components: Tuple[int, int] = BLURHASH_COMPONENTS) -> str:
+    """BlurHash of an ``(height, width, 3)`` uint8 RGB array."""
+    cx, cy = components
+    height, width, _ = pixels.shape
+    linear = _srgb_to_linear(pixels.astype(np.float64))
+    basis_x = np.cos(np.pi * np.arange(cx)[:, None] * np.arange(width)[None, :] / width)
+    basis_y = np.cos(np.pi * np.arange(cy)[:, None] * np.arange(height)[None, :] / height)
+    # factors[j, i] = mean of basis_y[j] * basis_x[i] * pixel, doubled for the AC terms
+    factors = np.einsum("jy,ix,yxc->jic", basis_y, basis_x, linear) / (width * height)
+    factors[1:, :] *= 2
+    factors[0, 1:] *= 2
+    factors = factors.reshape(-1, 3)
+    dc, ac = factors[0], factors[1:]
+
+    result = _base83((cx - 1) + (cy - 1) * 9, 1)
+    if len(ac):
+        quantised_max = int(max(0, min(82, math.floor(np.abs(ac).max() * 166 - 0.5))))
+        maximum = (quantised_max + 1) / 166
+    else:
+        quantised_max, maximum = 0, 1.0
+    result += _base83(quantised_max, 1)
+    result += _base83((_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2]), 4)
+    scaled = np.sign(ac) * np.abs(ac / maximum) ** 0.5
+    quantised = np.clip(np.floor(scaled * 9 + 9.5), 0, 18).astype(int)
+    for r, g, b in quantised:
+        result += _base83(r * 19 * 19 + g * 19 + b, 2)
+    return result
+
+
+def palette(pixels: np.ndarray, size: int = PALETTE_SIZE, iterations: int = 10) -> List[dict]:
+    """Dominant colours of an ``(n, 3)`` uint8 array as ``{"hex", "share"}``, largest first."""
+    if len(pixels) == 0:
+        return []
+    # Distinct 4-bit colours with their pixel counts: a few hundred points instead of thousands
+    codes = (pixels.astype(np.int64) >> 4) @ np.array([256, 16, 1])
+    unique, inverse, counts = np.unique(codes, return_inverse=True, return_counts=True)
+    sums = np.zeros((len(unique), 3))
+    np.add.at(sums, inverse, pixels)
+    points = sums / counts[:, None]
+    weights = counts.astype(np.float64)
+
+    # Seed with the most common colours, skipping ones close to a seed already taken
+    centers = []
+    for index in np.argsort(-weights):
+        if all(np.abs(points[index] - c).sum() > 48 for c in centers):
+            centers.append(points[index])
+        if len(centers) == size:
+            break
+    centers = np.array(centers)
+    for _ in range(iterations):
+        nearest = np.argmin(((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2), axis=1)
+        mass = np.bincount(nearest, weights=weights, minlength=len(centers))
+        moved = np.stack([np.bincount(nearest, weights=weights * points[:, c], minlength=len(centers))
+                          for c in range(3)], axis=1)
+        keep = mass > 0
+        centers, mass = moved[keep] / mass[keep, None], mass[keep]
+    nearest = np.argmin(((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2), axis=1)
+    mass = np.bincount(nearest, weights=weights, minlength=len(centers))
+    order = np.argsort(-mass)
+    total = weights.sum()
+    return [
+        {"hex": "#{:02x}{:02x}{:02x}".format(*np.clip(np.rint(centers[i]), 0, 255).astype(int)),
+         "share": round(float(mass[i] / total), 3)}
+        for i in order if mass[i] > 0
+    ]
+
+
+def image_features(fileobj: BinaryIO) -> dict:
+    """Palette and BlurHash of an image file; leaves the file position at 0."""
+    fileobj.seek(0)
+    try:
+        img = Image.open(fileobj)
+        img.draft("RGB", (SAMPLE_SIZE, SAMPLE_SIZE))
+        img.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE), Image.Resampling.BILINEAR)
+        rgba = np.asarray(img.convert("RGBA"))
+    finally:
+        fileobj.seek(0)
+    rgb, alpha = rgba[..., :3], rgba[..., 3:].astype(np.float64) / 255
+    # Placeholders are painted on the page background; transparent pixels count as white
+    flattened = (rgb * alpha + 255 * (1 - alpha)).astype(np.uint8)
+    return {
+        "palette": palette(rgb[rgba[..., 3] >= 128]),
+        "blurhash": blurhash(flattened),
+    }
@@ -0,0 +1,290 @@
+"""Static image serving for ``/api/images/{filename}`` on the filesystem backend.
+
+Image requests dominate traffic, so this module avoids per-request filesystem
+work where it can:
+
+* ``ImageFileCache`` keeps ``stat`` results for a short TTL, and those of
+  content-addressed files, which never change, for a longer one. Misses are not
+  kept, so a file or variant written by another worker is served at once.
+  Deletes invalidate the entry in their own worker; other workers notice when
+  opening the file fails, which is checked before any response is started.
+* ``ImageFileResponse`` answers ``If-None-Match``/``If-Modified-Since`` with 304
+  and failed ``If-Match``/``If-Unmodified-Since`` preconditions with 412, serves single ``Range`` requests with 206, and hands the file to the server via
+  the ASGI ``zerocopysend`` (sendfile) or ``pathsend`` extensions when available,
+  falling back to chunked reads in a worker thread.
+"""
+import asyncio
+import os
+import re
+import stat
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from mimetypes import guess_type
+from pathlib import Path
+from typing import Optional, Tuple
+
+from starlette.responses import JSONResponse, Response
+from starlette.types import Receive, Scope, Send
+
+CONTENT_HASH_NAME = re.compile(r"^[0-9a-f]{64}\.[a-z0-9]+$")
+
+# Pre-generated variants, in order of preference, negotiated from the Accept header
+VARIANTS = [("image/avif", ".avif"), ("image/webp", ".webp")]
+
+CHUNK_SIZE = 64 * 1024
+
+
+def safe_filename(filename: str) -> bool:
+    """Reject anything that is not a plain file name inside the upload directory."""
+    return bool(filename) and (
+        filename == os.path.basename(filename)
+        and not filename.startswith(".")
+        and "\\" not in filename
+        and "\x00" not in filename
+    )
+
+
+class CachedImage:
+    __slots__ = ("path", "size", "mtime", "etag", "last_modified", "media_type", "immutable")
+
+    def __init__(self, path: Path, stat_result: os.stat_result):
+        self.path = path
+        self.size = stat_result.st_size
+        self.mtime = int(stat_result.st_mtime)
+        self.immutable = bool(CONTENT_HASH_NAME.match(path.name))
+        if self.immutable:
+            self.etag = f'"{path.name}"'
+        else:
+            self.etag = f'"{self.mtime:x}-{self.size:x}"'
+        self.last_modified = formatdate(self.mtime, usegmt=True)
+        self.media_type = guess_type(path.name)[0] or "application/octet-stream"
+
+
+class ImageFileCache:
+    """LRU cache of successful ``stat`` lookups under one directory."""
+
+    def __init__(self, root: Path, ttl: float = 60.0, immutable_ttl: float = 600.0, max_entries: int = 4096):
+        self.root = Path(root)
+        self.ttl = ttl
+        self.immutable_ttl = immutable_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def _load(self, filename: str) -> Optional[CachedImage]:
+        path = self.root / filename
+        try:
+            stat_result = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not stat.S_ISREG(stat_result.st_mode):
+            return None
+        return CachedImage(path, stat_result)
+
+    async def get(self, filename: str) -> Optional[CachedImage]:
+        now = time.monotonic()
+        cached = self._entries.get(filename)
+        if cached is not None and cached[0] > now:
+            self._entries.move_to_end(filename)
+            return cached[1]
+        entry = await asyncio.to_thread(self._load, filename)
+        if entry is None:
+            self._entries.pop(filename, None)
+            return None
+        # Content-addressed files only change by being deleted, which another
+        # worker may have done: kept longer, but not forever
+        ttl = self.immutable_ttl if entry.immutable else self.ttl
+        self._entries[filename] = (now + ttl, entry)
+        self._entries.move_to_end(filename)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, filename: str):
+        self._entries.pop(filename, None)
+        stem, _ = os.path.splitext(filename)
+        for _, ext in VARIANTS:
+            self._entries.pop(stem + ext, None)
+
+    async def negotiate(self, filename: str, accept: str) -> Tuple[Optional[CachedImage], bool]:
+        """Return the best available representation and whether variants were considered."""
+        stem, ext = os.path.splitext(filename)
+        considered = False
+        if ext.lower() in (".jpg", ".jpeg", ".png"):
+            considered = True
+            for media_type, variant_ext in VARIANTS:
+                if media_type in accept:
+                    variant = await self.get(stem + variant_ext)
+                    if variant is not None:
+                        return variant, considered
+        return await self.get(filename), considered
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range into ``(start, end)`` inclusive.
+
+    Returns ``None`` when the header should be ignored (malformed or multi-range)
+    and raises ``RangeNotSatisfiable`` when it selects no bytes of the file.
+    """
+    units, _, spec = header.partition("=")
+    if units.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_s, sep, end_s = spec.strip().partition("-")
+    if not sep or not (start_s or end_s):
+        return None
+    if not (start_s.isdigit() or start_s == "") or not (end_s.isdigit() or end_s == ""):
+        return None
+    if start_s == "":
+        suffix = int(end_s)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiable()
+        return max(size - suffix, 0), size - 1
+    start = int(start_s)
+    if start >= size:
+        raise RangeNotSatisfiable()
+    end = int(end_s) if end_s else size - 1
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+def _precondition_failed(entry: CachedImage, headers) -> bool:
+    if_match = headers.get("if-match")
+    if if_match is not None:
+        # Strong comparison: a weak tag never matches
+        tags = [tag.strip() for tag in if_match.split(",")]
+        return not ("*" in tags or entry.etag in tags)
+    if_unmodified_since = headers.get("if-unmodified-since")
+    if if_unmodified_since:
+        try:
+            return entry.mtime > int(parsedate_to_datetime(if_unmodified_since).timestamp())
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _not_modified(entry: CachedImage, headers) -> bool:
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or entry.etag in tags
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return entry.mtime <= int(parsedate_to_datetime(if_modified_since).timestamp())
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+class ImageFileResponse(Response):
+    def __init__(self, entry: CachedImage, request_headers, vary_accept: bool = False,
+                 cache: Optional[ImageFileCache] = None):
+        self.entry = entry
+        self.cache = cache
+        self.background = None
+        self.offset = 0
+        self.count = entry.size
+        headers = {
+            "accept-ranges": "bytes",
+            "etag": entry.etag,
+            "last-modified": entry.last_modified,
+            "cache-control": "public, max-age=31536000, immutable" if entry.immutable else "public, max-age=3600",
+        }
+        if vary_accept:
+            headers["vary"] = "Accept"
+
+        if _precondition_failed(entry, request_headers):
+            self.status_code = 412
+            self.count = 0
+            headers["content-length"] = "0"
+        elif _not_modified(entry, request_headers):
+            self.status_code = 304
+            self.count = 0
+        else:
+            self.status_code = 200
+            range_header = request_headers.get("range")
+            if_range = request_headers.get("if-range")
+            if range_header and (if_range is None or if_range in (entry.etag, entry.last_modified)):
+                try:
+                    byte_range = parse_range(range_header, entry.size)
+                except RangeNotSatisfiable:
+                    self.status_code = 416
+                    self.count = 0
+                    headers["content-range"] = f"bytes */{entry.size}"
+                    byte_range = None
+                if byte_range is not None:
+                    start, end = byte_range
+                    self.status_code = 206
+                    self.offset, self.count = start, end - start + 1
+                    headers["content-range"] = f"bytes {start}-{end}/{entry.size}"
+            headers["content-length"] = str(self.count)
+            if self.status_code != 416:
+                headers["content-type"] = entry.media_type
+        self.init_headers(headers)
+
+    def _read_chunks(self, f):
+        f.seek(self.offset)
+        remaining = self.count
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get("extensions") or {}
+        fd = None
+        if scope["method"].upper() != "HEAD" and self.count > 0:
+            # Opened before the response starts, so a file deleted since its stat was
+            # cached still gets a proper 404
+            try:
+                fd = await asyncio.to_thread(os.open, self.entry.path, os.O_RDONLY)
+            except FileNotFoundError:
+                if self.cache is not None:
+                    self.cache.invalidate(self.entry.path.name)
+                await JSONResponse({"detail": "Image not found"}, status_code=404)(scope, receive, send)
+                return
+
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+
+        if fd is None:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif "http.response.zerocopysend" in extensions:
+            try:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": fd,
+                    "offset": self.offset,
+                    "count": self.count,
+                    "more_body": False,
+                })
+            finally:
+                os.close(fd)
+        elif "http.response.pathsend" in extensions and self.status_code == 200:
+            os.close(fd)
+            await send({"type": "http.response.pathsend", "path": str(self.entry.path)})
+        else:
+            f = os.fdopen(fd, "rb")
+            chunks = self._read_chunks(f)
+            sentinel = object()
+            try:
+                chunk = await asyncio.to_thread(next, chunks, sentinel)
+                if chunk is sentinel:
+                    await send({"type": "http.response.body", "body": b"", "more_body": False})
+                while chunk is not sentinel:
+                    following = await asyncio.to_thread(next, chunks, sentinel)
+                    await send({
+                        "type": "http.response.body",
+                        "body": chunk,
+                        "more_body": following is not sentinel,
+                    })
+                    chunk = following
+            finally:
+                chunks.close()
+                f.close()
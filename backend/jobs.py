@@ -0,0 +1,375 @@
+"""In-process background job queue.
+
+Handlers are registered per job type with their own concurrency limit and retry
+policy, and jobs are enqueued by name with a JSON-able payload:
+
+    queue = JobQueue()
+    queue.register("clear_cart", clear_cart_handler, concurrency=4)
+    await queue.start()
+    job_id = await queue.enqueue("clear_cart", {"user_id": user_id})
+
+By default jobs live in memory and are lost if the process dies. Passing a Motor
+collection (``JobQueue(collection=db.jobs)``) makes the queue durable: jobs are
+stored in MongoDB, claimed atomically, and picked up again by any worker process
+if the one running them crashes. A claim is a lease that the running worker
+renews while the handler runs, so only a dead worker's jobs are taken over; a job
+whose last attempt died with its worker is failed rather than started again.
+Finished jobs are kept for ``retention_seconds`` and then removed by a TTL index.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+
+from pymongo import ReturnDocument
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class JobType:
+    def __init__(self, name: str, handler: Callable[[dict], Awaitable], concurrency: int,
+                 max_attempts: int, backoff: float, max_backoff: float, timeout: Optional[float]):
+        self.name = name
+        self.handler = handler
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+
+    def retry_delay(self, attempts: int) -> float:
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.backoff * 2 ** (attempts - 1), self.max_backoff))
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class MemoryJobStore:
+    """Per-type heaps ordered by run time; finished jobs are kept for inspection up to a limit."""
+
+    durable = False
+
+    def __init__(self, keep_finished: int = 1000):
+        self.keep_finished = keep_finished
+        self._ready: Dict[str, list] = {}
+        self._jobs: Dict[str, dict] = {}
+        self._finished = OrderedDict()
+        self._counter = itertools.count()
+
+    async def add(self, job: dict):
+        self._jobs[job["id"]] = job
+        self._push(job)
+
+    def _push(self, job: dict):
+        heapq.heappush(self._ready.setdefault(job["type"], []), (job["run_at"], next(self._counter), job["id"]))
+
+    async def claim(self, job_type: str) -> Optional[dict]:
+        heap = self._ready.get(job_type)
+        if not heap or heap[0][0] > time.time():
+            return None
+        _, _, job_id = heapq.heappop(heap)
+        job = self._jobs[job_id]
+        job.update(status=RUNNING, attempts=job["attempts"] + 1, updated_at=_now_iso())
+        return job
+
+    async def renew(self, job: dict) -> bool:
+        return True
+
+    def next_run_at(self, job_type: str) -> Optional[float]:
+        heap = self._ready.get(job_type)
+        return heap[0][0] if heap else None
+
+    async def retry(self, job: dict, run_at: float, error: str):
+        job.update(status=QUEUED, run_at=run_at, last_error=error, updated_at=_now_iso())
+        self._push(job)
+
+    async def finish(self, job: dict, status: str, error: Optional[str] = None):
+        job.update(status=status, last_error=error, updated_at=_now_iso())
+        self._finished[job["id"]] = job
+        while len(self._finished) > self.keep_finished:
+            old_id, _ = self._finished.popitem(last=False)
+            self._jobs.pop(old_id, None)
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return self._jobs.get(job_id)
+
+    async def counts(self) -> dict:
+        counts = {}
+        for job in self._jobs.values():
+            by_status = counts.setdefault(job["type"], {})
+            by_status[job["status"]] = by_status.get(job["status"], 0) + 1
+        return counts
+
+
+class MongoJobStore:
+    """Jobs in a collection; a claimed job is leased and reclaimable once the lease expires.
+
+    Each claim gets its own lease id. Renewals, retries and results only apply while
+    the lease is still held, so a worker whose job was taken over cannot overwrite
+    the new run's state.
+    """
+
+    durable = True
+
+    def __init__(self, collection, lease_seconds: float = 300, retention_seconds: float = 7 * 24 * 3600):
+        self.collection = collection
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_seconds
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("id", unique=True)
+        await self.collection.create_index([("type", 1), ("status", 1), ("run_at", 1)])
+        # Every checkout adds a job; finished ones expire instead of piling up
+        try:
+            await self.collection.create_index("finished_at", expireAfterSeconds=int(self.retention_seconds))
+        except OperationFailure:
+            # The retention changed since the index was built
+            await self.collection.database.command(
+                "collMod", self.collection.name,
+                index={"keyPattern": {"finished_at": 1}, "expireAfterSeconds": int(self.retention_seconds)},
+            )
+        # Jobs finished before finished_at was recorded start their retention now
+        await self.collection.update_many(
+            {"status": {"$in": [SUCCEEDED, FAILED]}, "finished_at": {"$exists": False}},
+            {"$set": {"finished_at": datetime.now(timezone.utc)}},
+        )
+
+    async def add(self, job: dict):
+        await self.collection.insert_one(dict(job))
+
+    async def claim(self, job_type: str) -> Optional[dict]:
+        now = time.time()
+        return await self.collection.find_one_and_update(
+            {
+                "type": job_type,
+                "$or": [
+                    {"status": QUEUED, "run_at": {"$lte": now}},
+                    # Lease expired: the worker that claimed it died
+                    {"status": RUNNING, "lease_until": {"$lt": now}},
+                ],
+            },
+            {
+                "$set": {
+                    "status": RUNNING,
+                    "lease": uuid.uuid4().hex,
+                    "lease_until": now + self.lease_seconds,
+                    "updated_at": _now_iso(),
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("run_at", 1)],
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def renew(self, job: dict) -> bool:
+        """Extend the lease of a running job; False once another worker has taken it over."""
+        result = await self.collection.update_one(
+            {"id": job["id"], "status": RUNNING, "lease": job["lease"]},
+            {"$set": {"lease_until": time.time() + self.lease_seconds}},
+        )
+        return result.matched_count == 1
+
+    def next_run_at(self, job_type: str) -> Optional[float]:
+        return None
+
+    async def retry(self, job: dict, run_at: float, error: str):
+        await self.collection.update_one(
+            {"id": job["id"], "lease": job["lease"]},
+            {"$set": {"status": QUEUED, "run_at": run_at, "last_error": error, "updated_at": _now_iso()}},
+        )
+
+    async def finish(self, job: dict, status: str, error: Optional[str] = None):
+        await self.collection.update_one(
+            {"id": job["id"], "lease": job["lease"]},
+            # A date, not an ISO string: the TTL index only expires dates
+            {"$set": {"status": status, "last_error": error, "updated_at": _now_iso(),
+                      "finished_at": datetime.now(timezone.utc)}},
+        )
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await self.collection.find_one({"id": job_id}, {"_id": 0})
+
+    async def counts(self) -> dict:
+        counts = {}
+        async for row in self.collection.aggregate([
+            {"$group": {"_id": {"type": "$type", "status": "$status"}, "count": {"$sum": 1}}}
+        ]):
+            counts.setdefault(row["_id"]["type"], {})[row["_id"]["status"]] = row["count"]
+        return counts
+
+
+class JobQueue:
+    def __init__(self, collection=None, poll_interval: float = 1.0, retention_seconds: float = 7 * 24 * 3600):
+        self.store = (MongoJobStore(collection, retention_seconds=retention_seconds)
+                      if collection is not None else MemoryJobStore())
+        self.poll_interval = poll_interval
+        self.types: Dict[str, JobType] = {}
+        self._wakeups: Dict[str, asyncio.Event] = {}
+        self._workers = []
+        self._running = {}
+        self._accepting = False
+        self._draining = False
+
+    def register(self, name: str, handler: Callable[[dict], Awaitable], concurrency: int = 1,
+                 max_attempts: int = 5, backoff: float = 1.0, max_backoff: float = 60.0,
+                 timeout: Optional[float] = None):
+        self.types[name] = JobType(name, handler, concurrency, max_attempts, backoff, max_backoff, timeout)
+
+    def job(self, name: str, **options):
+        """Decorator form of ``register``."""
+        def decorator(handler):
+            self.register(name, handler, **options)
+            return handler
+        return decorator
+
+    async def start(self):
+        if isinstance(self.store, MongoJobStore):
+            await self.store.ensure_indexes()
+        self._accepting = True
+        for job_type in self.types.values():
+            self._wakeups[job_type.name] = asyncio.Event()
+            for n in range(job_type.concurrency):
+                self._workers.append(asyncio.create_task(self._worker(job_type), name=f"job-{job_type.name}-{n}"))
+
+    async def enqueue(self, name: str, payload: dict, delay: float = 0.0) -> str:
+        if name not in self.types:
+            raise ValueError(f"Unknown job type: {name}")
+        if not self._accepting:
+            raise RuntimeError("Job queue is not accepting jobs")
+        job = {
+            "id": str(uuid.uuid4()),
+            "type": name,
+            "payload": payload,
+            "status": QUEUED,
+            "attempts": 0,
+            "run_at": time.time() + delay,
+            "last_error": None,
+            "created_at": _now_iso(),
+            "updated_at": _now_iso(),
+        }
+        await self.store.add(job)
+        self._wakeups[name].set()
+        return job["id"]
+
+    async def _wait_for_work(self, job_type: JobType):
+        wakeup = self._wakeups[job_type.name]
+        timeout = self.poll_interval
+        next_run_at = self.store.next_run_at(job_type.name)
+        if next_run_at is not None:
+            timeout = max(0.0, min(timeout, next_run_at - time.time()))
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        wakeup.clear()
+
+    async def _worker(self, job_type: JobType):
+        while True:
+            if self._draining and self.store.durable:
+                # Queued jobs survive in MongoDB; only finish what is running
+                return
+            job = await self.store.claim(job_type.name)
+            if job is None:
+                if self._draining and self.store.next_run_at(job_type.name) is None:
+                    return
+                await self._wait_for_work(job_type)
+                continue
+            if job["attempts"] > job_type.max_attempts:
+                # Reclaimed after its worker died on the last attempt
+                logger.error("Job %s (%s) failed permanently: lease expired on attempt %d",
+                             job["id"], job_type.name, job["attempts"] - 1)
+                await self.store.finish(job, FAILED, job.get("last_error") or "Lease expired")
+                continue
+            await self._run(job_type, job)
+
+    async def _keep_leased(self, job_type: JobType, job: dict):
+        # Renewed well before expiry, so a slow renewal does not lose the lease
+        interval = self.store.lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await self.store.renew(job):
+                    logger.warning("Job %s (%s) lost its lease and may be running elsewhere",
+                                   job["id"], job_type.name)
+                    return
+            except Exception:
+                logger.exception("Renewing the lease of job %s (%s) failed", job["id"], job_type.name)
+
+    async def _run(self, job_type: JobType, job: dict):
+        task = asyncio.current_task()
+        self._running[job["id"]] = task
+        heartbeat = asyncio.create_task(self._keep_leased(job_type, job)) if self.store.durable else None
+        try:
+            if job_type.timeout:
+                await asyncio.wait_for(job_type.handler(job["payload"]), job_type.timeout)
+            else:
+                await job_type.handler(job["payload"])
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if job["attempts"] < job_type.max_attempts and not self._draining:
+                delay = job_type.retry_delay(job["attempts"])
+                logger.warning("Job %s (%s) failed, retry %d in %.1fs: %s",
+                               job["id"], job_type.name, job["attempts"], delay, error)
+                await self.store.retry(job, time.time() + delay, error)
+            else:
+                logger.error("Job %s (%s) failed permanently: %s", job["id"], job_type.name, error)
+                await self.store.finish(job, FAILED, error)
+        else:
+            await self.store.finish(job, SUCCEEDED)
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+            self._running.pop(job["id"], None)
+
+    async def drain(self, timeout: float = 30.0):
+        """Stop accepting jobs and let workers finish. In-memory mode also runs jobs that are
+        already due; anything still running after ``timeout`` is cancelled."""
+        self._accepting = False
+        self._draining = True
+        for wakeup in self._wakeups.values():
+            wakeup.set()
+        if not self._workers:
+            return
+        done, pending = await asyncio.wait(self._workers, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning("Job queue drain timed out, cancelled %d workers", len(pending))
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._workers = []
+
+    async def status(self, job_id: str) -> Optional[dict]:
+        return await self.store.get(job_id)
+
+    async def stats(self) -> dict:
+        counts = await self.store.counts()
+        return {
+            "durable": self.store.durable,
+            "accepting": self._accepting,
+            "running": len(self._running),
+            "types": {
+                name: {
+                    "concurrency": job_type.concurrency,
+                    "max_attempts": job_type.max_attempts,
+                    "counts": counts.get(name, {}),
+                }
+                for name, job_type in self.types.items()
+            },
+        }
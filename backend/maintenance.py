@@ -0,0 +1,150 @@
+"""Storage maintenance: cart compaction, order archiving (see ``order_partitions``) and
+backfilling the order list summaries.
+
+Each pass walks its collections in ``_id`` order, one batch at a time, and sleeps
+between batches so a run spreads its reads and writes out instead of competing with
+online traffic. They are safe to interrupt and re-run. Each returns a report with the
+number of documents touched and the BSON bytes reclaimed from the hot collections.
+"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import bson
+from pymongo import DeleteOne, ReplaceOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from order_partitions import month_start, order_summary
+
+DUPLICATE_KEY = 11000
+
+
+class Throttle:
+    """Pause after every batch, long enough to keep a pass to a fraction of the database's time."""
+
+    def __init__(self, pause: float = 0.1, duty_cycle: float = 0.5):
+        self.pause = pause
+        self.duty_cycle = duty_cycle
+
+    async def wait(self, batch_seconds: float):
+        # With duty_cycle 0.5 the pass idles at least as long as it worked
+        idle = batch_seconds * (1 - self.duty_cycle) / self.duty_cycle
+        await asyncio.sleep(max(self.pause, idle))
+
+
+def bson_size(doc: dict) -> int:
+    return len(bson.encode(doc))
+
+
+async def _batches(collection, query: dict, batch_size: int, projection: Optional[dict] = None):
+    last_id = None
+    while True:
+        batch_query = dict(query)
+        if last_id is not None:
+            batch_query["_id"] = {"$gt": last_id}
+        batch = await collection.find(batch_query, projection).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not batch:
+            return
+        last_id = batch[-1]["_id"]
+        yield batch
+
+
+def compact_items(items: list, max_lines: int) -> list:
+    """Merge lines for the same product, size and color and keep the newest ``max_lines``."""
+    merged = {}
+    for item in items:
+        key = (item.get("product_id"), item.get("size"), item.get("color"))
+        if key in merged:
+            previous = merged.pop(key)
+            # Re-inserting moves the line to the end, where the latest additions are
+            item = {**item, "quantity": previous.get("quantity", 0) + item.get("quantity", 0)}
+        merged[key] = item
+    return list(merged.values())[-max_lines:]
+
+
+async def compact_carts(carts, stale_days: int = 90, max_lines: int = 50,
+                        batch_size: int = 200, throttle: Optional[Throttle] = None) -> dict:
+    """Delete empty and stale carts and rewrite carts with duplicate or excess lines."""
+    throttle = throttle or Throttle()
+    stale_before = (datetime.now(timezone.utc) - timedelta(days=stale_days)).isoformat()
+    report = {"scanned": 0, "deleted": 0, "compacted": 0, "bytes_reclaimed": 0}
+    loop = asyncio.get_running_loop()
+
+    async for batch in _batches(carts, {}, batch_size):
+        started = loop.time()
+        ops = []
+        for cart in batch:
+            report["scanned"] += 1
+            items = cart.get("items") or []
+            size = bson_size(cart)
+            # Match the version we read, so a concurrent cart write wins over compaction
+            guard = {"_id": cart["_id"], "updated_at": cart.get("updated_at")}
+            if not items or (cart.get("updated_at") or "") < stale_before:
+                ops.append(DeleteOne(guard))
+                report["deleted"] += 1
+                report["bytes_reclaimed"] += size
+                continue
+            compacted = compact_items(items, max_lines)
+            if len(compacted) != len(items):
+                replacement = {**cart, "items": compacted}
+                ops.append(ReplaceOne(guard, replacement))
+                report["compacted"] += 1
+                report["bytes_reclaimed"] += size - bson_size(replacement)
+        if ops:
+            await carts.bulk_write(ops, ordered=False)
+        await throttle.wait(loop.time() - started)
+    return report
+
+
+async def archive_orders(orders, partitions, older_than_days: int = 365, statuses=("delivered",),
+                         batch_size: int = 200, throttle: Optional[Throttle] = None) -> dict:
+    """Move finished orders older than ``older_than_days`` into their monthly archive partition."""
+    throttle = throttle or Throttle()
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).isoformat()
+    query = {"created_at": {"$lt": cutoff}, "status": {"$in": list(statuses)}}
+    report = {"archived": 0, "bytes_reclaimed": 0}
+    loop = asyncio.get_running_loop()
+
+    async for batch in _batches(orders, query, batch_size):
+        started = loop.time()
+        by_month = {}
+        for order in batch:
+            by_month.setdefault(month_start(order["created_at"]), []).append(order)
+        for month_orders in by_month.values():
+            archive = await partitions.partition_for(month_orders[0]["created_at"])
+            inserted = month_orders
+            try:
+                await archive.insert_many(month_orders, ordered=False)
+            except BulkWriteError as e:
+                # Copied by an interrupted earlier run; anything else is a real failure
+                if any(error["code"] != DUPLICATE_KEY for error in e.details["writeErrors"]):
+                    raise
+                copied = {error["index"] for error in e.details["writeErrors"]}
+                inserted = [order for i, order in enumerate(month_orders) if i not in copied]
+            await partitions.add_totals(archive.name, inserted)
+        # Delete only after the copy is durable, by _id, still matching the query
+        await orders.delete_many({**query, "_id": {"$in": [order["_id"] for order in batch]}})
+        report["archived"] += len(batch)
+        report["bytes_reclaimed"] += sum(bson_size(order) for order in batch)
+        await throttle.wait(loop.time() - started)
+    return report
+
+
+async def summarize_orders(collections, batch_size: int = 200, throttle: Optional[Throttle] = None) -> dict:
+    """Store the list summary on orders created before orders carried one."""
+    throttle = throttle or Throttle()
+    report = {"summarized": 0}
+    loop = asyncio.get_running_loop()
+
+    for collection in collections:
+        query = {"item_count": {"$exists": False}}
+        async for batch in _batches(collection, query, batch_size, {"_id": 1, "items": 1}):
+            started = loop.time()
+            await collection.bulk_write(
+                [UpdateOne({"_id": order["_id"]}, {"$set": order_summary(order.get("items") or [])})
+                 for order in batch],
+                ordered=False
+            )
+            report["summarized"] += len(batch)
+            await throttle.wait(loop.time() - started)
+    return report
@@ -0,0 +1,165 @@
+"""Order status events for the ``/api/orders/stream`` server-sent events endpoints.
+
+``OrderEventBroker`` fans order updates out to per-user subscriptions and to admin
+subscriptions that see every order. Updates come from a MongoDB change stream on the
+orders collection when the deployment supports one (replica sets and sharded
+clusters), so every API process sees writes made by any other. On a standalone
+server the stream cannot be opened and the broker falls back to publishing the
+updates ``update_order_status`` hands it, which only reaches clients connected to
+the same process.
+
+Each subscription has a bounded queue. A client that stops reading does not hold
+memory or slow the publisher down: when its queue fills up, pending events are
+dropped and the client receives a single ``resync`` event telling it to reload.
+"""
+import asyncio
+import json
+import logging
+from collections import deque
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Fields of an order document that are pushed to clients
+EVENT_FIELDS = ("id", "user_id", "status", "payment_status")
+
+RESYNC = {"event": "resync", "data": {}}
+
+
+class Subscription:
+    def __init__(self, user_id: Optional[str], max_queue: int):
+        self.user_id = user_id
+        self.max_queue = max_queue
+        self._events = deque()
+        self._ready = asyncio.Event()
+        self._lagged = False
+
+    def push(self, event: dict):
+        if self._lagged:
+            return
+        if len(self._events) >= self.max_queue:
+            # Slow consumer: drop the backlog and ask the client to reload instead
+            self._events.clear()
+            self._lagged = True
+        else:
+            self._events.append(event)
+        self._ready.set()
+
+    async def get(self, timeout: float) -> Optional[dict]:
+        """Next event, or ``None`` if nothing arrived within ``timeout`` seconds."""
+        if not self._events and not self._lagged:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        if self._lagged:
+            self._lagged = False
+            return RESYNC
+        return self._events.popleft()
+
+
+class OrderEventBroker:
+    def __init__(self, collection, max_queue: int = 100, retry_seconds: float = 30.0):
+        self.collection = collection
+        self.max_queue = max_queue
+        self.retry_seconds = retry_seconds
+        self.change_stream_active = False
+        self._by_user: Dict[str, Set[Subscription]] = {}
+        self._admins: Set[Subscription] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def subscribe(self, user_id: Optional[str]) -> Subscription:
+        """Subscribe to one user's orders, or to all orders when ``user_id`` is ``None``."""
+        subscription = Subscription(user_id, self.max_queue)
+        if user_id is None:
+            self._admins.add(subscription)
+        else:
+            self._by_user.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        if subscription.user_id is None:
+            self._admins.discard(subscription)
+            return
+        subscriptions = self._by_user.get(subscription.user_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._by_user[subscription.user_id]
+
+    def subscriber_count(self) -> int:
+        return len(self._admins) + sum(len(s) for s in self._by_user.values())
+
+    def _publish(self, order: dict):
+        event = {"event": "order_status", "data": {k: order.get(k) for k in EVENT_FIELDS}}
+        for subscription in self._by_user.get(order.get("user_id"), ()):
+            subscription.push(event)
+        for subscription in self._admins:
+            subscription.push(event)
+
+    def _resync_all(self):
+        for subscription in self._admins:
+            subscription.push(RESYNC)
+        for subscriptions in self._by_user.values():
+            for subscription in subscriptions:
+                subscription.push(RESYNC)
+
+    def order_updated(self, order: dict):
+        """Called by the writer; a no-op while the change stream is delivering updates."""
+        if not self.change_stream_active:
+            self._publish(order)
+
+    def start(self):
+        self._task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _watch(self):
+        # Only writes that change what an event carries; summary backfills and archive
+        # markers would otherwise reach every subscriber and cost a document lookup each
+        pipeline = [{"$match": {"$or": [
+            {"operationType": "replace"},
+            {"operationType": "update", "$or": [
+                {f"updateDescription.updatedFields.{field}": {"$exists": True}}
+                for field in ("status", "payment_status")
+            ]},
+        ]}}]
+        resume_token = None
+        # Reported once per outage; a standalone server never has change streams
+        reported = False
+        while True:
+            try:
+                async with self.collection.watch(
+                    pipeline, full_document="updateLookup", resume_after=resume_token
+                ) as stream:
+                    if not self.change_stream_active:
+                        logger.info("Order events: using MongoDB change stream")
+                    self.change_stream_active = True
+                    reported = False
+                    async for change in stream:
+                        resume_token = stream.resume_token
+                        if change.get("fullDocument"):
+                            self._publish(change["fullDocument"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.change_stream_active:
+                    # Updates may have been missed while the stream was down
+                    self._resync_all()
+                if not reported:
+                    logger.info("Order events: change streams unavailable (%s), publishing in-process", e)
+                    reported = True
+                else:
+                    logger.debug("Order events: change streams still unavailable (%s)", e)
+                self.change_stream_active = False
+                resume_token = None
+            await asyncio.sleep(self.retry_seconds)
+
+
+def format_sse(event: dict) -> str:
+    return f"event: {event['event']}\ndata: {json.dumps(event['data'])}\n\n"
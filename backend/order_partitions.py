@@ -0,0 +1,146 @@
+"""Monthly archive partitions for orders.
+
+New and in-progress orders live in the hot ``orders`` collection. The maintenance
+job moves finished orders past the archive age into one collection per month of
+``created_at`` (``orders_archive_2024_05``), and ``order_partitions`` lists which
+of those exist.
+
+``OrderPartitions.find`` answers order-history queries newest first: it reads the
+hot collection, then only the monthly partitions inside the requested date range,
+newest to oldest, and stops as soon as the remaining months cannot contain anything
+newer than what it already has. A "recent orders" page therefore reads the hot
+collection and at most a partition or two however many years are archived.
+
+Order lists only need a few fields per order, so every order also stores a
+denormalized summary (``order_summary``) and list reads project to it, leaving the
+``items`` array for the single-order read, ``get``.
+"""
+import heapq
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+
+def month_start(created_at: str) -> datetime:
+    moment = datetime.fromisoformat(created_at).astimezone(timezone.utc)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(start: datetime) -> datetime:
+    return start.replace(year=start.year + start.month // 12, month=start.month % 12 + 1)
+
+
+def partition_name(start: datetime) -> str:
+    return f"orders_archive_{start.year:04d}_{start.month:02d}"
+
+
+def date_range_query(since: Optional[str], until: Optional[str]) -> dict:
+    bounds = {}
+    if since:
+        bounds["$gte"] = since
+    if until:
+        bounds["$lt"] = until
+    return {"created_at": bounds} if bounds else {}
+
+
+def order_summary(items: List[dict]) -> dict:
+    """List-view fields stored on each order: line and unit counts and the first item."""
+    first = items[0] if items else {}
+    return {
+        "item_count": len(items),
+        "quantity": sum(item.get("quantity", 0) for item in items),
+        "first_item_name": first.get("product_name"),
+        "first_item_image": first.get("image"),
+    }
+
+
+class OrderPartitions:
+    def __init__(self, db, registry_ttl: float = 60.0):
+        self.db = db
+        self.registry_ttl = registry_ttl
+        self._registry: Optional[List[dict]] = None
+        self._loaded_at = 0.0
+
+    async def partitions(self) -> List[dict]:
+        """Known partitions, newest first; cached since they only change during archiving."""
+        if self._registry is None or time.monotonic() - self._loaded_at > self.registry_ttl:
+            self._registry = await self.db.order_partitions.find({}).sort("start", -1).to_list(None)
+            self._loaded_at = time.monotonic()
+        return self._registry
+
+    async def partition_for(self, created_at: str):
+        """Archive collection for an order, registered (with its indexes) on first use."""
+        start = month_start(created_at)
+        name = partition_name(start)
+        result = await self.db.order_partitions.update_one(
+            {"_id": name},
+            {"$setOnInsert": {"start": start.isoformat(), "end": next_month(start).isoformat()}},
+            upsert=True,
+        )
+        collection = self.db[name]
+        if result.upserted_id is not None:
+            await collection.create_index("id", unique=True)
+            await collection.create_index([("user_id", 1), ("created_at", -1)])
+            await collection.create_index([("created_at", -1)])
+            self._registry = None
+        return collection
+
+    async def add_totals(self, name: str, orders: List[dict]):
+        """Count newly archived orders so summaries need not scan the partitions."""
+        inc = {"orders": len(orders), "revenue": sum(order.get("total_amount") or 0 for order in orders)}
+        for order in orders:
+            key = f"by_status.{order.get('status') or 'unknown'}"
+            inc[key] = inc.get(key, 0) + 1
+        await self.db.order_partitions.update_one({"_id": name}, {"$inc": inc})
+        self._registry = None
+
+    async def totals(self) -> dict:
+        totals = {"orders": 0, "revenue": 0.0, "by_status": {}}
+        for partition in await self.partitions():
+            totals["orders"] += partition.get("orders", 0)
+            totals["revenue"] += partition.get("revenue", 0)
+            for status, count in partition.get("by_status", {}).items():
+                totals["by_status"][status] = totals["by_status"].get(status, 0) + count
+        return totals
+
+    async def find(self, query: dict, since: Optional[str] = None, until: Optional[str] = None,
+                   limit: int = 100, projection: Optional[dict] = None) -> List[dict]:
+        """Orders matching ``query`` created in ``[since, until)``, newest first."""
+        query = {**query, **date_range_query(since, until)}
+        projection = projection or {"_id": 0}
+
+        async def read(collection) -> List[dict]:
+            cursor = collection.find(query, projection).sort("created_at", -1).limit(limit)
+            return await cursor.to_list(limit)
+
+        results = await read(self.db.orders)
+        for partition in await self.partitions():
+            if since and partition["end"] <= since:
+                break
+            if until and partition["start"] >= until:
+                continue
+            if len(results) >= limit and results[-1]["created_at"] >= partition["end"]:
+                # This month and every older one only hold older orders
+                break
+            older = await read(self.db[partition["_id"]])
+            results = list(heapq.merge(results, older, key=lambda order: order["created_at"], reverse=True))[:limit]
+        return results
+
+    async def get(self, query: dict, created_at: Optional[str] = None) -> Optional[dict]:
+        """One order, from the hot collection or its archive partition.
+
+        With the order's ``created_at`` only that month's partition is read; without it
+        the partitions are tried newest first.
+        """
+        order = await self.db.orders.find_one(query, {"_id": 0})
+        if order is not None:
+            return order
+        names = [partition["_id"] for partition in await self.partitions()]
+        if created_at:
+            name = partition_name(month_start(created_at))
+            names = [name] if name in names else []
+        for name in names:
+            order = await self.db[name].find_one(query, {"_id": 0})
+            if order is not None:
+                return order
+        return None
@@ -0,0 +1,74 @@
+"""Running order totals for the admin dashboard.
+
+A single counter document holds the number of orders, their revenue and the count
+per status. Checkout adds to it and status changes move a count from one status to
+another, so the dashboard reads one document however many orders there are. Every
+order is counted once, whether it sits in the hot collection or an archive
+partition, so archiving leaves the totals alone.
+
+A process that dies between an order write and its counter update, or two status
+changes of the same order racing each other, leave the counts slightly off.
+``rebuild`` recounts from the orders (the hot collection plus the totals archiving
+keeps per partition); the maintenance job runs it, and the dashboard does when the
+counters do not exist yet. The write path never creates the counter document, so
+one that is missing (a fresh deployment, or reseeded orders) holds no partial
+count and is rebuilt on the next read.
+"""
+from collections import Counter
+from typing import Iterable, Optional, Tuple
+
+COUNTER_ID = "orders"
+
+
+def _status(status: Optional[str]) -> str:
+    return status or "unknown"
+
+
+class OrderTotals:
+    def __init__(self, counters, orders, partitions):
+        self.counters = counters
+        self.orders = orders
+        self.partitions = partitions
+
+    async def order_created(self, order: dict):
+        await self.counters.update_one(
+            {"_id": COUNTER_ID},
+            {"$inc": {
+                "orders": 1,
+                "revenue": order.get("total_amount") or 0,
+                f"by_status.{_status(order.get('status'))}": 1,
+            }},
+        )
+
+    async def statuses_changed(self, changes: Iterable[Tuple[Optional[str], Optional[str]]]):
+        """Move counts for ``(previous, new)`` status pairs; no write if none changed."""
+        delta = Counter()
+        for previous, new in changes:
+            if _status(previous) != _status(new):
+                delta[_status(previous)] -= 1
+                delta[_status(new)] += 1
+        inc = {f"by_status.{status}": n for status, n in delta.items() if n}
+        if inc:
+            await self.counters.update_one({"_id": COUNTER_ID}, {"$inc": inc})
+
+    async def reset(self):
+        """Drop the counters so the next read recounts, e.g. after orders are replaced in bulk."""
+        await self.counters.delete_one({"_id": COUNTER_ID})
+
+    async def get(self) -> Optional[dict]:
+        return await self.counters.find_one({"_id": COUNTER_ID}, {"_id": 0})
+
+    async def rebuild(self) -> dict:
+        """Recount every order; the one pass over the hot collection the counters otherwise avoid."""
+        archived = await self.partitions.totals()
+        totals = {"orders": archived["orders"], "revenue": archived["revenue"], "by_status": dict(archived["by_status"])}
+        async for row in self.orders.aggregate([
+            {"$group": {"_id": "$status", "count": {"$sum": 1}, "revenue": {"$sum": "$total_amount"}}}
+        ]):
+            status = _status(row["_id"])
+            totals["orders"] += row["count"]
+            totals["revenue"] += row["revenue"] or 0
+            totals["by_status"][status] = totals["by_status"].get(status, 0) + row["count"]
+        totals["by_status"] = {status: count for status, count in totals["by_status"].items() if count}
+        await self.counters.replace_one({"_id": COUNTER_ID}, totals, upsert=True)
+        return totals
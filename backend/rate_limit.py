@@ -0,0 +1,149 @@
+"""Rate limiting and admission control for expensive routes.
+
+Two kinds of FastAPI dependencies are attached to individual routes:
+
+* ``limiter.limit(name, rate, burst)`` - a token bucket per client and route budget.
+  A client is the ``user_id`` of a valid ``token`` query parameter, or the remote IP
+  for anonymous requests. Exhausted buckets get ``429`` with ``Retry-After``.
+* ``limiter.concurrency(name, limit)`` - caps how many requests of one kind run at
+  once in this process. Requests that cannot get a slot within ``wait`` seconds get
+  ``503`` with ``Retry-After`` instead of queueing behind the others.
+
+Buckets live in memory by default, which limits each API process separately. The
+Mongo store shares them between processes (``RATE_LIMIT_STORE=mongo``).
+"""
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional
+
+from fastapi import HTTPException, Request
+from pymongo import ReturnDocument
+
+
+class MemoryBucketStore:
+    """Buckets in a bounded LRU; an evicted bucket simply starts full again."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> float:
+        """Spend ``cost`` tokens; returns 0 if allowed, else seconds until it would be."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+        retry_after = 0.0
+        if tokens >= cost:
+            tokens -= cost
+        else:
+            retry_after = (cost - tokens) / rate
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class MongoBucketStore:
+    """Buckets shared by all API processes, refilled and spent in one atomic update."""
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("expires_at", expireAfterSeconds=0)
+
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> float:
+        now = time.time()
+        refilled = {"$min": [burst, {"$add": [
+            {"$ifNull": ["$tokens", burst]},
+            {"$multiply": [{"$subtract": [now, {"$ifNull": ["$updated", now]}]}, rate]},
+        ]}]}
+        allowed = {"$gte": ["$tokens", cost]}
+        bucket = await self.collection.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {
+                    "tokens": refilled,
+                    "updated": now,
+                    # A bucket idle long enough to refill completely can be dropped
+                    "expires_at": datetime.now(timezone.utc) + timedelta(seconds=burst / rate),
+                }},
+                {"$set": {
+                    "allowed": allowed,
+                    "tokens": {"$cond": [allowed, {"$subtract": ["$tokens", cost]}, "$tokens"]},
+                }},
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        if bucket["allowed"]:
+            return 0.0
+        return (cost - bucket["tokens"]) / rate
+
+
+class RateLimiter:
+    def __init__(self, store, identify: Callable[[str], Optional[str]],
+                 trust_forwarded_for: bool = False, enabled: bool = True):
+        self.store = store
+        self.identify = identify
+        self.trust_forwarded_for = trust_forwarded_for
+        self.enabled = enabled
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def client_ip(self, request: Request) -> str:
+        if self.trust_forwarded_for:
+            forwarded = request.headers.get("x-forwarded-for")
+            if forwarded:
+                return forwarded.split(",")[0].strip()
+        return request.client.host if request.client else "unknown"
+
+    def client_key(self, request: Request) -> str:
+        token = request.query_params.get("token")
+        user_id = self.identify(token) if token else None
+        return f"user:{user_id}" if user_id else f"ip:{self.client_ip(request)}"
+
+    def _reject(self, status_code: int, detail: str, retry_after: float):
+        raise HTTPException(
+            status_code=status_code,
+            detail=detail,
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    def limit(self, name: str, rate: float, burst: float,
+              when: Optional[Callable[[Request], bool]] = None, by_ip: bool = False):
+        """Dependency spending one token from the client's ``name`` bucket.
+
+        ``rate`` is tokens per second, ``burst`` the bucket size. ``when`` restricts the
+        limit to matching requests; ``by_ip`` ignores the token (e.g. for login).
+        """
+        async def dependency(request: Request):
+            if not self.enabled or (when is not None and not when(request)):
+                return
+            key = f"ip:{self.client_ip(request)}" if by_ip else self.client_key(request)
+            retry_after = await self.store.take(f"{name}:{key}", rate, burst)
+            if retry_after > 0:
+                self._reject(429, "Too many requests", retry_after)
+        return dependency
+
+    def concurrency(self, name: str, limit: int, wait: float = 0.5,
+                    when: Optional[Callable[[Request], bool]] = None):
+        """Dependency holding one of ``limit`` slots for the duration of the request."""
+        semaphore = self._semaphores.setdefault(name, asyncio.Semaphore(limit))
+
+        async def dependency(request: Request):
+            if not self.enabled or (when is not None and not when(request)):
+                yield
+                return
+            try:
+                await asyncio.wait_for(semaphore.acquire(), wait)
+            except asyncio.TimeoutError:
+                self._reject(503, "Server busy, try again shortly", 1)
+            try:
+                yield
+            finally:
+                semaphore.release()
+        return dependency
@@ -0,0 +1,164 @@
+""""Customers also bought" from order co-occurrence.
+
+``CoOccurrenceModel`` counts, for every pair of products, how many orders
+contained both, plus how many orders contained each product. Pair counts are kept
+as a sorted ``int64`` array of pair keys (``i << 32 | j`` for product slots
+``i < j``) with a parallel count array - a sparse upper-triangular matrix that
+merging a new batch of orders only needs ``np.unique`` and ``np.bincount`` for.
+
+Each refresh reads only the orders created since the previous one, folds them in,
+and recomputes the top-K neighbours of every product by cosine similarity
+``count(i, j) / sqrt(count(i) * count(j))``. Products with fewer than K neighbours
+(new or rarely bought ones) are topped up with the same category's products
+nearest in price, within ``price_band``. The result is a plain dict of product id to
+related ids, so serving it is a lookup.
+
+The model lives in each API process and is rebuilt from the hot orders collection
+on start; orders already archived do not contribute.
+"""
+import asyncio
+import bisect
+from datetime import datetime, timedelta
+from itertools import combinations
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class CoOccurrenceModel:
+    def __init__(self, top_k: int = 8, min_support: int = 1, price_band: float = 0.3,
+                 overlap_seconds: float = 300):
+        self.top_k = top_k
+        self.min_support = min_support
+        self.price_band = price_band
+        # Orders are read again this far behind the watermark, in case an earlier
+        # created_at committed late; ids already counted are skipped
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.slots: Dict[str, int] = {}
+        self.ids: List[str] = []
+        self.item_counts = np.zeros(0, dtype=np.int64)
+        self.pair_keys = np.zeros(0, dtype=np.int64)
+        self.pair_counts = np.zeros(0, dtype=np.int64)
+        self.watermark: Optional[str] = None
+        self._recent: Dict[str, str] = {}
+        self.related: Dict[str, List[str]] = {}
+        self.orders_counted = 0
+        self._lock = asyncio.Lock()
+
+    def _slot(self, product_id: str) -> int:
+        slot = self.slots.get(product_id)
+        if slot is None:
+            slot = self.slots[product_id] = len(self.ids)
+            self.ids.append(product_id)
+        return slot
+
+    def add_orders(self, baskets: List[List[str]]):
+        """Count a batch of orders, each given as the product ids it contains."""
+        singles, pairs = [], []
+        for basket in baskets:
+            slots = sorted({self._slot(p) for p in basket})
+            singles.extend(slots)
+            # Baskets are small (carts are capped), so plain loops beat per-order numpy calls
+            pairs.extend((a << 32) | b for a, b in combinations(slots, 2))
+        if len(self.item_counts) < len(self.ids):
+            self.item_counts = np.concatenate(
+                [self.item_counts, np.zeros(len(self.ids) - len(self.item_counts), dtype=np.int64)]
+            )
+        if singles:
+            np.add.at(self.item_counts, np.array(singles, dtype=np.int64), 1)
+        if pairs:
+            keys = np.concatenate([self.pair_keys, np.array(pairs, dtype=np.int64)])
+            weights = np.concatenate([self.pair_counts, np.ones(len(pairs), dtype=np.int64)])
+            self.pair_keys, inverse = np.unique(keys, return_inverse=True)
+            self.pair_counts = np.bincount(inverse, weights=weights).astype(np.int64)
+        self.orders_counted += len(baskets)
+
+    def neighbours(self, products: List[dict]) -> Dict[str, List[str]]:
+        """Top-K related ids for every product in ``products`` (id, category, price)."""
+        alive = np.zeros(len(self.ids), dtype=bool)
+        for product in products:
+            slot = self.slots.get(product["id"])
+            if slot is not None:
+                alive[slot] = True
+
+        keep = self.pair_counts >= self.min_support
+        i = self.pair_keys[keep] >> 32
+        j = self.pair_keys[keep] & 0xFFFFFFFF
+        scores = self.pair_counts[keep] / np.sqrt(self.item_counts[i] * self.item_counts[j])
+        # Both directions of each pair, restricted to products still in the catalog
+        rows, cols, scores = np.concatenate([i, j]), np.concatenate([j, i]), np.concatenate([scores, scores])
+        live = alive[cols]
+        rows, cols, scores = rows[live], cols[live], scores[live]
+        order = np.lexsort((cols, -scores, rows))
+        rows, cols = rows[order], cols[order]
+        starts = np.flatnonzero(np.r_[True, rows[1:] != rows[:-1]]) if len(rows) else np.zeros(0, dtype=np.int64)
+        related = {}
+        for start, end in zip(starts, np.r_[starts[1:], len(rows)].astype(np.int64)):
+            related[self.ids[rows[start]]] = [self.ids[c] for c in cols[start:min(end, start + self.top_k)]]
+
+        by_category: Dict[str, list] = {}
+        for product in products:
+            by_category.setdefault(product.get("category"), []).append((product["price"], product["id"]))
+        for members in by_category.values():
+            members.sort()
+        for product in products:
+            picks = related.setdefault(product["id"], [])
+            if len(picks) < self.top_k:
+                self._fill_by_price(product, by_category[product.get("category")], picks)
+        return related
+
+    def _fill_by_price(self, product: dict, members: list, picks: List[str]):
+        price, taken = product["price"], set(picks) | {product["id"]}
+        band = abs(price) * self.price_band
+        right = bisect.bisect_left(members, (price, product["id"]))
+        left = right - 1
+        while len(picks) < self.top_k:
+            # Step to whichever side is nearer in price
+            candidates = []
+            if left >= 0 and price - members[left][0] <= band:
+                candidates.append((price - members[left][0], left, -1))
+            if right < len(members) and members[right][0] - price <= band:
+                candidates.append((members[right][0] - price, right, 1))
+            if not candidates:
+                return
+            _, index, step = min(candidates)
+            if members[index][1] not in taken:
+                picks.append(members[index][1])
+                taken.add(members[index][1])
+            if step < 0:
+                left -= 1
+            else:
+                right += 1
+
+    async def refresh(self, orders, products) -> dict:
+        """Fold in orders created since the last refresh and recompute the neighbours."""
+        async with self._lock:
+            query = {}
+            if self.watermark is not None:
+                since = datetime.fromisoformat(self.watermark) - self.overlap
+                query["created_at"] = {"$gt": since.isoformat()}
+            baskets = []
+            cursor = orders.find(query, {"_id": 0, "id": 1, "created_at": 1, "items.product_id": 1})
+            async for order in cursor.sort("created_at", 1):
+                if order["id"] in self._recent:
+                    continue
+                self._recent[order["id"]] = order["created_at"]
+                baskets.append([item["product_id"] for item in order.get("items", [])])
+                if self.watermark is None or order["created_at"] > self.watermark:
+                    self.watermark = order["created_at"]
+            if self.watermark is not None:
+                horizon = (datetime.fromisoformat(self.watermark) - self.overlap).isoformat()
+                self._recent = {k: v for k, v in self._recent.items() if v > horizon}
+
+            catalog = await products.find({}, {"_id": 0, "id": 1, "category": 1, "price": 1}).to_list(None)
+
+            def rebuild():
+                self.add_orders(baskets)
+                return self.neighbours(catalog)
+
+            self.related = await asyncio.to_thread(rebuild)
+            return {"orders_added": len(baskets), "orders_counted": self.orders_counted,
+                    "pairs": int(len(self.pair_keys)), "products": len(self.related)}
+
+    def get(self, product_id: str) -> Optional[List[str]]:
+        return self.related.get(product_id)
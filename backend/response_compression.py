@@ -0,0 +1,256 @@
+"""Negotiated response compression (zstd, brotli, gzip).
+
+``CompressionMiddleware`` compresses JSON and text responses on the fly, using fast
+levels because the work is repeated for every request. Responses that are cached
+server-side instead hold a ``CompressedPayload``: each encoding is produced once,
+at a high level, when the cache entry is built and then served as-is.
+
+brotli and zstd need the ``brotli`` and ``zstandard`` packages; without them only
+gzip is offered.
+"""
+import asyncio
+import gzip
+import zlib
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+# Responses smaller than this are not worth the CPU and the extra header bytes
+MINIMUM_SIZE = 1024
+
+# Per-request compression favours speed; cached payloads are compressed once, so
+# they can afford the best ratio
+DYNAMIC_LEVELS = {"zstd": 3, "br": 4, "gzip": 6}
+CACHED_LEVELS = {"zstd": 19, "br": 11, "gzip": 9}
+
+
+def available_encodings() -> List[str]:
+    """Supported encodings in server preference order."""
+    encodings = []
+    if zstandard is not None:
+        encodings.append("zstd")
+    if brotli is not None:
+        encodings.append("br")
+    encodings.append("gzip")
+    return encodings
+
+
+ENCODINGS = available_encodings()
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the encoding with the highest q-value, ties going to server preference."""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+    best, best_q = None, 0.0
+    for encoding in ENCODINGS:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == "br":
+        return brotli.compress(data, quality=level)
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str, level: int):
+        if encoding == "gzip":
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+            self.compress, self._finish = self._obj.compress, self._obj.flush
+        elif encoding == "br":
+            self._obj = brotli.Compressor(quality=level)
+            self.compress, self._finish = self._obj.process, self._obj.finish
+        else:
+            self._obj = zstandard.ZstdCompressor(level=level).compressobj()
+            self.compress, self._finish = self._obj.compress, self._obj.flush
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+def is_compressible(headers: Headers) -> bool:
+    content_type = headers.get("content-type", "")
+    return (
+        content_type.startswith(COMPRESSIBLE_TYPES)
+        # Compressors buffer output, which would delay server-sent events
+        and not content_type.startswith("text/event-stream")
+        and "content-encoding" not in headers
+        and "content-range" not in headers
+    )
+
+
+def encoded_etag(etag: Optional[str], encoding: Optional[str]) -> Optional[str]:
+    """Each representation needs its own strong validator; weak ones already allow any encoding."""
+    if etag is None or encoding is None or etag.startswith("W/"):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def set_content_encoding(headers: MutableHeaders, encoding: str):
+    headers["Content-Encoding"] = encoding
+    if "etag" in headers:
+        headers["ETag"] = encoded_etag(headers["etag"], encoding)
+
+
+def add_vary(headers: MutableHeaders):
+    vary = headers.get("vary")
+    if not vary:
+        headers["Vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding"
+
+
+class CompressedPayload:
+    """A cached response body together with its compressed encodings."""
+
+    def __init__(self, body: bytes, media_type: str = "application/json", etag: Optional[str] = None):
+        self.body = body
+        self.media_type = media_type
+        self.etag = etag
+        self.encoded: Dict[str, bytes] = {}
+
+    def _compress_all(self):
+        if len(self.body) < MINIMUM_SIZE:
+            return
+        for encoding in ENCODINGS:
+            if encoding not in self.encoded:
+                self.encoded[encoding] = compress(self.body, encoding, CACHED_LEVELS[encoding])
+
+    async def precompress(self) -> "CompressedPayload":
+        await asyncio.to_thread(self._compress_all)
+        return self
+
+    def _etag_for(self, encoding: Optional[str]) -> Optional[str]:
+        return encoded_etag(self.etag, encoding) if self.etag is not None else None
+
+    def response(self, request: Request, headers: Optional[dict] = None) -> Response:
+        encoding = negotiate(request.headers.get("accept-encoding"))
+        body = self.encoded.get(encoding) if encoding else None
+        if body is None:
+            encoding = None
+            body = self.body
+        response_headers = dict(headers or {})
+        if self.etag is not None:
+            response_headers["ETag"] = self._etag_for(encoding)
+            if_none_match = request.headers.get("if-none-match", "")
+            tags = {tag.strip() for tag in if_none_match.split(",")} if if_none_match else set()
+            # The body is the same in every encoding, and may have been compressed by the middleware
+            if tags & {self.etag, *(self._etag_for(e) for e in ENCODINGS)}:
+                return Response(status_code=304, headers=response_headers)
+        if encoding:
+            response_headers["Content-Encoding"] = encoding
+        response = Response(content=body, media_type=self.media_type, headers=response_headers)
+        if len(self.body) >= MINIMUM_SIZE:
+            add_vary(response.headers)
+        return response
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressingSender(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressingSender:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.active = False
+        self.compressor: Optional[_StreamCompressor] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        self.send = send
+        await self.app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message):
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.active = message["status"] not in (204, 206, 304) and is_compressible(headers)
+            if not self.active:
+                await self.send(message)
+            else:
+                # Hold the start message until the first body chunk shows the size
+                self.start = message
+            return
+        if message["type"] != "http.response.body" or not self.active:
+            if self.start is not None:
+                # File extensions (pathsend, zerocopysend) go out uncompressed
+                start, self.start = self.start, None
+                await self.send(start)
+            self.active = False
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            headers = MutableHeaders(raw=start["headers"])
+            add_vary(headers)
+            if not more_body:
+                # Whole response in one message
+                if len(body) >= self.minimum_size:
+                    body = compress(body, self.encoding, DYNAMIC_LEVELS[self.encoding])
+                    set_content_encoding(headers, self.encoding)
+                    headers["Content-Length"] = str(len(body))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": body, "more_body": False})
+                self.active = False
+                return
+            self.compressor = _StreamCompressor(self.encoding, DYNAMIC_LEVELS[self.encoding])
+            set_content_encoding(headers, self.encoding)
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            await self.send(start)
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        if chunk or not more_body:
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
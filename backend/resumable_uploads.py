@@ -0,0 +1,215 @@
+"""Resumable chunked uploads.
+
+An upload is created with its total size (and optionally the SHA-256 of the whole
+file), then sent as chunks, each tagged with the offset it starts at and its own
+SHA-256. Every chunk is streamed straight into a file under ``directory``, hashed
+on the way, and only counted once its checksum matches; a bad or interrupted chunk
+is cut off again, so the client just asks for the offset and resends from there.
+Memory per request is bounded by the network read size, not the file or the chunk.
+
+Session state lives in ``upload_sessions`` so any API worker can take the next
+chunk, as long as the workers share ``directory`` (one host, or a shared volume).
+A short lease, renewed while a chunk streams in, keeps two requests from writing
+the same session at once; a writer only touches the file and the offset while it
+holds its own lease. Sessions left without progress for ``ttl`` expire and are
+removed by ``expire``, unless a chunk is being written.
+"""
+import asyncio
+import hashlib
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+
+# A writer that died or stalled mid-chunk holds the session at most this long;
+# one that is still receiving renews the lease every third of it
+LEASE_SECONDS = 60
+
+
+class UploadSessions:
+    def __init__(self, collection, directory: Path, max_size: int, chunk_size: int, ttl: timedelta):
+        self.collection = collection
+        self.directory = directory
+        self.max_size = max_size
+        self.chunk_size = chunk_size
+        self.ttl = ttl
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("id", unique=True)
+        await self.collection.create_index("expires_at")
+
+    def _path(self, session_id: str) -> Path:
+        return self.directory / f"{session_id}.part"
+
+    def _public(self, session: dict) -> dict:
+        return {
+            "id": session["id"],
+            "size": session["size"],
+            "offset": session["offset"],
+            "chunk_size": self.chunk_size,
+            "expires_at": session["expires_at"],
+        }
+
+    async def create(self, user_id: str, size: int, filename: Optional[str] = None,
+                     sha256: Optional[str] = None) -> dict:
+        if size <= 0 or size > self.max_size:
+            raise HTTPException(status_code=413, detail=f"Uploads must be between 1 and {self.max_size} bytes")
+        now = datetime.now(timezone.utc)
+        session = {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "filename": filename,
+            "size": size,
+            "sha256": sha256.lower() if sha256 else None,
+            "offset": 0,
+            "lease_until": 0.0,
+            "created_at": now.isoformat(),
+            "expires_at": (now + self.ttl).isoformat(),
+        }
+        await asyncio.to_thread(self._path(session["id"]).touch)
+        await self.collection.insert_one(session)
+        return self._public(session)
+
+    async def get(self, session_id: str, user_id: str) -> dict:
+        session = await self.collection.find_one({"id": session_id, "user_id": user_id}, {"_id": 0})
+        if session is None or session["expires_at"] <= datetime.now(timezone.utc).isoformat():
+            raise HTTPException(status_code=404, detail="Upload not found or expired")
+        return session
+
+    async def status(self, session_id: str, user_id: str) -> dict:
+        return self._public(await self.get(session_id, user_id))
+
+    async def write_chunk(self, session_id: str, user_id: str, offset: int, checksum: str,
+                          body: AsyncIterator[bytes]) -> dict:
+        """Append one chunk at ``offset``; the session must be at exactly that offset."""
+        session = await self.get(session_id, user_id)
+        lease = uuid.uuid4().hex
+        now = datetime.now(timezone.utc)
+        claimed = await self.collection.find_one_and_update(
+            {"id": session_id, "offset": offset, "lease_until": {"$lt": now.timestamp()},
+             "expires_at": {"$gt": now.isoformat()}},
+            {"$set": {"lease": lease, "lease_until": now.timestamp() + LEASE_SECONDS}},
+            projection={"_id": 0, "offset": 1},
+            return_document=ReturnDocument.BEFORE,
+        )
+        if claimed is None:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Offset does not match, or another chunk is being written", "offset": session["offset"]},
+            )
+
+        loop = asyncio.get_running_loop()
+        renewed_at = loop.time()
+        path, digest, written = self._path(session_id), hashlib.sha256(), 0
+        f = await asyncio.to_thread(open, path, "r+b")
+        try:
+            await asyncio.to_thread(f.seek, offset)
+            async for piece in body:
+                written += len(piece)
+                if written > self.chunk_size or offset + written > session["size"]:
+                    raise HTTPException(status_code=413, detail="Chunk too large")
+                if loop.time() - renewed_at > LEASE_SECONDS / 3:
+                    if not await self._renew(session_id, lease):
+                        raise _LeaseLost()
+                    renewed_at = loop.time()
+                digest.update(piece)
+                await asyncio.to_thread(_write, f, piece)
+            if digest.hexdigest() != checksum.lower():
+                raise HTTPException(status_code=422, detail={"message": "Chunk checksum mismatch", "offset": offset})
+        except _LeaseLost:
+            # Another request has taken the session over; its data must not be cut off
+            raise HTTPException(status_code=409, detail={"message": "Chunk took too long; resend it", "offset": offset})
+        except BaseException:
+            # Drop whatever arrived of this chunk while still holding the lease, then
+            # release it; the client resends the chunk from ``offset``
+            if await self._renew(session_id, lease):
+                await asyncio.to_thread(f.truncate, offset)
+                await self.collection.update_one({"id": session_id, "lease": lease}, {"$set": {"lease_until": 0.0}})
+            raise
+        finally:
+            await asyncio.to_thread(f.close)
+
+        session = await self.collection.find_one_and_update(
+            {"id": session_id, "lease": lease},
+            # Progress keeps a slow upload alive
+            {"$set": {"offset": offset + written, "lease_until": 0.0,
+                      "expires_at": (datetime.now(timezone.utc) + self.ttl).isoformat()}},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER,
+        )
+        if session is None:
+            raise HTTPException(status_code=409, detail={"message": "Chunk took too long; resend it", "offset": offset})
+        return self._public(session)
+
+    async def _renew(self, session_id: str, lease: str) -> bool:
+        """Extend a lease that is still held; False once it lapsed or another writer took it."""
+        now = datetime.now(timezone.utc).timestamp()
+        result = await self.collection.update_one(
+            {"id": session_id, "lease": lease, "lease_until": {"$gt": now}},
+            {"$set": {"lease_until": now + LEASE_SECONDS}},
+        )
+        return result.matched_count == 1
+
+    async def complete(self, session_id: str, user_id: str) -> Path:
+        """Path of the fully received file, after checking its size and checksum."""
+        session = await self.get(session_id, user_id)
+        if session["offset"] != session["size"]:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Upload is incomplete", "offset": session["offset"], "size": session["size"]},
+            )
+        path = self._path(session_id)
+        if session["sha256"]:
+            digest = await asyncio.to_thread(_sha256_file, path)
+            if digest != session["sha256"]:
+                await self.discard(session_id)
+                raise HTTPException(status_code=422, detail="File checksum mismatch; start the upload again")
+        return path
+
+    async def discard(self, session_id: str):
+        await self.collection.delete_one({"id": session_id})
+        await asyncio.to_thread(self._path(session_id).unlink, missing_ok=True)
+
+    async def expire(self) -> dict:
+        """Remove expired sessions and their partial files, except those with a chunk in flight."""
+        now = datetime.now(timezone.utc)
+        # A session claimed just before it expired finishes its chunk first
+        idle = {"expires_at": {"$lte": now.isoformat()}, "lease_until": {"$lt": now.timestamp()}}
+        expired = await self.collection.find(idle, {"_id": 0, "id": 1}).to_list(None)
+        removed = reclaimed = 0
+        for session in expired:
+            # Re-checked as it is deleted, so a chunk claimed since the find keeps its file
+            result = await self.collection.delete_one({**idle, "id": session["id"]})
+            if not result.deleted_count:
+                continue
+            path = self._path(session["id"])
+            try:
+                reclaimed += (await asyncio.to_thread(os.stat, path)).st_size
+            except FileNotFoundError:
+                pass
+            await asyncio.to_thread(path.unlink, missing_ok=True)
+            removed += 1
+        return {"expired": removed, "bytes_reclaimed": reclaimed}
+
+
+class _LeaseLost(Exception):
+    pass
+
+
+def _write(f, piece: bytes):
+    # Flushed per piece: every byte reaches the file while the lease is known to be
+    # held, none is flushed later on top of another writer's data
+    f.write(piece)
+    f.flush()
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
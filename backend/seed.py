@@ -0,0 +1,419 @@
+"""MS TEX database seeding tool.
+
+Replaces the old one-off seed scripts with a single entry point:
+
+    python seed.py --profile user-images
+    python seed.py --profile synthetic --products 1000000 --users 200000 --orders 2000000 --seed 42
+
+Catalogue profiles (sample, fifty, realistic, categorized, user-images) load the
+datasets from ``seed_datasets.py``. The synthetic profile generates products,
+users and orders deterministically from ``--seed`` so capacity-planning runs are
+reproducible.
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+from motor.motor_asyncio import AsyncIOMotorClient
+from passlib.context import CryptContext
+from pymongo import ASCENDING, DESCENDING
+
+import seed_datasets as datasets
+from catalog_versions import CatalogVersions
+from order_partitions import order_summary
+from order_totals import OrderTotals
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+PROFILES = ["sample", "fifty", "realistic", "categorized", "user-images", "synthetic"]
+
+MSTEX_ADMIN = {
+    "email": "admin@mstex.com",
+    "password": "admin123",
+    "name": "MS TEX Admin",
+    "phone": "+91 421-1234567",
+    "address": "17/1, Karuparayan Kovil Veethi, Velampalayam, Tiruppur, Tamil Nadu - 641652",
+    "role": "admin",
+}
+
+MSTEX_CUSTOMER = {
+    "email": "customer@example.com",
+    "password": "password123",
+    "name": "Sample Customer",
+    "phone": "+91 98765 43210",
+    "address": "123 Main Street, Chennai, Tamil Nadu",
+    "role": "user",
+}
+
+ACCOUNTS = {
+    "sample": [
+        {
+            "email": "admin@trendyshirts.com",
+            "password": "admin123",
+            "name": "Admin User",
+            "phone": "+1 (555) 000-0000",
+            "address": "123 Admin Street, NY",
+            "role": "admin",
+        },
+        {
+            "email": "user@example.com",
+            "password": "password123",
+            "name": "John Doe",
+            "phone": "+1 (555) 123-4567",
+            "address": "456 Main Street, NY",
+            "role": "user",
+        },
+    ],
+    "fifty": [MSTEX_ADMIN, MSTEX_CUSTOMER],
+    "realistic": [MSTEX_ADMIN, MSTEX_CUSTOMER],
+    "categorized": [MSTEX_ADMIN],
+    "user-images": [MSTEX_ADMIN],
+    "synthetic": [MSTEX_ADMIN, MSTEX_CUSTOMER],
+}
+
+# Synthetic users share one password so millions of accounts cost a single bcrypt hash
+SYNTHETIC_PASSWORD = "password123"
+SYNTHETIC_EMAIL_DOMAIN = "seed.mstex.test"
+SYNTHETIC_EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+SYNTHETIC_SPAN_DAYS = 365
+SYNTHETIC_STATUSES = ["pending", "processing", "shipped", "delivered", "delivered", "delivered"]
+SYNTHETIC_CITIES = ["Tiruppur", "Chennai", "Coimbatore", "Madurai", "Bengaluru", "Hyderabad", "Mumbai", "Pune"]
+
+# ==================== HELPERS ====================
+
+@lru_cache(maxsize=None)
+def hash_password(password: str) -> str:
+    return pwd_context.hash(password)
+
+def image_metadata(url: str) -> dict:
+    return {
+        "url": url,
+        "filename": url.split('/')[-1],
+        "size": 150000,
+        "width": 800,
+        "height": 1000
+    }
+
+def product_doc(data: dict, category: str, created_at: str, product_id: str = None) -> dict:
+    return {
+        "id": product_id or str(uuid.uuid4()),
+        "name": data["name"],
+        "description": data.get("description", data.get("desc")),
+        "category": category,
+        "price": float(data["price"]),
+        "sizes": data["sizes"],
+        "colors": data["colors"],
+        "stock": data["stock"],
+        "images": [image_metadata(url) for url in data["images"]],
+        "created_at": created_at
+    }
+
+def seeded_uuid(seed: int, kind: str, n: int) -> str:
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"mstex-seed:{seed}:{kind}:{n}"))
+
+def seeded_timestamp(rng: random.Random) -> str:
+    offset = timedelta(seconds=rng.randrange(SYNTHETIC_SPAN_DAYS * 86400))
+    return (SYNTHETIC_EPOCH + offset).isoformat()
+
+class Progress:
+    """Prints a running count and insert throughput for one collection."""
+
+    def __init__(self, label: str, total: int = None, interval: float = 1.0):
+        self.label = label
+        self.total = total
+        self.interval = interval
+        self.count = 0
+        self.started = time.perf_counter()
+        self.last_report = self.started
+
+    def advance(self, n: int):
+        self.count += n
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self._print(now)
+
+    def finish(self) -> float:
+        now = time.perf_counter()
+        self._print(now)
+        return now - self.started
+
+    def _print(self, now: float):
+        elapsed = max(now - self.started, 1e-9)
+        total = f"/{self.total:,}" if self.total else ""
+        print(f"  {self.label}: {self.count:,}{total} docs  "
+              f"{elapsed:6.1f}s  {self.count / elapsed:,.0f} docs/s")
+
+async def bulk_insert(collection, documents, batch_size: int, concurrency: int, progress: Progress):
+    """Insert an iterable of documents as concurrent unordered batches."""
+    semaphore = asyncio.Semaphore(concurrency)
+    pending = set()
+
+    async def insert(batch):
+        try:
+            await collection.insert_many(batch, ordered=False)
+            progress.advance(len(batch))
+        finally:
+            semaphore.release()
+
+    batch = []
+    for doc in documents:
+        batch.append(doc)
+        if len(batch) >= batch_size:
+            await semaphore.acquire()
+            pending.add(asyncio.create_task(insert(batch)))
+            pending = {task for task in pending if not task.done()}
+            batch = []
+    if batch:
+        await semaphore.acquire()
+        pending.add(asyncio.create_task(insert(batch)))
+    if pending:
+        await asyncio.gather(*pending)
+    return progress.finish()
+
+async def ensure_accounts(db, accounts: list):
+    """Create missing admin/sample accounts, hashing each password at most once."""
+    emails = [account["email"] for account in accounts]
+    existing = {
+        user["email"]
+        async for user in db.users.find({"email": {"$in": emails}}, {"_id": 0, "email": 1})
+    }
+    for account in accounts:
+        if account["email"] in existing:
+            print(f"✓ Account exists: {account['email']}")
+            continue
+        doc = {k: v for k, v in account.items() if k != "password"}
+        doc["id"] = str(uuid.uuid4())
+        doc["password"] = hash_password(account["password"])
+        doc["created_at"] = datetime.now(timezone.utc).isoformat()
+        await db.users.insert_one(doc)
+        print(f"✓ Created {account['role']}: {account['email']} / {account['password']}")
+
+async def build_indexes(db):
+    """Create the indexes the API queries rely on. Run after bulk loads."""
+    started = time.perf_counter()
+    await db.products.create_index("id", unique=True)
+    await db.products.create_index([("category", ASCENDING), ("price", ASCENDING)])
+    await db.products.create_index([("created_at", DESCENDING)])
+    await db.products.create_index("images.filename")
+    await db.users.create_index("id", unique=True)
+    await db.users.create_index("email", unique=True)
+    await db.orders.create_index("id", unique=True)
+    await db.orders.create_index([("user_id", ASCENDING), ("created_at", DESCENDING)])
+    await db.orders.create_index([("created_at", DESCENDING)])
+    await db.carts.create_index("user_id", unique=True)
+    print(f"✓ Indexes built in {time.perf_counter() - started:.1f}s")
+
+# ==================== CATALOGUE PROFILES ====================
+
+def catalog_products(profile: str, rng: random.Random):
+    now = datetime.now(timezone.utc).isoformat()
+
+    if profile == "sample":
+        for data in datasets.SAMPLE_PRODUCTS:
+            yield product_doc(data, data["category"], now)
+
+    elif profile == "fifty":
+        for i in range(55):
+            category = "men" if i % 2 == 0 else "women"
+            sizes = rng.sample(datasets.FIFTY_SIZES, rng.randint(4, 6))
+            data = {
+                "name": f"{rng.choice(datasets.FIFTY_NAMES)} - {category.title()}'s",
+                "description": rng.choice(datasets.FIFTY_DESCRIPTIONS),
+                "price": rng.randint(299, 1999),
+                "sizes": sorted(sizes, key=datasets.FIFTY_SIZES.index),
+                "colors": rng.sample(datasets.FIFTY_COLORS, rng.randint(3, 6)),
+                "stock": rng.randint(50, 200),
+                "images": rng.sample(datasets.FIFTY_IMAGES, rng.randint(1, 3)),
+            }
+            yield product_doc(data, category, now)
+
+    elif profile == "realistic":
+        for data in datasets.REALISTIC_PRODUCTS:
+            yield product_doc(data, data["category"], now)
+
+    elif profile == "categorized":
+        for data in datasets.MENS_PRODUCTS:
+            yield product_doc(data, "men", now)
+        for data in datasets.WOMENS_PRODUCTS:
+            yield product_doc(data, "women", now)
+
+    elif profile == "user-images":
+        for data in datasets.USER_PRODUCTS:
+            sizes = datasets.USER_SIZES_MEN if data["category"] == "men" else datasets.USER_SIZES_WOMEN
+            data = dict(
+                data,
+                sizes=sizes,
+                colors=rng.sample(datasets.USER_COLORS, rng.randint(3, 5)),
+                stock=rng.randint(80, 200),
+            )
+            yield product_doc(data, data["category"], now)
+
+# ==================== SYNTHETIC PROFILE ====================
+
+SYNTHETIC_TEMPLATES = (
+    datasets.REALISTIC_PRODUCTS
+    + [dict(p, category="men") for p in datasets.MENS_PRODUCTS]
+    + [dict(p, category="women") for p in datasets.WOMENS_PRODUCTS]
+)
+SYNTHETIC_IMAGES = datasets.USER_IMAGES
+
+def synthetic_product(seed: int, n: int) -> dict:
+    """Product ``n`` is a pure function of ``(seed, n)`` so orders can reference it without a lookup."""
+    rng = random.Random(f"{seed}:product:{n}")
+    template = SYNTHETIC_TEMPLATES[n % len(SYNTHETIC_TEMPLATES)]
+    sizes = rng.sample(datasets.FIFTY_SIZES, rng.randint(3, 6))
+    data = {
+        "name": f"{template['name']} #{n}",
+        "description": template["description"],
+        "price": round(template["price"] * rng.uniform(0.7, 1.6)),
+        "sizes": sorted(sizes, key=datasets.FIFTY_SIZES.index),
+        "colors": rng.sample(datasets.FIFTY_COLORS, rng.randint(2, 6)),
+        "stock": rng.randint(0, 300),
+        "images": rng.sample(SYNTHETIC_IMAGES, rng.randint(1, 3)),
+    }
+    return product_doc(data, template["category"], seeded_timestamp(rng), seeded_uuid(seed, "product", n))
+
+def synthetic_user(seed: int, n: int, password_hash: str) -> dict:
+    rng = random.Random(f"{seed}:user:{n}")
+    return {
+        "id": seeded_uuid(seed, "user", n),
+        "email": f"user{n}@{SYNTHETIC_EMAIL_DOMAIN}",
+        "password": password_hash,
+        "name": f"Customer {n}",
+        "phone": f"+91 9{rng.randrange(10 ** 9):09d}",
+        "address": f"{rng.randint(1, 999)} Main Road, {rng.choice(SYNTHETIC_CITIES)}, India",
+        "role": "user",
+        "created_at": seeded_timestamp(rng)
+    }
+
+def synthetic_order(seed: int, n: int, product_count: int, user_count: int) -> dict:
+    rng = random.Random(f"{seed}:order:{n}")
+    items = []
+    for _ in range(rng.randint(1, 5)):
+        product = synthetic_product(seed, rng.randrange(product_count))
+        items.append({
+            "product_id": product["id"],
+            "product_name": product["name"],
+            "quantity": rng.randint(1, 3),
+            "size": rng.choice(product["sizes"]),
+            "color": rng.choice(product["colors"]),
+            "price": product["price"]
+        })
+    status = rng.choice(SYNTHETIC_STATUSES)
+    return {
+        "id": seeded_uuid(seed, "order", n),
+        "user_id": seeded_uuid(seed, "user", rng.randrange(user_count)),
+        "items": items,
+        "total_amount": round(sum(i["price"] * i["quantity"] for i in items), 2),
+        "shipping_address": f"{rng.randint(1, 999)} Main Road, {rng.choice(SYNTHETIC_CITIES)}, India",
+        "status": status,
+        "payment_status": "completed" if status != "pending" else "pending",
+        "created_at": seeded_timestamp(rng),
+        **order_summary(items)
+    }
+
+# ==================== ENTRY POINT ====================
+
+async def seed_database(args):
+    client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME']]
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+
+    print("=" * 70)
+    print(f"MS TEX - Database Seeding ({args.profile}, seed={args.seed})")
+    print("=" * 70)
+    print()
+
+    try:
+        if not args.append:
+            await db.products.delete_many({})
+            await db.products.drop_indexes()
+            print("✓ Cleared existing products")
+            if args.profile == "synthetic":
+                await db.orders.delete_many({})
+                await db.orders.drop_indexes()
+                await db.users.delete_many({"email": {"$regex": f"@{SYNTHETIC_EMAIL_DOMAIN.replace('.', '[.]')}$"}})
+                print("✓ Cleared existing orders and synthetic users")
+
+        await ensure_accounts(db, ACCOUNTS[args.profile])
+        print()
+
+        totals = {}
+        if args.profile == "synthetic":
+            seed = args.seed
+            password_hash = hash_password(SYNTHETIC_PASSWORD)
+            # Versions are reserved as one block, so the server has nothing to stamp at startup
+            first_version = await CatalogVersions(db).reserve(max(args.products, 0))
+            versioned_at = datetime.now(timezone.utc).isoformat()
+            plan = [
+                ("products", args.products, (
+                    dict(synthetic_product(seed, n), version=first_version + n, versioned_at=versioned_at)
+                    for n in range(args.products)
+                )),
+                ("users", args.users, (synthetic_user(seed, n, password_hash) for n in range(args.users))),
+                ("orders", args.orders,
+                 (synthetic_order(seed, n, args.products, args.users) for n in range(args.orders))),
+            ]
+            for name, count, documents in plan:
+                if count <= 0:
+                    continue
+                if name == "orders" and (args.products <= 0 or args.users <= 0):
+                    print("! Skipping orders: synthetic orders need --products and --users")
+                    continue
+                progress = Progress(name, count)
+                elapsed = await bulk_insert(db[name], documents, args.batch_size, args.concurrency, progress)
+                totals[name] = (progress.count, elapsed)
+            # The dashboard's running totals counted the old orders; the server recounts on its next read
+            await OrderTotals(db.counters, db.orders, None).reset()
+        else:
+            products = list(catalog_products(args.profile, rng))
+            stamps = await CatalogVersions(db).stamps(len(products))
+            progress = Progress("products", len(products))
+            elapsed = await bulk_insert(
+                db.products, ({**doc, **stamp} for doc, stamp in zip(products, stamps)),
+                args.batch_size, args.concurrency, progress
+            )
+            totals["products"] = (progress.count, elapsed)
+
+        print()
+        await build_indexes(db)
+
+        print()
+        print("=" * 70)
+        print("Database seeding completed!")
+        print("=" * 70)
+        for name, (count, elapsed) in totals.items():
+            print(f"  {name:<10} {count:>12,} docs  {elapsed:8.1f}s  {count / max(elapsed, 1e-9):>12,.0f} docs/s")
+        print(f"  {'total':<10} {'':>12}       {time.perf_counter() - started:8.1f}s")
+        print("=" * 70)
+    finally:
+        client.close()
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Seed the MS TEX database")
+    parser.add_argument("--profile", choices=PROFILES, default="user-images",
+                        help="dataset to load (default: user-images)")
+    parser.add_argument("--seed", type=int, default=42, help="random seed for reproducible data")
+    parser.add_argument("--products", type=int, default=10000, help="synthetic products to generate")
+    parser.add_argument("--users", type=int, default=1000, help="synthetic users to generate")
+    parser.add_argument("--orders", type=int, default=10000, help="synthetic orders to generate")
+    parser.add_argument("--batch-size", type=int, default=1000, help="documents per insert_many call")
+    parser.add_argument("--concurrency", type=int, default=4, help="insert batches in flight at once")
+    parser.add_argument("--append", action="store_true",
+                        help="keep existing products/orders instead of clearing them first")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    asyncio.run(seed_database(parse_args()))
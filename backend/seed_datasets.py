@@ -0,0 +1,689 @@
+"""Static product datasets used by the ``seed.py`` profiles.
+
+Each profile keeps the catalogue that used to live in its own seed script so
+existing environments can be reseeded with exactly the same products.
+"""
+
+# ==================== SAMPLE (original demo store) ====================
+
+SAMPLE_IMAGES = [
+    'https://images.unsplash.com/photo-1574180566232-aaad1b5b8450',
+    'https://images.unsplash.com/photo-1516442719524-a603408c90cb',
+    'https://images.unsplash.com/photo-1516082669438-2d2bb5082626',
+    'https://images.unsplash.com/photo-1516177609387-9bad55a45194',
+    'https://images.unsplash.com/photo-1509003124559-eb6678fe452b',
+    'https://images.unsplash.com/photo-1589408871633-685343fb36b2',
+    'https://images.unsplash.com/photo-1564430362299-113976f94001',
+    'https://images.unsplash.com/photo-1533793735164-12065733b215',
+    'https://images.pexels.com/photos/34253791/pexels-photo-34253791.jpeg',
+    'https://images.pexels.com/photos/34277461/pexels-photo-34277461.jpeg',
+    'https://images.pexels.com/photos/34277458/pexels-photo-34277458.jpeg',
+    'https://images.pexels.com/photos/34286724/pexels-photo-34286724.jpeg'
+]
+
+SAMPLE_PRODUCTS = [
+    {
+        "name": "Classic Black T-Shirt",
+        "description": "Premium quality black cotton t-shirt. Comfortable, stylish, and perfect for everyday wear.",
+        "category": "men",
+        "price": 24.99,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["Black", "White", "Gray"],
+        "stock": 150,
+        "images": [SAMPLE_IMAGES[0], SAMPLE_IMAGES[1]]
+    },
+    {
+        "name": "Urban Style Tee",
+        "description": "Modern fit t-shirt with urban street style. Made from soft, breathable fabric.",
+        "category": "men",
+        "price": 29.99,
+        "sizes": ["M", "L", "XL"],
+        "colors": ["Blue", "Navy", "Black"],
+        "stock": 100,
+        "images": [SAMPLE_IMAGES[2], SAMPLE_IMAGES[3]]
+    },
+    {
+        "name": "Sport Performance T-Shirt",
+        "description": "Athletic fit t-shirt designed for active lifestyles. Moisture-wicking and quick-dry.",
+        "category": "men",
+        "price": 34.99,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["Red", "Blue", "Black"],
+        "stock": 80,
+        "images": [SAMPLE_IMAGES[8], SAMPLE_IMAGES[9]]
+    },
+    {
+        "name": "Vintage Gray Tee",
+        "description": "Retro-inspired gray t-shirt with a relaxed fit. Soft and comfortable for all-day wear.",
+        "category": "men",
+        "price": 27.99,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["Gray", "Black", "White"],
+        "stock": 120,
+        "images": [SAMPLE_IMAGES[3]]
+    },
+    {
+        "name": "Women's Essential White Tee",
+        "description": "Timeless white t-shirt for women. Versatile and elegant, perfect for any occasion.",
+        "category": "women",
+        "price": 22.99,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["White", "Black", "Pink"],
+        "stock": 200,
+        "images": [SAMPLE_IMAGES[4]]
+    },
+    {
+        "name": "Striped Fashion Tee",
+        "description": "Trendy striped t-shirt for fashion-forward women. Comfortable and stylish.",
+        "category": "women",
+        "price": 28.99,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["Black", "White", "Blue"],
+        "stock": 90,
+        "images": [SAMPLE_IMAGES[5], SAMPLE_IMAGES[6]]
+    },
+    {
+        "name": "Casual Black Women's Tee",
+        "description": "Simple yet elegant black t-shirt. A wardrobe essential for every woman.",
+        "category": "women",
+        "price": 25.99,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["Black", "Gray", "White"],
+        "stock": 150,
+        "images": [SAMPLE_IMAGES[7]]
+    },
+    {
+        "name": "Premium Cotton Tee - Women's",
+        "description": "Luxury cotton t-shirt with superior quality. Soft, comfortable, and durable.",
+        "category": "women",
+        "price": 32.99,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["White", "Pink", "Blue"],
+        "stock": 75,
+        "images": [SAMPLE_IMAGES[10], SAMPLE_IMAGES[11]]
+    }
+]
+
+# ==================== FIFTY (randomised local catalogue) ====================
+
+FIFTY_IMAGES = [f"/api/images/tshirt_{i}.jpg" for i in range(1, 13)]
+
+FIFTY_NAMES = [
+    "Classic Cotton T-Shirt", "Premium Polo Shirt", "V-Neck Casual Tee", 
+    "Round Neck Basic Tee", "Striped Cotton Shirt", "Solid Color T-Shirt",
+    "Printed Graphic Tee", "Sports Performance Shirt", "Casual Henley Tee",
+    "Long Sleeve T-Shirt", "Crew Neck Essential", "Vintage Wash Tee",
+    "Urban Style Shirt", "Comfort Fit T-Shirt", "Athletic Fit Tee",
+    "Relaxed Fit Casual", "Slim Fit T-Shirt", "Oversized Comfort Tee",
+    "Pocket Style Shirt", "Button Down Casual", "Raglan Sleeve Tee",
+    "Ringer Style Shirt", "Baseball Tee", "Scoop Neck T-Shirt",
+    "Tank Top Style"
+]
+
+FIFTY_DESCRIPTIONS = [
+    "Premium quality cotton t-shirt made in Tiruppur. Soft, breathable, and comfortable for all-day wear.",
+    "High-grade knitted fabric with superior finish. Perfect for casual and semi-formal occasions.",
+    "Durable and stylish t-shirt crafted with care. Ideal for everyday comfort and style.",
+    "Expertly woven cotton fabric from Tiruppur's finest mills. Combines comfort with durability.",
+    "Soft-touch finish with excellent color retention. A wardrobe essential for any season.",
+    "Premium knitted wear designed for maximum comfort. Made with attention to every detail.",
+    "Classic fit with modern styling. Perfect blend of comfort and fashion.",
+    "Breathable cotton fabric ideal for warm weather. Maintains shape after multiple washes.",
+    "Handpicked quality cotton processed in Tiruppur. Exceptionally soft and long-lasting.",
+    "Contemporary design meets traditional craftsmanship. A perfect addition to your collection."
+]
+
+FIFTY_COLORS = [
+    "Black", "White", "Navy Blue", "Gray", "Red", "Royal Blue", 
+    "Dark Green", "Maroon", "Charcoal", "Sky Blue", "Olive Green",
+    "Burgundy", "Steel Gray", "Forest Green", "Cream", "Beige",
+    "Light Gray", "Dark Blue", "Wine", "Teal"
+]
+
+FIFTY_SIZES = ["XS", "S", "M", "L", "XL", "XXL"]
+
+# ==================== REALISTIC ====================
+
+REALISTIC_IMAGES = [f"/api/images/product_{i}.jpg" for i in range(1, 15)]
+
+REALISTIC_PRODUCTS = [
+    # Men's T-Shirts
+    {
+        "name": "Classic Black Cotton Tee",
+        "description": "Premium 100% cotton black T-shirt. Soft, breathable fabric perfect for everyday wear. Pre-shrunk material ensures long-lasting fit. Made in Tiruppur with superior quality control.",
+        "category": "men",
+        "price": 499.0,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["Black", "White", "Gray"],
+        "stock": 150,
+        "images": [REALISTIC_IMAGES[0], REALISTIC_IMAGES[1]]
+    },
+    {
+        "name": "Premium White Crew Neck",
+        "description": "Crisp white cotton crew neck T-shirt. Superior stitching quality with reinforced seams. Ideal for layering or standalone wear. Maintains brightness after multiple washes.",
+        "category": "men",
+        "price": 549.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["White", "Cream", "Light Gray"],
+        "stock": 120,
+        "images": [REALISTIC_IMAGES[3], REALISTIC_IMAGES[4]]
+    },
+    {
+        "name": "Urban Streetwear Black Tee",
+        "description": "Modern fit black T-shirt with contemporary styling. Crafted from premium knitted cotton. Perfect for urban lifestyle and casual outings. Comfortable all-day wear.",
+        "category": "men",
+        "price": 599.0,
+        "sizes": ["M", "L", "XL", "XXL"],
+        "colors": ["Black", "Charcoal", "Navy"],
+        "stock": 100,
+        "images": [REALISTIC_IMAGES[5], REALISTIC_IMAGES[6]]
+    },
+    {
+        "name": "Casual Comfort Fit Tee",
+        "description": "Relaxed fit T-shirt for maximum comfort. Made from soft-touch cotton blend. Features taped neck and shoulders for durability. Ideal for weekend wear and casual occasions.",
+        "category": "men",
+        "price": 449.0,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["Blue", "Green", "Maroon"],
+        "stock": 130,
+        "images": [REALISTIC_IMAGES[6]]
+    },
+    {
+        "name": "Athletic Performance Tee",
+        "description": "High-performance T-shirt designed for active lifestyle. Moisture-wicking fabric keeps you dry. Quick-dry technology and breathable mesh panels. Perfect for gym and sports.",
+        "category": "men",
+        "price": 699.0,
+        "sizes": ["M", "L", "XL"],
+        "colors": ["Black", "Navy", "Royal Blue"],
+        "stock": 80,
+        "images": [REALISTIC_IMAGES[0], REALISTIC_IMAGES[5]]
+    },
+    {
+        "name": "Plain Round Neck Essential",
+        "description": "Wardrobe essential plain T-shirt. Classic round neck design with comfortable fit. Premium cotton fabric from Tiruppur mills. Available in multiple colors.",
+        "category": "men",
+        "price": 399.0,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["White", "Black", "Gray", "Navy", "Maroon"],
+        "stock": 200,
+        "images": [REALISTIC_IMAGES[3], REALISTIC_IMAGES[4]]
+    },
+    {
+        "name": "Premium Polo Style Tee",
+        "description": "Semi-formal T-shirt with polo-inspired design. Features quality buttons and collar. Suitable for smart casual occasions. Premium knit fabric with excellent drape.",
+        "category": "men",
+        "price": 799.0,
+        "sizes": ["M", "L", "XL"],
+        "colors": ["White", "Navy", "Burgundy"],
+        "stock": 70,
+        "images": [REALISTIC_IMAGES[4]]
+    },
+    {
+        "name": "Vintage Wash Casual Tee",
+        "description": "Pre-washed vintage style T-shirt. Soft hand feel with lived-in comfort. Unique wash creates distinctive character. Perfect for casual everyday style.",
+        "category": "men",
+        "price": 649.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["Faded Black", "Stone Wash", "Olive"],
+        "stock": 90,
+        "images": [REALISTIC_IMAGES[5], REALISTIC_IMAGES[6]]
+    },
+    {
+        "name": "Henley Button Detail Tee",
+        "description": "Stylish T-shirt with henley button placket. Adds subtle detail to classic design. Premium quality buttons and reinforced stitching. Versatile for various occasions.",
+        "category": "men",
+        "price": 699.0,
+        "sizes": ["M", "L", "XL", "XXL"],
+        "colors": ["Gray", "Navy", "Olive Green"],
+        "stock": 85,
+        "images": [REALISTIC_IMAGES[0]]
+    },
+    {
+        "name": "Slim Fit Modern Tee",
+        "description": "Contemporary slim fit design. Tailored for modern aesthetic without compromising comfort. High-quality cotton with stretch. Ideal for fitted styling.",
+        "category": "men",
+        "price": 599.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["Black", "White", "Navy"],
+        "stock": 110,
+        "images": [REALISTIC_IMAGES[5]]
+    },
+    
+    # Women's T-Shirts
+    {
+        "name": "Women's Soft Cotton Tee",
+        "description": "Ultra-soft cotton T-shirt designed for women. Feminine fit with comfortable neckline. Lightweight and breathable fabric. Perfect for everyday comfort and style.",
+        "category": "women",
+        "price": 499.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["White", "Pink", "Peach", "Mint"],
+        "stock": 140,
+        "images": [REALISTIC_IMAGES[7], REALISTIC_IMAGES[8]]
+    },
+    {
+        "name": "Elegant V-Neck Women's Tee",
+        "description": "Flattering V-neck design T-shirt. Soft touch fabric with excellent drape. Creates elegant silhouette while maintaining comfort. Versatile for casual and semi-formal wear.",
+        "category": "women",
+        "price": 549.0,
+        "sizes": ["XS", "S", "M", "L"],
+        "colors": ["Black", "Navy", "Wine", "White"],
+        "stock": 120,
+        "images": [REALISTIC_IMAGES[8], REALISTIC_IMAGES[9]]
+    },
+    {
+        "name": "Casual Women's Crew Neck",
+        "description": "Classic crew neck T-shirt for women. Comfortable relaxed fit with quality stitching. Made from breathable cotton blend. Essential wardrobe piece for any season.",
+        "category": "women",
+        "price": 449.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["White", "Light Pink", "Sky Blue", "Lemon"],
+        "stock": 160,
+        "images": [REALISTIC_IMAGES[9]]
+    },
+    {
+        "name": "Premium Long Sleeve Women's Tee",
+        "description": "Elegant long sleeve T-shirt. Premium cotton with comfortable stretch. Perfect for layering or standalone wear. Timeless design that never goes out of style.",
+        "category": "women",
+        "price": 649.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["Black", "White", "Gray", "Navy"],
+        "stock": 95,
+        "images": [REALISTIC_IMAGES[10]]
+    },
+    {
+        "name": "Fitted Women's Basic Tee",
+        "description": "Body-conscious fitted design. High-quality stretchable cotton fabric. Maintains shape after washing. Ideal for layering under jackets or wearing solo.",
+        "category": "women",
+        "price": 499.0,
+        "sizes": ["XS", "S", "M", "L"],
+        "colors": ["Black", "White", "Red", "Royal Blue"],
+        "stock": 130,
+        "images": [REALISTIC_IMAGES[8], REALISTIC_IMAGES[9]]
+    },
+    {
+        "name": "Women's Oversized Comfort Tee",
+        "description": "Trendy oversized fit T-shirt. Relaxed and comfortable styling. Made from soft premium cotton. Perfect for contemporary casual look and loungewear.",
+        "category": "women",
+        "price": 599.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["White", "Beige", "Sage Green", "Lavender"],
+        "stock": 110,
+        "images": [REALISTIC_IMAGES[11]]
+    },
+    {
+        "name": "Scoop Neck Women's Tee",
+        "description": "Feminine scoop neckline T-shirt. Flattering cut with comfortable fit. Lightweight fabric perfect for warm weather. Versatile piece for various styling options.",
+        "category": "women",
+        "price": 549.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["White", "Pink", "Coral", "Mint Green"],
+        "stock": 125,
+        "images": [REALISTIC_IMAGES[7], REALISTIC_IMAGES[12]]
+    },
+    {
+        "name": "Women's Crop Fit Tee",
+        "description": "Modern crop length T-shirt. Trendy design with comfortable fit. Made from soft cotton blend. Perfect for pairing with high-waist bottoms.",
+        "category": "women",
+        "price": 599.0,
+        "sizes": ["XS", "S", "M", "L"],
+        "colors": ["Black", "White", "Pink", "Yellow"],
+        "stock": 100,
+        "images": [REALISTIC_IMAGES[12]]
+    },
+    {
+        "name": "Premium Women's Polo Tee",
+        "description": "Sophisticated polo-style T-shirt for women. Features collar and quality buttons. Perfect for smart casual occasions. Premium knitted fabric with elegant finish.",
+        "category": "women",
+        "price": 749.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["White", "Navy", "Black", "Red"],
+        "stock": 80,
+        "images": [REALISTIC_IMAGES[11]]
+    },
+    {
+        "name": "Women's Striped Casual Tee",
+        "description": "Classic striped pattern T-shirt. Timeless design with modern fit. Soft cotton fabric with comfortable feel. Adds visual interest to casual outfits.",
+        "category": "women",
+        "price": 549.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["Navy/White", "Black/White", "Red/White"],
+        "stock": 115,
+        "images": [REALISTIC_IMAGES[9], REALISTIC_IMAGES[13]]
+    },
+    
+    # Additional Unisex/Mixed Products
+    {
+        "name": "Essential Plain White Tee",
+        "description": "Versatile white T-shirt suitable for everyone. Premium cotton with superior quality. Classic design that never goes out of style. Made in Tiruppur with care.",
+        "category": "men",
+        "price": 399.0,
+        "sizes": ["XS", "S", "M", "L", "XL", "XXL"],
+        "colors": ["White", "Off-White", "Cream"],
+        "stock": 180,
+        "images": [REALISTIC_IMAGES[3], REALISTIC_IMAGES[4]]
+    },
+    {
+        "name": "Graphic Print Ready Tee",
+        "description": "Plain T-shirt perfect for custom printing. High-quality base suitable for graphics. Smooth surface finish. Ideal for personalization and branding.",
+        "category": "men",
+        "price": 449.0,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["White", "Black", "Gray", "Navy"],
+        "stock": 150,
+        "images": [REALISTIC_IMAGES[0], REALISTIC_IMAGES[1]]
+    },
+    {
+        "name": "Heavyweight Cotton Tee",
+        "description": "Substantial heavyweight cotton T-shirt. Durable construction for long-lasting wear. Premium thick fabric with quality feel. Perfect for workwear and casual use.",
+        "category": "men",
+        "price": 649.0,
+        "sizes": ["M", "L", "XL", "XXL"],
+        "colors": ["Black", "Navy", "Charcoal"],
+        "stock": 90,
+        "images": [REALISTIC_IMAGES[0], REALISTIC_IMAGES[5]]
+    },
+    {
+        "name": "Lightweight Summer Tee",
+        "description": "Ultra-lightweight T-shirt perfect for hot weather. Breathable fabric with excellent airflow. Quick-dry properties. Ideal for summer and tropical climates.",
+        "category": "women",
+        "price": 499.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["White", "Sky Blue", "Mint", "Coral"],
+        "stock": 135,
+        "images": [REALISTIC_IMAGES[7], REALISTIC_IMAGES[8]]
+    },
+    {
+        "name": "Luxury Pima Cotton Tee",
+        "description": "Premium Pima cotton T-shirt. Extra-long staple cotton for superior softness. Luxurious feel with excellent durability. Investment piece for discerning customers.",
+        "category": "men",
+        "price": 999.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["White", "Black", "Navy"],
+        "stock": 60,
+        "images": [REALISTIC_IMAGES[3], REALISTIC_IMAGES[4]]
+    },
+]
+
+# ==================== CATEGORIZED ====================
+
+MENS_IMAGES = [f"/api/images/mens_{i}.jpg" for i in range(1, 9)]  # 8 men's images
+WOMENS_IMAGES = [f"/api/images/womens_{i}.jpg" for i in range(1, 8)]  # 7 women's images
+
+# MEN'S PRODUCTS (Using ONLY men's images)
+MENS_PRODUCTS = [
+    {
+        "name": "Classic Black Cotton Tee",
+        "description": "Premium 100% cotton black T-shirt. Soft, breathable fabric perfect for everyday wear. Pre-shrunk material ensures long-lasting fit. Made in Tiruppur with superior quality control.",
+        "price": 499.0,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["Black", "White", "Gray"],
+        "stock": 150,
+        "images": [MENS_IMAGES[0]]
+    },
+    {
+        "name": "Premium White Crew Neck",
+        "description": "Crisp white cotton crew neck T-shirt. Superior stitching quality with reinforced seams. Ideal for layering or standalone wear. Maintains brightness after multiple washes.",
+        "price": 549.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["White", "Cream", "Light Gray"],
+        "stock": 120,
+        "images": [MENS_IMAGES[1]]
+    },
+    {
+        "name": "Urban Streetwear Black Tee",
+        "description": "Modern fit black T-shirt with contemporary styling. Crafted from premium knitted cotton. Perfect for urban lifestyle and casual outings. Comfortable all-day wear.",
+        "price": 599.0,
+        "sizes": ["M", "L", "XL", "XXL"],
+        "colors": ["Black", "Charcoal", "Navy"],
+        "stock": 100,
+        "images": [MENS_IMAGES[2]]
+    },
+    {
+        "name": "Casual Comfort Fit Tee",
+        "description": "Relaxed fit T-shirt for maximum comfort. Made from soft-touch cotton blend. Features taped neck and shoulders for durability. Ideal for weekend wear and casual occasions.",
+        "price": 449.0,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["Blue", "Green", "Maroon"],
+        "stock": 130,
+        "images": [MENS_IMAGES[3]]
+    },
+    {
+        "name": "Athletic Performance Tee",
+        "description": "High-performance T-shirt designed for active lifestyle. Moisture-wicking fabric keeps you dry. Quick-dry technology and breathable mesh panels. Perfect for gym and sports.",
+        "price": 699.0,
+        "sizes": ["M", "L", "XL"],
+        "colors": ["Black", "Navy", "Royal Blue"],
+        "stock": 80,
+        "images": [MENS_IMAGES[4]]
+    },
+    {
+        "name": "Plain Round Neck Essential",
+        "description": "Wardrobe essential plain T-shirt. Classic round neck design with comfortable fit. Premium cotton fabric from Tiruppur mills. Available in multiple colors.",
+        "price": 399.0,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["White", "Black", "Gray", "Navy", "Maroon"],
+        "stock": 200,
+        "images": [MENS_IMAGES[5]]
+    },
+    {
+        "name": "Premium Polo Style Tee",
+        "description": "Semi-formal T-shirt with polo-inspired design. Features quality buttons and collar. Suitable for smart casual occasions. Premium knit fabric with excellent drape.",
+        "price": 799.0,
+        "sizes": ["M", "L", "XL"],
+        "colors": ["White", "Navy", "Burgundy"],
+        "stock": 70,
+        "images": [MENS_IMAGES[6]]
+    },
+    {
+        "name": "Vintage Wash Casual Tee",
+        "description": "Pre-washed vintage style T-shirt. Soft hand feel with lived-in comfort. Unique wash creates distinctive character. Perfect for casual everyday style.",
+        "price": 649.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["Faded Black", "Stone Wash", "Olive"],
+        "stock": 90,
+        "images": [MENS_IMAGES[7]]
+    },
+    {
+        "name": "Henley Button Detail Tee",
+        "description": "Stylish T-shirt with henley button placket. Adds subtle detail to classic design. Premium quality buttons and reinforced stitching. Versatile for various occasions.",
+        "price": 699.0,
+        "sizes": ["M", "L", "XL", "XXL"],
+        "colors": ["Gray", "Navy", "Olive Green"],
+        "stock": 85,
+        "images": [MENS_IMAGES[0], MENS_IMAGES[1]]
+    },
+    {
+        "name": "Slim Fit Modern Tee",
+        "description": "Contemporary slim fit design. Tailored for modern aesthetic without compromising comfort. High-quality cotton with stretch. Ideal for fitted styling.",
+        "price": 599.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["Black", "White", "Navy"],
+        "stock": 110,
+        "images": [MENS_IMAGES[2], MENS_IMAGES[3]]
+    },
+    {
+        "name": "Essential Plain White Tee",
+        "description": "Versatile white T-shirt suitable for everyone. Premium cotton with superior quality. Classic design that never goes out of style. Made in Tiruppur with care.",
+        "price": 399.0,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["White", "Off-White", "Cream"],
+        "stock": 180,
+        "images": [MENS_IMAGES[4], MENS_IMAGES[5]]
+    },
+    {
+        "name": "Graphic Print Ready Tee",
+        "description": "Plain T-shirt perfect for custom printing. High-quality base suitable for graphics. Smooth surface finish. Ideal for personalization and branding.",
+        "price": 449.0,
+        "sizes": ["S", "M", "L", "XL", "XXL"],
+        "colors": ["White", "Black", "Gray", "Navy"],
+        "stock": 150,
+        "images": [MENS_IMAGES[6], MENS_IMAGES[7]]
+    },
+    {
+        "name": "Heavyweight Cotton Tee",
+        "description": "Substantial heavyweight cotton T-shirt. Durable construction for long-lasting wear. Premium thick fabric with quality feel. Perfect for workwear and casual use.",
+        "price": 649.0,
+        "sizes": ["M", "L", "XL", "XXL"],
+        "colors": ["Black", "Navy", "Charcoal"],
+        "stock": 90,
+        "images": [MENS_IMAGES[0], MENS_IMAGES[2]]
+    },
+    {
+        "name": "Luxury Pima Cotton Tee",
+        "description": "Premium Pima cotton T-shirt. Extra-long staple cotton for superior softness. Luxurious feel with excellent durability. Investment piece for discerning customers.",
+        "price": 999.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["White", "Black", "Navy"],
+        "stock": 60,
+        "images": [MENS_IMAGES[1], MENS_IMAGES[3]]
+    },
+]
+
+# WOMEN'S PRODUCTS (Using ONLY women's images)
+WOMENS_PRODUCTS = [
+    {
+        "name": "Women's Soft Cotton Tee",
+        "description": "Ultra-soft cotton T-shirt designed for women. Feminine fit with comfortable neckline. Lightweight and breathable fabric. Perfect for everyday comfort and style.",
+        "price": 499.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["White", "Pink", "Peach", "Mint"],
+        "stock": 140,
+        "images": [WOMENS_IMAGES[0]]
+    },
+    {
+        "name": "Elegant V-Neck Women's Tee",
+        "description": "Flattering V-neck design T-shirt. Soft touch fabric with excellent drape. Creates elegant silhouette while maintaining comfort. Versatile for casual and semi-formal wear.",
+        "price": 549.0,
+        "sizes": ["XS", "S", "M", "L"],
+        "colors": ["Black", "Navy", "Wine", "White"],
+        "stock": 120,
+        "images": [WOMENS_IMAGES[1]]
+    },
+    {
+        "name": "Casual Women's Crew Neck",
+        "description": "Classic crew neck T-shirt for women. Comfortable relaxed fit with quality stitching. Made from breathable cotton blend. Essential wardrobe piece for any season.",
+        "price": 449.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["White", "Light Pink", "Sky Blue", "Lemon"],
+        "stock": 160,
+        "images": [WOMENS_IMAGES[2]]
+    },
+    {
+        "name": "Premium Long Sleeve Women's Tee",
+        "description": "Elegant long sleeve T-shirt. Premium cotton with comfortable stretch. Perfect for layering or standalone wear. Timeless design that never goes out of style.",
+        "price": 649.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["Black", "White", "Gray", "Navy"],
+        "stock": 95,
+        "images": [WOMENS_IMAGES[3]]
+    },
+    {
+        "name": "Fitted Women's Basic Tee",
+        "description": "Body-conscious fitted design. High-quality stretchable cotton fabric. Maintains shape after washing. Ideal for layering under jackets or wearing solo.",
+        "price": 499.0,
+        "sizes": ["XS", "S", "M", "L"],
+        "colors": ["Black", "White", "Red", "Royal Blue"],
+        "stock": 130,
+        "images": [WOMENS_IMAGES[4]]
+    },
+    {
+        "name": "Women's Oversized Comfort Tee",
+        "description": "Trendy oversized fit T-shirt. Relaxed and comfortable styling. Made from soft premium cotton. Perfect for contemporary casual look and loungewear.",
+        "price": 599.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["White", "Beige", "Sage Green", "Lavender"],
+        "stock": 110,
+        "images": [WOMENS_IMAGES[5]]
+    },
+    {
+        "name": "Scoop Neck Women's Tee",
+        "description": "Feminine scoop neckline T-shirt. Flattering cut with comfortable fit. Lightweight fabric perfect for warm weather. Versatile piece for various styling options.",
+        "price": 549.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["White", "Pink", "Coral", "Mint Green"],
+        "stock": 125,
+        "images": [WOMENS_IMAGES[6]]
+    },
+    {
+        "name": "Women's Crop Fit Tee",
+        "description": "Modern crop length T-shirt. Trendy design with comfortable fit. Made from soft cotton blend. Perfect for pairing with high-waist bottoms.",
+        "price": 599.0,
+        "sizes": ["XS", "S", "M", "L"],
+        "colors": ["Black", "White", "Pink", "Yellow"],
+        "stock": 100,
+        "images": [WOMENS_IMAGES[0], WOMENS_IMAGES[1]]
+    },
+    {
+        "name": "Premium Women's Polo Tee",
+        "description": "Sophisticated polo-style T-shirt for women. Features collar and quality buttons. Perfect for smart casual occasions. Premium knitted fabric with elegant finish.",
+        "price": 749.0,
+        "sizes": ["S", "M", "L", "XL"],
+        "colors": ["White", "Navy", "Black", "Red"],
+        "stock": 80,
+        "images": [WOMENS_IMAGES[2], WOMENS_IMAGES[3]]
+    },
+    {
+        "name": "Women's Striped Casual Tee",
+        "description": "Classic striped pattern T-shirt. Timeless design with modern fit. Soft cotton fabric with comfortable feel. Adds visual interest to casual outfits.",
+        "price": 549.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["Navy/White", "Black/White", "Red/White"],
+        "stock": 115,
+        "images": [WOMENS_IMAGES[4], WOMENS_IMAGES[5]]
+    },
+    {
+        "name": "Lightweight Summer Tee",
+        "description": "Ultra-lightweight T-shirt perfect for hot weather. Breathable fabric with excellent airflow. Quick-dry properties. Ideal for summer and tropical climates.",
+        "price": 499.0,
+        "sizes": ["XS", "S", "M", "L", "XL"],
+        "colors": ["White", "Sky Blue", "Mint", "Coral"],
+        "stock": 135,
+        "images": [WOMENS_IMAGES[6], WOMENS_IMAGES[0]]
+    },
+]
+
+# ==================== USER IMAGES ====================
+
+USER_IMAGES = [f"/api/images/product_{i:03d}.jpg" for i in range(1, 32)]
+
+# Product data with your uploaded images - Mixed gender categories
+USER_PRODUCTS = [
+    # Men's Products (Using first half of images)
+    {"name": "Classic Cotton Crew Neck", "category": "men", "price": 499, "desc": "Premium cotton everyday T-shirt. Comfortable fit perfect for daily wear. Made in Tiruppur with superior quality.", "images": [USER_IMAGES[0]]},
+    {"name": "Urban Graphic Tee", "category": "men", "price": 599, "desc": "Trendy graphic print T-shirt. Modern design with soft cotton fabric. Perfect for casual outings.", "images": [USER_IMAGES[1]]},
+    {"name": "Solid Black Essentials", "category": "men", "price": 449, "desc": "Wardrobe essential black T-shirt. Classic fit with reinforced stitching. Versatile and durable.", "images": [USER_IMAGES[2]]},
+    {"name": "Premium White Round Neck", "category": "men", "price": 549, "desc": "Crisp white cotton T-shirt. Professional quality with soft finish. Ideal for layering or standalone.", "images": [USER_IMAGES[3]]},
+    {"name": "Casual Comfort Fit", "category": "men", "price": 479, "desc": "Relaxed fit T-shirt for maximum comfort. Breathable fabric perfect for all-day wear.", "images": [USER_IMAGES[4]]},
+    {"name": "Statement Slogan Tee", "category": "men", "price": 629, "desc": "Bold slogan print T-shirt. Express yourself with style. Premium print quality that lasts.", "images": [USER_IMAGES[5]]},
+    {"name": "Vintage Wash Tee", "category": "men", "price": 699, "desc": "Pre-washed vintage style T-shirt. Unique character with soft hand feel. Trendy and comfortable.", "images": [USER_IMAGES[6]]},
+    {"name": "Athletic Performance Tee", "category": "men", "price": 749, "desc": "High-performance active wear T-shirt. Moisture-wicking fabric for sports and gym.", "images": [USER_IMAGES[7]]},
+    {"name": "Plain Navy Essential", "category": "men", "price": 429, "desc": "Classic navy blue T-shirt. Timeless color with quality fabric. Everyday essential.", "images": [USER_IMAGES[8]]},
+    {"name": "Slim Fit Modern Tee", "category": "men", "price": 599, "desc": "Contemporary slim fit design. Tailored cut without compromising comfort. Modern styling.", "images": [USER_IMAGES[9]]},
+    {"name": "Oversized Street Style", "category": "men", "price": 679, "desc": "Trendy oversized fit T-shirt. Urban streetwear aesthetic. Comfortable and stylish.", "images": [USER_IMAGES[10]]},
+    {"name": "Printed Graphic Design", "category": "men", "price": 649, "desc": "Eye-catching graphic print. Creative design with premium print quality. Stand out style.", "images": [USER_IMAGES[11]]},
+    {"name": "Basic Gray Melange", "category": "men", "price": 459, "desc": "Versatile gray melange T-shirt. Neutral tone perfect for any outfit. Quality basics.", "images": [USER_IMAGES[12]]},
+    {"name": "Polo Collar Style", "category": "men", "price": 799, "desc": "Semi-formal polo style T-shirt. Collar and button details. Smart casual wear.", "images": [USER_IMAGES[13]]},
+    {"name": "Henley Button Tee", "category": "men", "price": 729, "desc": "Stylish henley design with button placket. Adds detail to classic style. Versatile piece.", "images": [USER_IMAGES[14]]},
+    
+    # Women's Products (Using second half of images)
+    {"name": "Women's Soft Cotton Tee", "category": "women", "price": 499, "desc": "Ultra-soft cotton designed for women. Feminine fit with comfortable neckline. Perfect everyday wear.", "images": [USER_IMAGES[15]]},
+    {"name": "Elegant V-Neck Top", "category": "women", "price": 549, "desc": "Flattering V-neck design. Soft touch fabric with elegant drape. Versatile styling.", "images": [USER_IMAGES[16]]},
+    {"name": "Women's Crew Neck Classic", "category": "women", "price": 479, "desc": "Classic crew neck for women. Comfortable fit with quality stitching. Essential wardrobe piece.", "images": [USER_IMAGES[17]]},
+    {"name": "Fitted Women's Basic", "category": "women", "price": 519, "desc": "Body-conscious fitted design. Stretchable cotton fabric. Maintains shape beautifully.", "images": [USER_IMAGES[18]]},
+    {"name": "Oversized Comfort Tee", "category": "women", "price": 629, "desc": "Trendy oversized fit for women. Relaxed comfortable styling. Contemporary look.", "images": [USER_IMAGES[19]]},
+    {"name": "Scoop Neck Feminine Tee", "category": "women", "price": 549, "desc": "Feminine scoop neckline T-shirt. Flattering cut with soft fabric. Lightweight and breathable.", "images": [USER_IMAGES[20]]},
+    {"name": "Women's Crop Fit Top", "category": "women", "price": 599, "desc": "Modern crop length T-shirt. Trendy design for high-waist pairing. Stylish and comfortable.", "images": [USER_IMAGES[21]]},
+    {"name": "Premium Women's Polo", "category": "women", "price": 749, "desc": "Sophisticated polo style for women. Collar and button details. Smart casual elegance.", "images": [USER_IMAGES[22]]},
+    {"name": "Striped Casual Top", "category": "women", "price": 579, "desc": "Classic striped pattern. Timeless design with modern fit. Adds visual interest.", "images": [USER_IMAGES[23]]},
+    {"name": "Women's Long Sleeve", "category": "women", "price": 649, "desc": "Elegant long sleeve T-shirt. Premium cotton with stretch. Perfect for layering.", "images": [USER_IMAGES[24]]},
+    {"name": "Lightweight Summer Tee", "category": "women", "price": 499, "desc": "Ultra-lightweight for hot weather. Breathable with excellent airflow. Summer essential.", "images": [USER_IMAGES[25]]},
+    {"name": "Women's Graphic Print", "category": "women", "price": 629, "desc": "Stylish graphic print design. Creative and expressive. Premium print quality.", "images": [USER_IMAGES[26]]},
+    {"name": "Casual Round Neck Women's", "category": "women", "price": 479, "desc": "Comfortable round neck design. Relaxed fit for everyday wear. Soft and breathable.", "images": [USER_IMAGES[27]]},
+    {"name": "Premium Tank Style", "category": "women", "price": 449, "desc": "Stylish tank top design. Perfect for layering or solo wear. Lightweight fabric.", "images": [USER_IMAGES[28]]},
+    {"name": "Women's Printed Tee", "category": "women", "price": 599, "desc": "Beautiful printed T-shirt. Unique design with soft cotton. Express your style.", "images": [USER_IMAGES[29]]},
+    {"name": "Luxury Pima Cotton Women's", "category": "women", "price": 899, "desc": "Premium Pima cotton T-shirt. Extra-long staple for superior softness. Luxury quality.", "images": [USER_IMAGES[30]]},
+]
+
+USER_SIZES_MEN = ["S", "M", "L", "XL", "XXL"]
+USER_SIZES_WOMEN = ["XS", "S", "M", "L", "XL"]
+USER_COLORS = ["Black", "White", "Navy", "Gray", "Maroon", "Olive", "Blue", "Beige"]
@@ -1,27 +1,55 @@
-from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Form, Depends
+from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Form, Depends, Query, Request
 from fastapi.staticfiles import StaticFiles
+from fastapi.responses import Response, StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne, DeleteOne, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError, OperationFailure
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, TypeAdapter
 from typing import List, Optional
+from collections import Counter
 import uuid
-from datetime import datetime, timezone
+import asyncio
+import contextvars
+import hashlib
+import hmac
+from datetime import datetime, timezone, timedelta
 from passlib.context import CryptContext
 import jwt
 from PIL import Image
 import io
 import shutil
+from storage import build_storage
+from image_serving import ImageFileCache, ImageFileResponse, VARIANTS, safe_filename
+from image_features import image_features
+from resumable_uploads import UploadSessions
+from jobs import JobQueue
+from order_events import OrderEventBroker, format_sse
+from rate_limit import RateLimiter, MemoryBucketStore, MongoBucketStore
+from response_compression import CompressionMiddleware, CompressedPayload
+from cart_pricing import ProductLookup, price_cart
+from maintenance import Throttle, compact_carts, archive_orders, summarize_orders
+from order_partitions import OrderPartitions, order_summary
+from order_totals import OrderTotals
+from single_flight import SingleFlight
+from catalog_versions import CatalogVersions
+from catalog_snapshot import SnapshotStore, acquire_build_lock, write_snapshot
+from recommendations import CoOccurrenceModel
+from similarity import SimilarityIndex
+from command_stats import CommandStats, CommandStatsMiddleware
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# MongoDB connection
+# MongoDB connection; MONGO_COMMAND_STATS=1 counts the commands of every request per route
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+command_stats = CommandStats()
+COMMAND_STATS_ENABLED = os.environ.get("MONGO_COMMAND_STATS") == "1"
+client = AsyncIOMotorClient(mongo_url, event_listeners=[command_stats] if COMMAND_STATS_ENABLED else [])
 db = client[os.environ['DB_NAME']]
 
 # Password hashing
@@ -35,6 +63,58 @@ ALGORITHM = "HS256"
 UPLOAD_DIR = ROOT_DIR / "uploads" / "products"
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# Unreferenced content-addressed images are kept this long so an admin can attach
+# a fresh upload to a product before the garbage collector reclaims it
+IMAGE_GC_GRACE_SECONDS = int(os.environ.get("IMAGE_GC_GRACE_SECONDS", 3600))
+IMAGE_RECONCILE_INTERVAL_SECONDS = int(os.environ.get("IMAGE_RECONCILE_INTERVAL_SECONDS", 6 * 3600))
+
+# Filesystem by default; IMAGE_STORAGE=s3 moves images to an object store (see storage.py)
+storage = build_storage(UPLOAD_DIR)
+image_cache = ImageFileCache(
+    UPLOAD_DIR,
+    ttl=float(os.environ.get("IMAGE_STAT_CACHE_TTL", 60)),
+    immutable_ttl=float(os.environ.get("IMAGE_STAT_CACHE_IMMUTABLE_TTL", 600)),
+)
+
+# Resumable uploads are assembled here before processing (see resumable_uploads.py);
+# deliberately outside the statically served uploads directory
+UPLOAD_SESSIONS_DIR = ROOT_DIR / "cache" / "uploads"
+UPLOAD_SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
+upload_sessions = UploadSessions(
+    db.upload_sessions,
+    UPLOAD_SESSIONS_DIR,
+    max_size=int(os.environ.get("UPLOAD_MAX_BYTES", 200 * 1024 * 1024)),
+    chunk_size=int(os.environ.get("UPLOAD_CHUNK_BYTES", 8 * 1024 * 1024)),
+    ttl=timedelta(hours=float(os.environ.get("UPLOAD_SESSION_TTL_HOURS", 24))),
+)
+
+# Background jobs; JOB_QUEUE_DURABLE=1 keeps them in db.jobs so they survive restarts
+job_queue = JobQueue(
+    collection=db.jobs if os.environ.get("JOB_QUEUE_DURABLE") == "1" else None,
+    retention_seconds=float(os.environ.get("JOB_RETENTION_DAYS", 7)) * 24 * 3600
+)
+JOB_DRAIN_TIMEOUT_SECONDS = float(os.environ.get("JOB_DRAIN_TIMEOUT_SECONDS", 20))
+
+# Product writes are stamped for /api/products/changes
+catalog_versions = CatalogVersions(db, settle_seconds=float(os.environ.get("CATALOG_SETTLE_SECONDS", 5)))
+CATALOG_TOMBSTONE_DAYS = int(os.environ.get("CATALOG_TOMBSTONE_DAYS", 30))
+
+# Memory-mapped catalog shared by the workers of this host (see catalog_snapshot.py)
+CATALOG_SNAPSHOT_PATH = Path(os.environ.get("CATALOG_SNAPSHOT_PATH", ROOT_DIR / "cache" / "catalog.snap"))
+CATALOG_SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+CATALOG_SNAPSHOT_CHECK_SECONDS = float(os.environ.get("CATALOG_SNAPSHOT_CHECK_SECONDS", 30))
+catalog_snapshot = SnapshotStore(CATALOG_SNAPSHOT_PATH, check_interval=1.0)
+
+# Finished orders are archived into monthly collections (see order_partitions.py)
+order_partitions = OrderPartitions(db)
+
+# Running order counts and revenue for the admin dashboard (see order_totals.py)
+order_totals = OrderTotals(db.counters, db.orders, order_partitions)
+
+# Order status push for /api/orders/stream (see order_events.py)
+order_events = OrderEventBroker(db.orders, max_queue=int(os.environ.get("ORDER_STREAM_QUEUE_SIZE", 100)))
+ORDER_STREAM_HEARTBEAT_SECONDS = float(os.environ.get("ORDER_STREAM_HEARTBEAT_SECONDS", 15))
+
 # Create the main app
 app = FastAPI()
 
@@ -47,6 +127,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# gzip/br/zstd for JSON responses; cached endpoints serve precompressed CompressedPayloads
+app.add_middleware(CompressionMiddleware, minimum_size=int(os.environ.get("COMPRESSION_MIN_SIZE", 1024)))
+
+if COMMAND_STATS_ENABLED:
+    # Outermost, so the X-DB-Commands header survives compression
+    app.add_middleware(CommandStatsMiddleware, stats=command_stats)
+
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
 
@@ -83,12 +170,19 @@ class TokenResponse(BaseModel):
     token: str
     user: UserResponse
 
+class PaletteColor(BaseModel):
+    hex: str
+    share: float  # fraction of the opaque pixels
+
 class ImageMetadata(BaseModel):
     url: str
     filename: str
     size: int  # in bytes
     width: int
     height: int
+    # Computed at upload (see image_features.py); empty for older images
+    palette: List[PaletteColor] = []
+    blurhash: Optional[str] = None
 
 class ProductBase(BaseModel):
     name: str
@@ -107,6 +201,42 @@ class Product(ProductBase):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     images: List[ImageMetadata] = []
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    version: int = 0  # catalog version of the last write (see catalog_versions.py)
+
+class CatalogChanges(BaseModel):
+    version: int  # pass as `since` on the next call
+    changes: List[Product]
+    deleted: List[str]
+    has_more: bool
+    reset: bool  # deletions since `since` were pruned; reload with since=0
+    settling: bool = False  # newer writes are still landing; ask again in a few seconds
+
+class ProductChange(BaseModel):
+    id: str
+    price: Optional[float] = None
+    stock: Optional[int] = None
+
+class ProductFilter(BaseModel):
+    category: Optional[str] = None
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+
+class ProductBulkUpdate(BaseModel):
+    """Either per-product ``changes``, or a ``filter`` with the update for every match."""
+    changes: List[ProductChange] = []
+    filter: Optional[ProductFilter] = None
+    price_factor: Optional[float] = None  # 0.9 takes 10% off, rounded to the paisa
+    price: Optional[float] = None
+    stock: Optional[int] = None
+
+class BulkItemResult(BaseModel):
+    id: str
+    status: str  # updated, not_found, conflict or error
+    error: Optional[str] = None
+
+class BulkUpdateResult(BaseModel):
+    updated: int
+    results: List[BulkItemResult]
 
 class CartItem(BaseModel):
     product_id: str
@@ -116,7 +246,7 @@ class CartItem(BaseModel):
     price: float
 
 class CartBase(BaseModel):
-    user_id: str
+    user_id: Optional[str] = None  # None for guest carts
     items: List[CartItem] = []
 
 class Cart(CartBase):
@@ -124,6 +254,27 @@ class Cart(CartBase):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class CartLine(CartItem):
+    # price is the current catalog price; previous_price is set when it changed
+    product_name: Optional[str] = None
+    image: Optional[str] = None
+    previous_price: Optional[float] = None
+    available_quantity: int = 0
+    line_total: float
+    issues: List[str] = []  # unavailable, price_changed, out_of_stock, insufficient_stock, option_unavailable
+
+class CartSummary(BaseModel):
+    item_count: int
+    subtotal: float
+    shipping: float
+    total: float
+    price_changed: bool
+    can_checkout: bool
+
+class PricedCart(Cart):
+    items: List[CartLine] = []
+    summary: CartSummary
+
 class OrderItem(BaseModel):
     product_id: str
     product_name: str
@@ -148,12 +299,93 @@ class Order(BaseModel):
     payment_status: str = "pending"  # pending, completed
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class OrderSummary(BaseModel):
+    """An order as lists show it; the items come from the single-order endpoints."""
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    user_id: str
+    total_amount: float
+    status: str
+    payment_status: str
+    created_at: datetime
+    item_count: int = 0  # lines
+    quantity: int = 0  # units
+    first_item_name: Optional[str] = None
+    first_item_image: Optional[str] = None
+
+# Denormalized on every order document (see order_partitions.order_summary)
+ORDER_SUMMARY_PROJECTION = {"_id": 0, **{field: 1 for field in OrderSummary.model_fields}}
+# What an order status event carries
+ORDER_EVENT_PROJECTION = {"_id": 0, "id": 1, "user_id": 1, "status": 1, "payment_status": 1}
+
+class OrderStatusChange(BaseModel):
+    id: str
+    status: Optional[str] = None
+    payment_status: Optional[str] = None
+
+class OrderFilter(BaseModel):
+    status: Optional[str] = None
+    payment_status: Optional[str] = None
+    until: Optional[datetime] = None  # created before
+
+class OrderBulkUpdate(BaseModel):
+    """Either per-order ``changes``, or a ``filter`` with the statuses to set on every match."""
+    changes: List[OrderStatusChange] = []
+    filter: Optional[OrderFilter] = None
+    status: Optional[str] = None
+    payment_status: Optional[str] = None
+
 class Category(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     name: str
     type: str  # men or women
 
+class AdminSummary(BaseModel):
+    total_products: int
+    total_orders: int
+    total_users: int
+    total_revenue: float
+    pending_orders: int
+    orders_by_status: dict
+    generated_at: datetime
+
+class FeedProduct(BaseModel):
+    id: str
+    name: str
+    description: str
+    category: str
+    price: float
+    sizes: List[str] = []
+    colors: List[str] = []
+    stock: int = 0
+    images: List[ImageMetadata] = []
+
+class FeedSection(BaseModel):
+    key: str
+    title: str
+    products: List[FeedProduct]
+
+class HomeFeed(BaseModel):
+    sections: List[FeedSection]
+    generated_at: datetime
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class PriceBucket(BaseModel):
+    min: float
+    max: Optional[float] = None  # None for the open-ended top bucket
+    count: int
+
+class ProductFacets(BaseModel):
+    total: int
+    category: List[FacetCount]
+    sizes: List[FacetCount]
+    colors: List[FacetCount]
+    price: List[PriceBucket]
+
 # ==================== HELPER FUNCTIONS ====================
 
 def hash_password(password: str) -> str:
@@ -183,25 +415,336 @@ async def get_current_user(token: str) -> dict:
         raise HTTPException(status_code=401, detail="User not found")
     return user
 
-# ==================== AUTH ROUTES ====================
+def sign_guest_cart_id(cart_id: str) -> str:
+    signature = hmac.new(SECRET_KEY.encode(), cart_id.encode(), hashlib.sha256).hexdigest()[:32]
+    return f"{cart_id}.{signature}"
 
-@api_router.post("/auth/register", response_model=TokenResponse)
-async def register(user_data: UserRegister):
-    # Check if user exists
-    existing = await db.users.find_one({"email": user_data.email})
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
+def verify_guest_cart_id(signed: str) -> Optional[str]:
+    """Cart id from a signed guest cart id, or None if the signature does not match."""
+    cart_id, _, _ = signed.rpartition(".")
+    if cart_id and hmac.compare_digest(sign_guest_cart_id(cart_id), signed):
+        return cart_id
+    return None
+
+def token_user_id(token: str) -> Optional[str]:
+    """User id from a token without the database lookup, or None if the token is invalid."""
+    try:
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]).get("user_id")
+    except jwt.PyJWTError:
+        return None
+
+# ==================== RATE LIMITING ====================
+
+# Buckets are per API process unless RATE_LIMIT_STORE=mongo shares them via db.rate_limits
+rate_limiter = RateLimiter(
+    MongoBucketStore(db.rate_limits) if os.environ.get("RATE_LIMIT_STORE") == "mongo" else MemoryBucketStore(),
+    identify=token_user_id,
+    trust_forwarded_for=os.environ.get("TRUST_FORWARDED_FOR") == "1",
+    enabled=os.environ.get("RATE_LIMIT_ENABLED", "1") == "1",
+)
+
+def has_search(request: Request) -> bool:
+    return bool(request.query_params.get("search"))
+
+# Login and registration run bcrypt: limit attempts per IP and hashes in flight
+AUTH_RATE_LIMIT = Depends(rate_limiter.limit("auth", rate=10 / 60, burst=10, by_ip=True))
+PASSWORD_HASH_SLOTS = Depends(rate_limiter.concurrency("password_hash", 4))
+# Text search is a regex scan over the products collection
+SEARCH_RATE_LIMIT = Depends(rate_limiter.limit("search", rate=2, burst=10, when=has_search))
+SEARCH_SLOTS = Depends(rate_limiter.concurrency("search", 8, when=has_search))
+IMAGE_UPLOAD_SLOTS = Depends(rate_limiter.concurrency("image_upload", 4))
+CHECKOUT_RATE_LIMIT = Depends(rate_limiter.limit("checkout", rate=1, burst=5))
+
+# ==================== IMAGE STORAGE ====================
+
+# The formats uploads are stored in; anything else is rejected
+IMAGE_EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "GIF": "gif", "WEBP": "webp"}
+# Formats PIL reports for files browsers read as one of the above (MPO: JPEG with extra frames)
+IMAGE_FORMAT_ALIASES = {"MPO": "JPEG"}
+
+def content_filename(digest: str, image_format: str) -> str:
+    """Name an image after the SHA-256 of its stored bytes so identical uploads share one file."""
+    return f"{digest}.{IMAGE_EXTENSIONS[image_format]}"
+
+def _hash_file(fileobj) -> tuple:
+    digest = hashlib.sha256()
+    size = 0
+    fileobj.seek(0)
+    while chunk := fileobj.read(1024 * 1024):
+        digest.update(chunk)
+        size += len(chunk)
+    fileobj.seek(0)
+    return digest.hexdigest(), size
+
+def image_url(filename: str, local_url: str) -> str:
+    """Public object-store URL when there is one, else the API/static route for this node."""
+    public = storage.public_url(filename)
+    if public:
+        return public
+    if storage.local_path(filename) is None:
+        # Remote backend without a public URL: /api/images redirects to a presigned URL
+        return f"/api/images/{filename}"
+    return local_url
+
+async def register_image(filename: str, size: int, width: int, height: int) -> bool:
+    """Record a stored file; True if the record is new."""
+    result = await db.images.update_one(
+        {"filename": filename},
+        {
+            "$setOnInsert": {
+                "filename": filename,
+                "size": size,
+                "width": width,
+                "height": height,
+                "refcount": 0
+            },
+            # Re-uploading restarts the grace period of a file about to be collected
+            "$set": {"uploaded_at": datetime.now(timezone.utc).isoformat()}
+        },
+        upsert=True
+    )
+    return result.upserted_id is not None
+
+async def store_image(contents: bytes, image_format: str, width: int, height: int) -> str:
+    """Write normalized image bytes once and register them in ``db.images``."""
+    filename = content_filename(hashlib.sha256(contents).hexdigest(), image_format)
+
+    async def save():
+        await storage.save(filename, contents, Image.MIME[image_format])
+        image_cache.invalidate(filename)
+
+    await save_then_register(filename, save, len(contents), width, height)
+    return filename
+
+async def store_image_file(fileobj, image_format: str, width: int, height: int) -> tuple:
+    """Like ``store_image`` but streams from a file object; returns ``(filename, size)``."""
+    digest, size = await asyncio.to_thread(_hash_file, fileobj)
+    filename = content_filename(digest, image_format)
+
+    async def save():
+        fileobj.seek(0)
+        await storage.save_file(filename, fileobj, Image.MIME[image_format])
+        image_cache.invalidate(filename)
+
+    await save_then_register(filename, save, size, width, height)
+    return filename, size
+
+async def save_then_register(filename: str, save, size: int, width: int, height: int):
+    # The file exists before its record, so reconcile_images never sees a record without one
+    saved = False
+    if not await storage.exists(filename):
+        await save()
+        saved = True
+    if await register_image(filename, size, width, height) and not saved:
+        # A new record for a file that was already there: it may be an orphan collected
+        # between the two calls, so write the bytes again
+        await save()
+
+def variant_filenames(filename: str) -> List[str]:
+    stem = filename.rsplit(".", 1)[0]
+    return [stem + ext for _, ext in VARIANTS]
+
+def encode_webp_variant(contents: bytes) -> bytes:
+    img = Image.open(io.BytesIO(contents))
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+    output = io.BytesIO()
+    img.save(output, format='WEBP', quality=80, method=4)
+    return output.getvalue()
+
+def normalize_upload(fileobj, max_size: int = 1200) -> tuple:
+    """Validate an upload and downscale it if too large; returns ``(resized, format, width, height)``.
+
+    ``resized`` is the re-encoded image, or None when the file can be stored as it is.
+    """
+    fileobj.seek(0)
+    img = Image.open(fileobj)
+    width, height = img.size
+    image_format = IMAGE_FORMAT_ALIASES.get(img.format, img.format)
+    if image_format not in IMAGE_EXTENSIONS:
+        raise ValueError(f"unsupported format {img.format}")
+    resized = None
+    
+    if width > max_size or height > max_size:
+        # Let the JPEG decoder skip detail the thumbnail would throw away anyway
+        img.draft("RGB", (max_size, max_size))
+        img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        # Save resized image
+        output = io.BytesIO()
+        img.convert("RGB").save(output, format='JPEG', quality=85)
+        resized = output.getvalue()
+        image_format = 'JPEG'
+        width, height = img.size
+    
+    fileobj.seek(0)
+    return resized, image_format, width, height
+
+async def ingest_upload(fileobj) -> dict:
+    """Resize, analyse and store an uploaded image file; returns its metadata."""
+    # Decoding and resizing run in a worker thread. The resize stays in the request
+    # because the returned filename is the hash of its output.
+    try:
+        resized, image_format, width, height = await asyncio.to_thread(normalize_upload, fileobj)
+        source = io.BytesIO(resized) if resized is not None else fileobj
+        features = await asyncio.to_thread(image_features, source)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid image file: {str(e)}")
+    
+    # Content-addressed filename: the same photo uploaded twice maps to one file
+    if resized is not None:
+        filename, size = await store_image(resized, image_format, width, height), len(resized)
+    else:
+        filename, size = await store_image_file(fileobj, image_format, width, height)
+    
+    if image_format in ("JPEG", "PNG"):
+        await job_queue.enqueue("image_variants", {"filename": filename})
+    
+    return {
+        "url": image_url(filename, f"/api/images/{filename}"),
+        "filename": filename,
+        "size": size,
+        "width": width,
+        "height": height,
+        **features
+    }
+
+def image_filenames(images: Optional[list]) -> Counter:
+    return Counter(img["filename"] for img in images or [] if img.get("filename"))
+
+async def update_image_refs(old_images: Optional[list], new_images: Optional[list]):
+    """Apply the refcount difference between two ``images`` lists and collect released files."""
+    delta = image_filenames(new_images)
+    delta.subtract(image_filenames(old_images))
+    ops = [UpdateOne({"filename": name}, {"$inc": {"refcount": n}}) for name, n in delta.items() if n]
+    if ops:
+        await db.images.bulk_write(ops, ordered=False)
+    released = [name for name, n in delta.items() if n < 0]
+    if released:
+        await collect_orphaned_images(released)
+
+async def collect_orphaned_images(filenames: Optional[List[str]] = None) -> int:
+    """Delete registered images that no product references once their grace period is over."""
+    cutoff = (datetime.now(timezone.utc) - timedelta(seconds=IMAGE_GC_GRACE_SECONDS)).isoformat()
+    query = {"refcount": {"$lte": 0}, "uploaded_at": {"$lt": cutoff}}
+    if filenames is not None:
+        query["filename"] = {"$in": filenames}
+
+    removed = 0
+    async for record in db.images.find(query, {"_id": 0, "filename": 1}):
+        if await db.products.find_one({"images.filename": record["filename"]}, {"_id": 1}):
+            # Still used: a product write's refcount update has not landed yet, or reconciliation
+            # ran between a product write and its update; the next reconciliation corrects it
+            continue
+        # Re-check the condition atomically so a racing upload or product write wins
+        deleted = await db.images.find_one_and_delete({**query, "filename": record["filename"]})
+        if deleted:
+            for key in [record["filename"], *variant_filenames(record["filename"])]:
+                await storage.delete(key)
+            image_cache.invalidate(record["filename"])
+            removed += 1
+    return removed
+
+async def reconcile_images() -> dict:
+    """Recompute refcounts from products, drop records of missing files and collect orphans."""
+    # Records first: files are saved before they are registered, so every record read
+    # here has its file in the listing below unless the file is really gone
+    records = await db.images.find({}, {"_id": 0, "filename": 1, "refcount": 1}).to_list(None)
+    stored = set(await storage.list_keys())
+
+    references = {}
+    pipeline = [
+        {"$unwind": "$images"},
+        {"$group": {"_id": "$images.filename", "count": {"$sum": 1}}}
+    ]
+    async for row in db.products.aggregate(pipeline):
+        if row["_id"]:
+            references[row["_id"]] = row["count"]
+
+    registered = set()
+    ops = []
+    for record in records:
+        name = record["filename"]
+        if name not in stored:
+            ops.append(DeleteOne({"filename": name}))
+            continue
+        registered.add(name)
+        if record.get("refcount") != references.get(name, 0):
+            # Compare-and-set: a product write that moved the count since it was read wins,
+            # and the next run corrects the record
+            ops.append(UpdateOne(
+                {"filename": name, "refcount": record.get("refcount")},
+                {"$set": {"refcount": references.get(name, 0)}}
+            ))
+    if ops:
+        await db.images.bulk_write(ops, ordered=False)
+
+    collected = await collect_orphaned_images()
+    # Files outside the registry predate content addressing (seeded images, old uploads);
+    # they are reported rather than deleted
+    variants = {name for key in registered for name in variant_filenames(key)}
+    untracked = len(stored - registered - variants - set(references))
+    summary = {"fixed": len(ops), "collected": collected, "untracked": untracked}
+    logger.info("Image reconciliation: %s", summary)
+    return summary
+
+async def image_reconcile_loop():
+    while True:
+        try:
+            await reconcile_images()
+        except Exception:
+            logger.exception("Image reconciliation failed")
+        await asyncio.sleep(IMAGE_RECONCILE_INTERVAL_SECONDS)
+
+# ==================== BACKGROUND TASKS & CATALOG HOOKS ====================
+
+background_tasks = set()
+catalog_change_listeners = []
+
+def run_in_background(coro, name: str) -> asyncio.Task:
+    """Start a fire-and-forget task, keep a reference to it and log its failure."""
+    # Not counted as part of the request that happened to start it
+    context = contextvars.copy_context()
+    context.run(command_stats.detach)
+    task = asyncio.create_task(coro, name=name, context=context)
+    background_tasks.add(task)
+    
+    def done(t: asyncio.Task):
+        background_tasks.discard(t)
+        if not t.cancelled() and t.exception() is not None:
+            logger.error("Background task %s failed", name, exc_info=t.exception())
     
-    # Create user
+    task.add_done_callback(done)
+    return task
+
+def on_catalog_change(listener):
+    """Register a callable invoked (synchronously, must not block) after admin product writes."""
+    catalog_change_listeners.append(listener)
+    return listener
+
+def catalog_changed():
+    for listener in catalog_change_listeners:
+        listener()
+
+# ==================== AUTH ROUTES ====================
+
+@api_router.post("/auth/register", response_model=TokenResponse, dependencies=[AUTH_RATE_LIMIT, PASSWORD_HASH_SLOTS])
+async def register(user_data: UserRegister, guest_cart: Optional[str] = None):
+    # Create user; the unique email index rejects an existing address
     user_dict = user_data.model_dump()
-    user_dict["password"] = hash_password(user_dict["password"])
+    user_dict["password"] = await asyncio.to_thread(hash_password, user_dict["password"])
     user = User(**{k: v for k, v in user_dict.items() if k != "password"})
     
     doc = user.model_dump()
     doc["password"] = user_dict["password"]
     doc["created_at"] = doc["created_at"].isoformat()
     
-    await db.users.insert_one(doc)
+    try:
+        await db.users.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    
+    if guest_cart:
+        await merge_guest_cart(guest_cart, user.id)
     
     token = create_token(user.id, user.email, user.role)
     
@@ -210,12 +753,15 @@ async def register(user_data: UserRegister):
         user=UserResponse(**user.model_dump())
     )
 
-@api_router.post("/auth/login", response_model=TokenResponse)
-async def login(credentials: UserLogin):
+@api_router.post("/auth/login", response_model=TokenResponse, dependencies=[AUTH_RATE_LIMIT, PASSWORD_HASH_SLOTS])
+async def login(credentials: UserLogin, guest_cart: Optional[str] = None):
     user = await db.users.find_one({"email": credentials.email}, {"_id": 0})
-    if not user or not verify_password(credentials.password, user["password"]):
+    if not user or not await asyncio.to_thread(verify_password, credentials.password, user["password"]):
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
+    if guest_cart:
+        await merge_guest_cart(guest_cart, user["id"])
+    
     token = create_token(user["id"], user["email"], user["role"])
     
     return TokenResponse(
@@ -233,25 +779,33 @@ async def update_profile(token: str, update_data: UserBase):
     user = await get_current_user(token)
     
     update_dict = update_data.model_dump()
-    await db.users.update_one(
-        {"id": user["id"]},
-        {"$set": update_dict}
-    )
+    try:
+        updated_user = await db.users.find_one_and_update(
+            {"id": user["id"]},
+            {"$set": update_dict},
+            projection={"_id": 0, "password": 0},
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
     
-    updated_user = await db.users.find_one({"id": user["id"]}, {"_id": 0})
-    return UserResponse(**{k: v for k, v in updated_user.items() if k != "password"})
+    if updated_user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return UserResponse(**updated_user)
 
 # ==================== PRODUCT ROUTES ====================
 
-@api_router.get("/products", response_model=List[Product])
-async def get_products(
+# Lower bounds of the price facet buckets; the last bucket is open-ended
+PRICE_FACET_BOUNDARIES = [0, 500, 750, 1000, 1500]
+
+def build_product_query(
     category: Optional[str] = None,
     size: Optional[str] = None,
     color: Optional[str] = None,
     min_price: Optional[float] = None,
     max_price: Optional[float] = None,
     search: Optional[str] = None
-):
+) -> dict:
     query = {}
     
     if category:
@@ -272,16 +826,165 @@ async def get_products(
             {"description": {"$regex": search, "$options": "i"}}
         ]
     
-    products = await db.products.find(query, {"_id": 0}).to_list(1000)
+    return query
+
+# Identical concurrent product listings share one query and one serialized body
+PRODUCT_LIST_CACHE_SECONDS = float(os.environ.get("PRODUCT_LIST_CACHE_SECONDS", 1))
+# Listings return at most this many products, from MongoDB or the snapshot
+PRODUCT_LIST_MAX = 1000
+product_list_flight = SingleFlight(ttl=PRODUCT_LIST_CACHE_SECONDS)
+# Listings from a snapshot cannot change until it is replaced, so they are kept longer
+snapshot_list_flight = SingleFlight(
+    ttl=float(os.environ.get("SNAPSHOT_LIST_CACHE_SECONDS", 300)),
+    max_entries=int(os.environ.get("SNAPSHOT_LIST_CACHE_ENTRIES", 256))
+)
+_product_list = TypeAdapter(List[Product])
+
+@on_catalog_change
+def clear_product_list_flight():
+    product_list_flight.clear()
+    snapshot_list_flight.clear()
+
+def product_list_payload(body: bytes) -> CompressedPayload:
+    return CompressedPayload(body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+
+async def load_product_list(query: dict) -> CompressedPayload:
+    products = await db.products.find(query, {"_id": 0}).to_list(PRODUCT_LIST_MAX)
     
     for product in products:
         if isinstance(product.get("created_at"), str):
             product["created_at"] = datetime.fromisoformat(product["created_at"])
     
-    return products
+    body = _product_list.dump_json(_product_list.validate_python(products))
+    # Not precompressed: entries live about a second, the middleware compresses per request
+    return product_list_payload(body)
+
+async def load_snapshot_product_list(category: Optional[str], min_price: Optional[float],
+                                     max_price: Optional[float]) -> CompressedPayload:
+    # Runs as its own task, after the request's await: a refresh in between may have
+    # closed the mapping the request saw, so read whichever is live now
+    snapshot = catalog_snapshot.current()
+    if snapshot is None:
+        return await load_product_list(build_product_query(category, min_price=min_price, max_price=max_price))
+    payload = product_list_payload(snapshot.products(category, min_price, max_price, PRODUCT_LIST_MAX))
+    # Served as-is (the middleware compresses) until the stored encodings are ready
+    run_in_background(payload.precompress(), "product-list-precompress")
+    return payload
+
+@api_router.get("/products", response_model=List[Product], dependencies=[SEARCH_RATE_LIMIT, SEARCH_SLOTS])
+async def get_products(
+    request: Request,
+    category: Optional[str] = None,
+    size: Optional[str] = None,
+    color: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    search: Optional[str] = None
+):
+    # Normalized key: parameter order and spelling of the URL do not matter
+    key = (category or None, size or None, color or None, min_price, max_price, search or None)
+    
+    snapshot = catalog_snapshot.current()
+    if snapshot is not None and not (size or color or search):
+        # Category and price ranges are answered from the snapshot's indexes
+        payload = await snapshot_list_flight.get(
+            (snapshot.inode, *key),
+            lambda: load_snapshot_product_list(category or None, min_price, max_price)
+        )
+        return payload.response(request)
+    
+    query = build_product_query(category, size, color, min_price, max_price, search)
+    payload = await product_list_flight.get(key, lambda: load_product_list(query))
+    return payload.response(request)
+
+@api_router.get("/products/facets", response_model=ProductFacets, dependencies=[SEARCH_RATE_LIMIT, SEARCH_SLOTS])
+async def get_product_facets(
+    category: Optional[str] = None,
+    size: Optional[str] = None,
+    color: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    search: Optional[str] = None
+):
+    """Per-facet counts for the current filters in one ``$facet`` aggregation.
+
+    Each facet ignores its own filter (but applies all others), so the counts show
+    what selecting another value of that facet would return.
+    """
+    selected = {"category": category, "sizes": size, "colors": color}
+    # Filters no facet is computed for are applied once, before the $facet stage
+    base = build_product_query(min_price=min_price, max_price=max_price, search=search)
+    price_query = build_product_query(search=search)
+    
+    def others(field: str) -> dict:
+        return {k: v for k, v in selected.items() if v and k != field}
+    
+    def value_counts(field: str) -> list:
+        stages = [{"$match": others(field)}]
+        if field != "category":
+            stages.append({"$unwind": f"${field}"})
+        return stages + [
+            {"$group": {"_id": f"${field}", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1, "_id": 1}}
+        ]
+    
+    pipeline = [
+        {"$match": price_query},
+        {"$facet": {
+            "total": [{"$match": {**base, **others(None)}}, {"$count": "count"}],
+            "category": [{"$match": base}] + value_counts("category"),
+            "sizes": [{"$match": base}] + value_counts("sizes"),
+            "colors": [{"$match": base}] + value_counts("colors"),
+            # Price buckets ignore the price range but apply every other filter
+            "price": [
+                {"$match": others(None)},
+                {"$bucket": {
+                    "groupBy": "$price",
+                    "boundaries": PRICE_FACET_BOUNDARIES + [float("inf")],
+                    "default": "other",
+                    "output": {"count": {"$sum": 1}}
+                }}
+            ]
+        }}
+    ]
+    
+    result = (await db.products.aggregate(pipeline).to_list(1))[0]
+    boundaries = PRICE_FACET_BOUNDARIES + [None]
+    
+    return ProductFacets(
+        total=result["total"][0]["count"] if result["total"] else 0,
+        category=[FacetCount(value=row["_id"], count=row["count"]) for row in result["category"] if row["_id"]],
+        sizes=[FacetCount(value=row["_id"], count=row["count"]) for row in result["sizes"] if row["_id"]],
+        colors=[FacetCount(value=row["_id"], count=row["count"]) for row in result["colors"] if row["_id"]],
+        price=[
+            PriceBucket(min=row["_id"], max=boundaries[boundaries.index(row["_id"]) + 1], count=row["count"])
+            for row in result["price"] if row["_id"] != "other"
+        ]
+    )
+
+CATALOG_CHANGES_MAX = 1000
+
+@api_router.get("/products/changes", response_model=CatalogChanges)
+async def get_catalog_changes(since: int = 0, limit: int = CATALOG_CHANGES_MAX):
+    """Products changed and ids deleted after catalog version ``since``, oldest first.
+
+    ``since=0`` returns the whole catalog. Keep calling with the returned ``version``
+    while ``has_more`` is true.
+    """
+    changes = await catalog_versions.changes(since, max(1, min(limit, CATALOG_CHANGES_MAX)))
+    for product in changes["changes"]:
+        if isinstance(product.get("created_at"), str):
+            product["created_at"] = datetime.fromisoformat(product["created_at"])
+    return changes
 
 @api_router.get("/products/{product_id}", response_model=Product)
 async def get_product(product_id: str):
+    snapshot = catalog_snapshot.current()
+    body = snapshot.product(product_id) if snapshot is not None else None
+    if body is not None:
+        return Response(content=body, media_type="application/json")
+    
+    # Not in the snapshot, possibly because it was created after the last build
     product = await db.products.find_one({"id": product_id}, {"_id": 0})
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
@@ -291,17 +994,52 @@ async def get_product(product_id: str):
     
     return product
 
+async def products_in_order(product_id: str, related: Optional[List[str]], limit: int):
+    """Products for precomputed neighbour ids, from the snapshot when it has them all."""
+    if related is None:
+        # Created after the last refresh, or the model is still being built
+        if await db.products.find_one({"id": product_id}, {"_id": 1}) is None:
+            raise HTTPException(status_code=404, detail="Product not found")
+        related = []
+    related = related[:max(0, limit)]
+    
+    snapshot = catalog_snapshot.current()
+    if snapshot is not None:
+        bodies = [snapshot.product(related_id) for related_id in related]
+        if all(body is not None for body in bodies):
+            return Response(content=b"[" + b",".join(bodies) + b"]", media_type="application/json")
+    
+    found = {p["id"]: p async for p in db.products.find({"id": {"$in": related}}, {"_id": 0})}
+    products = [found[related_id] for related_id in related if related_id in found]
+    for product in products:
+        if isinstance(product.get("created_at"), str):
+            product["created_at"] = datetime.fromisoformat(product["created_at"])
+    return products
+
+@api_router.get("/products/{product_id}/related", response_model=List[Product])
+async def get_related_products(product_id: str, limit: int = 8):
+    """Products often bought together with this one, topped up with similar ones."""
+    return await products_in_order(product_id, recommender.get(product_id), limit)
+
+@api_router.get("/products/{product_id}/similar", response_model=List[Product])
+async def get_similar_products(product_id: str, limit: int = 8):
+    """Products with the most similar name, description, colors, category and price."""
+    return await products_in_order(product_id, similarity_index.get(product_id), limit)
+
 @api_router.post("/admin/products", response_model=Product)
 async def create_product(token: str, product_data: ProductCreate):
     user = await get_current_user(token)
     if user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    product = Product(**product_data.model_dump())
-    doc = product.model_dump()
+    stamp = await catalog_versions.next()
+    product = Product(**product_data.model_dump(), version=stamp["version"])
+    doc = {**product.model_dump(), **stamp}
     doc["created_at"] = doc["created_at"].isoformat()
     
     await db.products.insert_one(doc)
+    await update_image_refs([], doc["images"])
+    catalog_changed()
     return product
 
 @api_router.put("/admin/products/{product_id}", response_model=Product)
@@ -310,16 +1048,24 @@ async def update_product(token: str, product_id: str, product_data: ProductCreat
     if user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    update_dict = product_data.model_dump()
-    result = await db.products.update_one(
+    update_dict = {**product_data.model_dump(), **await catalog_versions.next()}
+    # The previous images are needed for the reference counts. The $set covers every
+    # editable field, so the stored product is the previous document with it applied:
+    # no second read, and no chance of returning another writer's later update.
+    previous = await db.products.find_one_and_update(
         {"id": product_id},
-        {"$set": update_dict}
+        {"$set": update_dict},
+        projection={"_id": 0},
+        return_document=ReturnDocument.BEFORE
     )
     
-    if result.matched_count == 0:
+    if previous is None:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    updated_product = await db.products.find_one({"id": product_id}, {"_id": 0})
+    await update_image_refs(previous.get("images"), update_dict["images"])
+    catalog_changed()
+    
+    updated_product = {**previous, **update_dict}
     if isinstance(updated_product.get("created_at"), str):
         updated_product["created_at"] = datetime.fromisoformat(updated_product["created_at"])
     
@@ -331,101 +1077,393 @@ async def delete_product(token: str, product_id: str):
     if user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    result = await db.products.delete_one({"id": product_id})
-    if result.deleted_count == 0:
+    deleted = await db.products.find_one_and_delete({"id": product_id}, projection={"_id": 0, "images": 1})
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Product not found")
     
+    await catalog_versions.tombstone(product_id, await catalog_versions.next())
+    await update_image_refs(deleted.get("images"), [])
+    catalog_changed()
+    
     return {"message": "Product deleted successfully"}
 
-@api_router.post("/admin/products/{product_id}/images")
+@api_router.post("/admin/products/{product_id}/images", dependencies=[IMAGE_UPLOAD_SLOTS])
 async def upload_product_image(token: str, product_id: str, file: UploadFile = File(...)):
     user = await get_current_user(token)
     if user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    # Read and validate image
-    contents = await file.read()
+    # Validate image from its header only; the upload stays in the spooled temp file
     try:
-        img = Image.open(io.BytesIO(contents))
+        img = Image.open(file.file)
         width, height = img.size
     except:
         raise HTTPException(status_code=400, detail="Invalid image file")
     
-    # Save image
-    filename = f"{uuid.uuid4()}_{file.filename}"
-    file_path = UPLOAD_DIR / filename
+    # Decodes a downscaled copy only (JPEG draft mode), off the event loop
+    try:
+        features = await asyncio.to_thread(image_features, file.file)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid image file")
     
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Stream the image into storage (identical bytes are stored once)
+    filename, size = await store_image_file(file.file, img.format, width, height)
     
     # Create metadata
     image_meta = ImageMetadata(
-        url=f"/uploads/products/{filename}",
+        url=image_url(filename, f"/uploads/products/{filename}"),
         filename=filename,
-        size=len(contents),
+        size=size,
         width=width,
-        height=height
+        height=height,
+        **features
     )
     
     # Update product
-    await db.products.update_one(
+    result = await db.products.update_one(
         {"id": product_id},
-        {"$push": {"images": image_meta.model_dump()}}
+        {"$push": {"images": image_meta.model_dump()}, "$set": await catalog_versions.next()}
     )
+    if result.matched_count == 0:
+        raise HTTPException(status_code=404, detail="Product not found")
+    
+    await update_image_refs([], [image_meta.model_dump()])
+    catalog_changed()
     
     return image_meta
 
-# ==================== CART ROUTES ====================
+@api_router.delete("/admin/products/{product_id}/images/{filename}")
+async def remove_product_image(token: str, product_id: str, filename: str):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    previous = await db.products.find_one_and_update(
+        {"id": product_id},
+        {"$pull": {"images": {"filename": filename}}, "$set": await catalog_versions.next()},
+        projection={"_id": 0, "images": 1},
+        return_document=ReturnDocument.BEFORE
+    )
+    if previous is None:
+        raise HTTPException(status_code=404, detail="Product not found")
+    
+    removed = [img for img in previous.get("images", []) if img.get("filename") == filename]
+    if not removed:
+        raise HTTPException(status_code=404, detail="Image not found")
+    
+    await update_image_refs(removed, [])
+    catalog_changed()
+    
+    return {"message": "Image removed"}
+
+# Bulk edits: one request, one unordered bulk_write, one catalog change notification
+BULK_UPDATE_MAX = int(os.environ.get("BULK_UPDATE_MAX", 10000))
 
-@api_router.get("/cart", response_model=Cart)
-async def get_cart(token: str):
+async def bulk_update(collection, ops: List[UpdateOne]) -> tuple:
+    """Run updates as one unordered bulk write; returns ``(matched, {op index: error})``."""
+    try:
+        result = await collection.bulk_write(ops, ordered=False)
+        return result.matched_count, {}
+    except BulkWriteError as e:
+        return e.details["nMatched"], {error["index"]: error["errmsg"] for error in e.details["writeErrors"]}
+
+def bulk_results(ids: List[str], errors: dict, missing: set, status: str = "not_found") -> List[BulkItemResult]:
+    results = []
+    for index, target_id in enumerate(ids):
+        if index in errors:
+            results.append(BulkItemResult(id=target_id, status="error", error=errors[index]))
+        elif target_id in missing:
+            results.append(BulkItemResult(id=target_id, status=status))
+        else:
+            results.append(BulkItemResult(id=target_id, status="updated"))
+    return results
+
+@api_router.post("/admin/products/bulk", response_model=BulkUpdateResult)
+async def bulk_update_products(token: str, update: ProductBulkUpdate):
+    """Change prices and stock of many products, listed or selected by a filter."""
     user = await get_current_user(token)
-    cart = await db.carts.find_one({"user_id": user["id"]}, {"_id": 0})
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    # id -> (fields to set, filter guard)
+    targets = {}
+    if update.filter is not None:
+        if update.changes:
+            raise HTTPException(status_code=400, detail="Send either changes or a filter, not both")
+        if update.price_factor is None and update.price is None and update.stock is None:
+            raise HTTPException(status_code=400, detail="Nothing to update")
+        if update.price_factor is not None and update.price is not None:
+            raise HTTPException(status_code=400, detail="Send price_factor or price, not both")
+        query = {}
+        if update.filter.category:
+            query["category"] = update.filter.category
+        if update.filter.min_price is not None or update.filter.max_price is not None:
+            query["price"] = {}
+            if update.filter.min_price is not None:
+                query["price"]["$gte"] = update.filter.min_price
+            if update.filter.max_price is not None:
+                query["price"]["$lte"] = update.filter.max_price
+        matches = await db.products.find(query, {"_id": 0, "id": 1, "price": 1}).to_list(BULK_UPDATE_MAX + 1)
+        if len(matches) > BULK_UPDATE_MAX:
+            raise HTTPException(status_code=413, detail=f"The filter matches more than {BULK_UPDATE_MAX} products")
+        for product in matches:
+            fields, guard = {}, {}
+            if update.price_factor is not None:
+                fields["price"] = round(product["price"] * update.price_factor, 2)
+                # Computed from the price read above; a product repriced meanwhile is left alone
+                guard["price"] = product["price"]
+            elif update.price is not None:
+                fields["price"] = update.price
+            if update.stock is not None:
+                fields["stock"] = update.stock
+            targets[product["id"]] = (fields, guard)
+    else:
+        for change in update.changes:
+            fields = change.model_dump(exclude={"id"}, exclude_none=True)
+            if fields:
+                # A product listed twice gets both changes, the later one winning
+                targets.setdefault(change.id, ({}, {}))[0].update(fields)
+    
+    if len(targets) > BULK_UPDATE_MAX:
+        raise HTTPException(status_code=413, detail=f"At most {BULK_UPDATE_MAX} products per request")
+    if any(fields.get("price", 0) < 0 or fields.get("stock", 0) < 0 for fields, _ in targets.values()):
+        raise HTTPException(status_code=400, detail="Prices and stock cannot be negative")
+    if not targets:
+        return BulkUpdateResult(updated=0, results=[])
+    
+    # One counter step for the whole batch, still a distinct version per product
+    ids = list(targets)
+    stamps = dict(zip(ids, await catalog_versions.stamps(len(ids))))
+    ops = [
+        UpdateOne({"id": product_id, **guard}, {"$set": {**fields, **stamps[product_id]}})
+        for product_id, (fields, guard) in targets.items()
+    ]
+    matched, errors = await bulk_update(db.products, ops)
+    
+    missing, conflicts = set(), set()
+    if matched < len(ops) - len(errors):
+        # Only when something did not match: find out which, and why
+        stored = {
+            product["id"]: product["version"]
+            async for product in db.products.find({"id": {"$in": ids}}, {"_id": 0, "id": 1, "version": 1})
+        }
+        missing = {product_id for product_id in ids if product_id not in stored}
+        conflicts = {product_id for product_id in ids if product_id in stored and stored[product_id] != stamps[product_id]["version"]}
+    
+    results = bulk_results(ids, errors, missing)
+    for result in results:
+        if result.id in conflicts and result.status == "updated":
+            result.status = "conflict"
+    updated = sum(result.status == "updated" for result in results)
+    if updated:
+        catalog_changed()
+    
+    return BulkUpdateResult(updated=updated, results=results)
+
+# ==================== HOME FEED ====================
+
+HOME_FEED_SECTION_SIZE = int(os.environ.get("HOME_FEED_SECTION_SIZE", 8))
+# Best sellers depend on orders, which do not trigger rebuilds, so refresh periodically
+HOME_FEED_REFRESH_SECONDS = float(os.environ.get("HOME_FEED_REFRESH_SECONDS", 300))
+HOME_FEED_BEST_SELLER_DAYS = int(os.environ.get("HOME_FEED_BEST_SELLER_DAYS", 90))
+
+# Card fields only, first image only
+FEED_PRODUCT_PROJECTION = {
+    "_id": 0, "id": 1, "name": 1, "description": 1, "category": 1, "price": 1,
+    "sizes": 1, "colors": 1, "stock": 1, "images": {"$slice": 1}
+}
+
+_home_feed = {"payload": None, "built_at": 0.0, "task": None, "dirty": False}
+
+async def build_home_feed() -> HomeFeed:
+    limit = HOME_FEED_SECTION_SIZE
+    
+    async def newest(query: dict) -> list:
+        cursor = db.products.find(query, FEED_PRODUCT_PROJECTION).sort("created_at", -1).limit(limit)
+        return await cursor.to_list(limit)
+    
+    async def best_sellers() -> list:
+        since = (datetime.now(timezone.utc) - timedelta(days=HOME_FEED_BEST_SELLER_DAYS)).isoformat()
+        ranked = await db.orders.aggregate([
+            {"$match": {"created_at": {"$gte": since}}},
+            {"$unwind": "$items"},
+            {"$group": {"_id": "$items.product_id", "sold": {"$sum": "$items.quantity"}}},
+            {"$sort": {"sold": -1}},
+            # Some best sellers may have been deleted since
+            {"$limit": limit * 2}
+        ]).to_list(limit * 2)
+        ids = [row["_id"] for row in ranked]
+        found = {p["id"]: p for p in await db.products.find({"id": {"$in": ids}}, FEED_PRODUCT_PROJECTION).to_list(len(ids))}
+        return [found[i] for i in ids if i in found][:limit]
+    
+    categories = sorted(await db.products.distinct("category"))
+    new_arrivals, top_sellers, *picks = await asyncio.gather(
+        newest({}),
+        best_sellers(),
+        *(newest({"category": category}) for category in categories)
+    )
+    
+    sections = [FeedSection(key="new_arrivals", title="New Arrivals", products=new_arrivals)]
+    if top_sellers:
+        sections.append(FeedSection(key="best_sellers", title="Best Sellers", products=top_sellers))
+    for category, products in zip(categories, picks):
+        sections.append(FeedSection(key=f"category:{category}", title=f"{category.title()}'s Picks", products=products))
+    
+    return HomeFeed(sections=sections, generated_at=datetime.now(timezone.utc))
+
+async def refresh_home_feed():
+    # Catalog changes during a build mark the snapshot dirty; build again until it is clean
+    while True:
+        _home_feed["dirty"] = False
+        body = (await build_home_feed()).model_dump_json().encode()
+        payload = CompressedPayload(body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+        _home_feed["payload"] = await payload.precompress()
+        _home_feed["built_at"] = asyncio.get_running_loop().time()
+        if not _home_feed["dirty"]:
+            break
+
+@on_catalog_change
+def schedule_home_feed_rebuild() -> asyncio.Task:
+    task = _home_feed["task"]
+    if task is not None and not task.done():
+        _home_feed["dirty"] = True
+        return task
+    _home_feed["task"] = run_in_background(refresh_home_feed(), "home-feed-rebuild")
+    return _home_feed["task"]
+
+@api_router.get("/feed/home", response_model=HomeFeed)
+async def get_home_feed(request: Request):
+    if _home_feed["payload"] is None:
+        try:
+            await asyncio.shield(schedule_home_feed_rebuild())
+        except Exception:
+            # Logged by run_in_background; the next request tries a new build
+            pass
+        if _home_feed["payload"] is None:
+            raise HTTPException(status_code=503, detail="Home feed unavailable, try again shortly",
+                                headers={"Retry-After": "5"})
+    elif asyncio.get_running_loop().time() - _home_feed["built_at"] > HOME_FEED_REFRESH_SECONDS:
+        # Serve the current snapshot while a fresh one is built
+        schedule_home_feed_rebuild()
+    
+    return _home_feed["payload"].response(request, {"Cache-Control": "public, max-age=60"})
+
+# ==================== CART ROUTES ====================
+
+# Carts are priced against products cached this long; checkout always reads fresh ones
+CART_PRODUCT_CACHE_TTL_SECONDS = float(os.environ.get("CART_PRODUCT_CACHE_TTL_SECONDS", 30))
+product_lookup = ProductLookup(db.products, ttl=CART_PRODUCT_CACHE_TTL_SECONDS)
+
+@on_catalog_change
+def clear_product_lookup():
+    product_lookup.clear()
+
+async def price_items(items: List[dict], fresh: bool = False) -> dict:
+    products = await product_lookup.get_many((item["product_id"] for item in items), fresh=fresh)
+    return price_cart(items, products)
+
+GUEST_CART_TTL_DAYS = int(os.environ.get("GUEST_CART_TTL_DAYS", 7))
+CART_MAX_LINES = int(os.environ.get("CART_MAX_LINES", 50))
+
+async def cart_owner(token: Optional[str], guest_cart: Optional[str]) -> tuple:
+    """Collection, filter and guest flag of the cart a request acts on: the user's, or a signed guest cart."""
+    if token:
+        user = await get_current_user(token)
+        return db.carts, {"user_id": user["id"]}, False
+    if guest_cart:
+        cart_id = verify_guest_cart_id(guest_cart)
+        if cart_id is None:
+            raise HTTPException(status_code=401, detail="Invalid guest cart")
+        return db.guest_carts, {"id": cart_id}, True
+    raise HTTPException(status_code=401, detail="Login or a guest cart is required")
+
+def cart_touch(guest: bool) -> dict:
+    """Fields to $set on every cart write; guest carts also get their expiry pushed back."""
+    now = datetime.now(timezone.utc)
+    fields = {"updated_at": now.isoformat()}
+    if guest:
+        # BSON date, read by the TTL index
+        fields["expires_at"] = now + timedelta(days=GUEST_CART_TTL_DAYS)
+    return fields
+
+def live_guest_cart(query: dict) -> dict:
+    # The TTL monitor deletes expired carts within a minute or so; never serve one before that
+    return {**query, "expires_at": {"$gt": datetime.now(timezone.utc)}}
+
+@api_router.get("/cart", response_model=PricedCart)
+async def get_cart(token: Optional[str] = None, guest_cart: Optional[str] = None):
+    collection, query, guest = await cart_owner(token, guest_cart)
+    if guest:
+        query = live_guest_cart(query)
+    cart = await collection.find_one(query, {"_id": 0, "expires_at": 0})
     
     if not cart:
-        # Create empty cart
-        new_cart = Cart(user_id=user["id"])
-        doc = new_cart.model_dump()
-        doc["updated_at"] = doc["updated_at"].isoformat()
-        await db.carts.insert_one(doc)
-        return new_cart
+        # Not stored until the first item is added
+        cart = Cart(user_id=query.get("user_id")).model_dump()
     
     if isinstance(cart.get("updated_at"), str):
         cart["updated_at"] = datetime.fromisoformat(cart["updated_at"])
     
+    cart.update(await price_items(cart.get("items", [])))
     return cart
 
 @api_router.post("/cart/add")
-async def add_to_cart(token: str, item: CartItem):
-    user = await get_current_user(token)
-    cart = await db.carts.find_one({"user_id": user["id"]}, {"_id": 0})
+async def add_to_cart(item: CartItem, token: Optional[str] = None, guest_cart: Optional[str] = None):
+    if not token and not guest_cart:
+        # First item of an anonymous visitor: start a guest cart
+        cart_id = str(uuid.uuid4())
+        guest_cart = sign_guest_cart_id(cart_id)
+        await db.guest_carts.insert_one({"id": cart_id, "user_id": None, "items": [item.model_dump()], **cart_touch(True)})
+        return {"message": "Item added to cart", "guest_cart": guest_cart}
     
-    if not cart:
-        new_cart = Cart(user_id=user["id"], items=[item])
-        doc = new_cart.model_dump()
-        doc["updated_at"] = doc["updated_at"].isoformat()
-        await db.carts.insert_one(doc)
-    else:
-        await db.carts.update_one(
-            {"user_id": user["id"]},
-            {
-                "$push": {"items": item.model_dump()},
-                "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}
-            }
-        )
+    collection, query, guest = await cart_owner(token, guest_cart)
+    # Adding a product already in the cart increases its quantity instead of adding a line.
+    # One pipeline upsert decides which, so it is a single round trip with no race.
+    line = item.model_dump()
+    same_line = {"$and": [{"$eq": [f"$$c.{field}", {"$literal": line[field]}]} for field in ("product_id", "size", "color")]}
+    await collection.update_one(
+        query,
+        [
+            {"$set": {
+                "id": {"$ifNull": ["$id", str(uuid.uuid4())]},
+                "user_id": {"$ifNull": ["$user_id", {"$literal": query.get("user_id")}]},
+                "items": {"$let": {
+                    "vars": {"current": {"$ifNull": ["$items", []]}},
+                    "in": {"$cond": [
+                        {"$gt": [{"$size": {"$filter": {"input": "$$current", "as": "c", "cond": same_line}}}, 0]},
+                        {"$map": {"input": "$$current", "as": "c", "in": {"$cond": [
+                            same_line,
+                            {
+                                **{field: f"$$c.{field}" for field in CartItem.model_fields},
+                                "quantity": {"$add": ["$$c.quantity", item.quantity]},
+                                "price": {"$literal": item.price}
+                            },
+                            "$$c"
+                        ]}}},
+                        {"$slice": [{"$concatArrays": ["$$current", {"$literal": [line]}]}, -CART_MAX_LINES]}
+                    ]}
+                }},
+                **cart_touch(guest)
+            }}
+        ],
+        upsert=True
+    )
     
-    return {"message": "Item added to cart"}
+    response = {"message": "Item added to cart"}
+    if guest_cart:
+        response["guest_cart"] = guest_cart
+    return response
 
 @api_router.put("/cart/update")
-async def update_cart(token: str, items: List[CartItem]):
-    user = await get_current_user(token)
+async def update_cart(items: List[CartItem], token: Optional[str] = None, guest_cart: Optional[str] = None):
+    collection, query, guest = await cart_owner(token, guest_cart)
     
-    await db.carts.update_one(
-        {"user_id": user["id"]},
+    await collection.update_one(
+        query,
         {
             "$set": {
                 "items": [item.model_dump() for item in items],
-                "updated_at": datetime.now(timezone.utc).isoformat()
+                **cart_touch(guest)
             }
         }
     )
@@ -433,63 +1471,144 @@ async def update_cart(token: str, items: List[CartItem]):
     return {"message": "Cart updated"}
 
 @api_router.delete("/cart/remove/{product_id}")
-async def remove_from_cart(token: str, product_id: str):
-    user = await get_current_user(token)
+async def remove_from_cart(product_id: str, token: Optional[str] = None, guest_cart: Optional[str] = None):
+    collection, query, guest = await cart_owner(token, guest_cart)
     
-    await db.carts.update_one(
-        {"user_id": user["id"]},
+    await collection.update_one(
+        query,
         {
             "$pull": {"items": {"product_id": product_id}},
-            "$set": {"updated_at": datetime.now(timezone.utc).isoformat()}
+            "$set": cart_touch(guest)
         }
     )
     
     return {"message": "Item removed from cart"}
 
 @api_router.delete("/cart/clear")
-async def clear_cart(token: str):
-    user = await get_current_user(token)
+async def clear_cart(token: Optional[str] = None, guest_cart: Optional[str] = None):
+    collection, query, guest = await cart_owner(token, guest_cart)
     
-    await db.carts.update_one(
-        {"user_id": user["id"]},
+    await collection.update_one(
+        query,
         {
             "$set": {
                 "items": [],
-                "updated_at": datetime.now(timezone.utc).isoformat()
+                **cart_touch(guest)
             }
         }
     )
     
     return {"message": "Cart cleared"}
 
+def _same_line(a: str, b: str) -> dict:
+    return {"$and": [{"$eq": [f"$${a}.{field}", f"$${b}.{field}"]} for field in ("product_id", "size", "color")]}
+
+async def merge_guest_cart(guest_cart: str, user_id: str):
+    """Move a guest cart into the user's cart; lines for the same product, size and color add up."""
+    cart_id = verify_guest_cart_id(guest_cart)
+    if cart_id is None:
+        return
+    # Deleting first claims the guest cart, so concurrent logins cannot merge it twice
+    guest = await db.guest_carts.find_one_and_delete(live_guest_cart({"id": cart_id}))
+    if not guest or not guest.get("items"):
+        return
+    guest_items = {"$literal": guest["items"]}
+    # One pipeline update: no read-modify-write race with other writes to the user's cart
+    await db.carts.update_one(
+        {"user_id": user_id},
+        [
+            {"$set": {
+                "id": {"$ifNull": ["$id", str(uuid.uuid4())]},
+                "user_id": user_id,
+                "items": {"$let": {
+                    "vars": {"current": {"$ifNull": ["$items", []]}},
+                    "in": {"$concatArrays": [
+                        {"$map": {"input": "$$current", "as": "c", "in": {
+                            **{field: f"$$c.{field}" for field in CartItem.model_fields},
+                            "quantity": {"$add": ["$$c.quantity", {"$sum": {"$map": {
+                                "input": {"$filter": {"input": guest_items, "as": "g", "cond": _same_line("g", "c")}},
+                                "as": "g",
+                                "in": "$$g.quantity"
+                            }}}]}
+                        }}},
+                        {"$filter": {"input": guest_items, "as": "g", "cond": {"$not": [{"$anyElementTrue": [
+                            {"$map": {"input": "$$current", "as": "c", "in": _same_line("g", "c")}}
+                        ]}]}}}
+                    ]}
+                }},
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }}
+        ],
+        upsert=True
+    )
+
 # ==================== ORDER ROUTES ====================
 
-@api_router.post("/orders/create", response_model=Order)
+@api_router.post("/orders/create", response_model=Order, dependencies=[CHECKOUT_RATE_LIMIT])
 async def create_order(token: str, order_data: OrderCreate):
     user = await get_current_user(token)
     
+    # Price from the catalog, not from the client
+    priced = await price_items([item.model_dump() for item in order_data.items], fresh=True)
+    summary = priced["summary"]
+    if not summary["can_checkout"]:
+        raise HTTPException(status_code=409, detail={"message": "Some items can no longer be ordered", "cart": priced})
+    if abs(summary["total"] - order_data.total_amount) > 0.005:
+        raise HTTPException(status_code=409, detail={"message": "Prices have changed", "cart": priced})
+    
     order = Order(
         user_id=user["id"],
-        **order_data.model_dump()
+        items=[OrderItem(**line) for line in priced["items"]],
+        total_amount=summary["total"],
+        shipping_address=order_data.shipping_address
     )
     
     doc = order.model_dump()
     doc["created_at"] = doc["created_at"].isoformat()
+    # Priced lines carry the product image for the list thumbnail
+    doc.update(order_summary(priced["items"]))
     
     await db.orders.insert_one(doc)
+    await order_totals.order_created(doc)
     
-    # Clear cart
-    await db.carts.update_one(
-        {"user_id": user["id"]},
-        {"$set": {"items": []}}
-    )
+    # Clear cart after the response
+    await job_queue.enqueue("clear_cart", {"user_id": user["id"]})
     
     return order
 
-@api_router.get("/orders", response_model=List[Order])
-async def get_user_orders(token: str):
+ORDER_LIST_MAX = 1000
+
+def iso_utc(moment: Optional[datetime]) -> Optional[str]:
+    if moment is None:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat()
+
+async def summarize_missing(orders: List[dict], since: Optional[str], until: Optional[str]) -> List[dict]:
+    """Fill in the summary of orders the maintenance backfill has not reached yet."""
+    missing = [order["id"] for order in orders if "item_count" not in order]
+    if missing:
+        # One more read, only while older orders lack the stored fields
+        full = await order_partitions.find(
+            {"id": {"$in": missing}}, since=since, until=until, limit=len(missing),
+            projection={"_id": 0, "id": 1, "items": 1, "created_at": 1}
+        )
+        items = {order["id"]: order.get("items") or [] for order in full}
+        for order in orders:
+            if order["id"] in items:
+                order.update(order_summary(items[order["id"]]))
+    return orders
+
+@api_router.get("/orders", response_model=List[OrderSummary])
+async def get_user_orders(token: str, since: Optional[datetime] = None, until: Optional[datetime] = None, limit: int = Query(ORDER_LIST_MAX, ge=1, le=ORDER_LIST_MAX)):
     user = await get_current_user(token)
-    orders = await db.orders.find({"user_id": user["id"]}, {"_id": 0}).to_list(1000)
+    # Newest first; archive partitions are only read when the range and limit reach them
+    orders = await order_partitions.find(
+        {"user_id": user["id"]}, since=iso_utc(since), until=iso_utc(until), limit=limit,
+        projection=ORDER_SUMMARY_PROJECTION
+    )
+    await summarize_missing(orders, iso_utc(since), iso_utc(until))
     
     for order in orders:
         if isinstance(order.get("created_at"), str):
@@ -497,13 +1616,17 @@ async def get_user_orders(token: str):
     
     return orders
 
-@api_router.get("/admin/orders", response_model=List[Order])
-async def get_all_orders(token: str):
+@api_router.get("/admin/orders", response_model=List[OrderSummary])
+async def get_all_orders(token: str, since: Optional[datetime] = None, until: Optional[datetime] = None, limit: int = Query(ORDER_LIST_MAX, ge=1, le=ORDER_LIST_MAX)):
     user = await get_current_user(token)
     if user["role"] != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
     
-    orders = await db.orders.find({}, {"_id": 0}).to_list(1000)
+    orders = await order_partitions.find(
+        {}, since=iso_utc(since), until=iso_utc(until), limit=limit,
+        projection=ORDER_SUMMARY_PROJECTION
+    )
+    await summarize_missing(orders, iso_utc(since), iso_utc(until))
     
     for order in orders:
         if isinstance(order.get("created_at"), str):
@@ -521,22 +1644,207 @@ async def update_order_status(token: str, order_id: str, status: str, payment_st
     if payment_status:
         update_dict["payment_status"] = payment_status
     
-    result = await db.orders.update_one(
+    # The previous status moves the dashboard counts
+    previous = await db.orders.find_one_and_update(
         {"id": order_id},
-        {"$set": update_dict}
+        {"$set": update_dict},
+        projection=ORDER_EVENT_PROJECTION,
+        return_document=ReturnDocument.BEFORE
     )
     
-    if result.matched_count == 0:
+    if previous is None:
         raise HTTPException(status_code=404, detail="Order not found")
     
+    await order_totals.statuses_changed([(previous.get("status"), status)])
+    order_events.order_updated({**previous, **update_dict})
+    
     return {"message": "Order status updated"}
 
+async def orders_by_id(ids: List[str]) -> dict:
+    return {order["id"]: order async for order in db.orders.find({"id": {"$in": ids}}, ORDER_EVENT_PROJECTION)}
+
+@api_router.post("/admin/orders/bulk", response_model=BulkUpdateResult)
+async def bulk_update_order_status(token: str, update: OrderBulkUpdate):
+    """Set the status or payment status of many orders, listed or selected by a filter."""
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    # id -> fields to set; orders already read, for the status events
+    targets, known = {}, {}
+    if update.filter is not None:
+        if update.changes:
+            raise HTTPException(status_code=400, detail="Send either changes or a filter, not both")
+        fields = {key: value for key, value in (("status", update.status), ("payment_status", update.payment_status)) if value}
+        if not fields:
+            raise HTTPException(status_code=400, detail="Nothing to update")
+        query = {key: value for key, value in (("status", update.filter.status), ("payment_status", update.filter.payment_status)) if value}
+        if update.filter.until is not None:
+            query["created_at"] = {"$lt": iso_utc(update.filter.until)}
+        # Archived orders are finished; only the hot collection is updated
+        matches = await db.orders.find(query, ORDER_EVENT_PROJECTION).to_list(BULK_UPDATE_MAX + 1)
+        if len(matches) > BULK_UPDATE_MAX:
+            raise HTTPException(status_code=413, detail=f"The filter matches more than {BULK_UPDATE_MAX} orders")
+        for order in matches:
+            targets[order["id"]] = fields
+            known[order["id"]] = order
+    else:
+        for change in update.changes:
+            fields = change.model_dump(exclude={"id"}, exclude_none=True)
+            if fields:
+                targets.setdefault(change.id, {}).update(fields)
+    
+    if len(targets) > BULK_UPDATE_MAX:
+        raise HTTPException(status_code=413, detail=f"At most {BULK_UPDATE_MAX} orders per request")
+    if not targets:
+        return BulkUpdateResult(updated=0, results=[])
+    
+    ids = list(targets)
+    status_changes = any("status" in fields for fields in targets.values())
+    read_first = update.filter is None and (status_changes or not order_events.change_stream_active)
+    if read_first:
+        # The previous statuses move the dashboard counts; without a change stream
+        # the events also need each order's user
+        known = await orders_by_id(ids)
+    ops = [UpdateOne({"id": order_id}, {"$set": fields}) for order_id, fields in targets.items()]
+    matched, errors = await bulk_update(db.orders, ops)
+    
+    missing = set()
+    if matched < len(ops) - len(errors):
+        # Only when something did not match: find out which
+        if update.filter is None and not read_first:
+            known = await orders_by_id(ids)
+        missing = set(ids) - set(known)
+    
+    results = bulk_results(ids, errors, missing)
+    updated = [result.id for result in results if result.status == "updated" and result.id in known]
+    if status_changes:
+        await order_totals.statuses_changed(
+            (known[order_id].get("status"), targets[order_id]["status"]) for order_id in updated if "status" in targets[order_id]
+        )
+    for order_id in updated:
+        order_events.order_updated({**known[order_id], "id": order_id, **targets[order_id]})
+    
+    return BulkUpdateResult(updated=sum(result.status == "updated" for result in results), results=results)
+
+async def order_event_stream(request: Request, user_id: Optional[str]):
+    subscription = order_events.subscribe(user_id)
+    try:
+        yield f"retry: 5000\nevent: ready\ndata: {{}}\n\n"
+        while not await request.is_disconnected():
+            event = await subscription.get(ORDER_STREAM_HEARTBEAT_SECONDS)
+            # Comment lines keep proxies from closing an idle connection
+            yield format_sse(event) if event is not None else ": keep-alive\n\n"
+    finally:
+        order_events.unsubscribe(subscription)
+
+def sse_response(request: Request, user_id: Optional[str]) -> StreamingResponse:
+    return StreamingResponse(
+        order_event_stream(request, user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@api_router.get("/orders/stream")
+async def stream_user_orders(token: str, request: Request):
+    user = await get_current_user(token)
+    return sse_response(request, user["id"])
+
+@api_router.get("/admin/orders/stream")
+async def stream_all_orders(token: str, request: Request):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return sse_response(request, None)
+
+# Single orders with their items. Declared after the stream routes, which they would
+# otherwise shadow; ``created_at`` (from the list) saves searching the archive.
+
+async def order_detail(query: dict, created_at: Optional[datetime]) -> dict:
+    order = await order_partitions.get(query, created_at=iso_utc(created_at))
+    if order is None:
+        raise HTTPException(status_code=404, detail="Order not found")
+    if isinstance(order.get("created_at"), str):
+        order["created_at"] = datetime.fromisoformat(order["created_at"])
+    return order
+
+@api_router.get("/orders/{order_id}", response_model=Order)
+async def get_user_order(token: str, order_id: str, created_at: Optional[datetime] = None):
+    user = await get_current_user(token)
+    return await order_detail({"id": order_id, "user_id": user["id"]}, created_at)
+
+@api_router.get("/admin/orders/{order_id}", response_model=Order)
+async def get_order(token: str, order_id: str, created_at: Optional[datetime] = None):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return await order_detail({"id": order_id}, created_at)
+
+# ==================== ADMIN SUMMARY ====================
+
+ADMIN_SUMMARY_TTL_SECONDS = float(os.environ.get("ADMIN_SUMMARY_TTL_SECONDS", 30))
+_admin_summary_cache = {"expires": 0.0, "value": None}
+_admin_summary_lock = asyncio.Lock()
+
+async def compute_admin_summary() -> AdminSummary:
+    # Collection metadata counts instead of scanning documents
+    total_products, total_users, totals = await asyncio.gather(
+        db.products.estimated_document_count(),
+        db.users.estimated_document_count(),
+        order_totals.get()
+    )
+    if totals is None:
+        # First summary since the counters were introduced
+        totals = await order_totals.rebuild()
+    by_status = {status: count for status, count in totals.get("by_status", {}).items() if count}
+    
+    return AdminSummary(
+        total_products=total_products,
+        total_orders=totals.get("orders", 0),
+        total_users=total_users,
+        total_revenue=round(totals.get("revenue", 0), 2),
+        pending_orders=by_status.get("pending", 0),
+        orders_by_status=by_status,
+        generated_at=datetime.now(timezone.utc)
+    )
+
+@api_router.get("/admin/summary", response_model=AdminSummary)
+async def get_admin_summary(token: str):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    loop = asyncio.get_running_loop()
+    if _admin_summary_cache["expires"] <= loop.time():
+        async with _admin_summary_lock:
+            # Another request may have refreshed it while we waited
+            if _admin_summary_cache["expires"] <= loop.time():
+                _admin_summary_cache["value"] = await compute_admin_summary()
+                _admin_summary_cache["expires"] = loop.time() + ADMIN_SUMMARY_TTL_SECONDS
+    
+    return _admin_summary_cache["value"]
+
 # ==================== CATEGORY ROUTES ====================
 
+CATEGORIES_CACHE_TTL_SECONDS = float(os.environ.get("CATEGORIES_CACHE_TTL_SECONDS", 300))
+_categories_cache = {"expires": 0.0, "payload": None}
+_category_list = TypeAdapter(List[Category])
+
 @api_router.get("/categories", response_model=List[Category])
-async def get_categories():
-    categories = await db.categories.find({}, {"_id": 0}).to_list(1000)
-    return categories
+async def get_categories(request: Request):
+    now = asyncio.get_running_loop().time()
+    if _categories_cache["payload"] is None or _categories_cache["expires"] <= now:
+        snapshot = catalog_snapshot.current()
+        if snapshot is not None:
+            body = snapshot.categories()
+        else:
+            categories = await db.categories.find({}, {"_id": 0}).to_list(1000)
+            body = _category_list.dump_json(_category_list.validate_python(categories))
+        payload = CompressedPayload(body, etag=f'"{hashlib.sha1(body).hexdigest()}"')
+        _categories_cache["payload"] = await payload.precompress()
+        _categories_cache["expires"] = now + CATEGORIES_CACHE_TTL_SECONDS
+    return _categories_cache["payload"].response(request, {"Cache-Control": "public, max-age=60"})
 
 @api_router.post("/admin/categories", response_model=Category)
 async def create_category(token: str, name: str, type: str):
@@ -546,21 +1854,337 @@ async def create_category(token: str, name: str, type: str):
     
     category = Category(name=name, type=type)
     await db.categories.insert_one(category.model_dump())
+    _categories_cache["payload"] = None
+    schedule_catalog_snapshot_rebuild()
     
     return category
 
+# ==================== BACKGROUND JOBS ====================
+
+@job_queue.job("clear_cart", concurrency=4)
+async def clear_cart_job(payload: dict):
+    await db.carts.update_one(
+        {"user_id": payload["user_id"]},
+        {"$set": {"items": [], "updated_at": datetime.now(timezone.utc).isoformat()}}
+    )
+
+@job_queue.job("image_variants", concurrency=2, max_attempts=3)
+async def image_variants_job(payload: dict):
+    """Write a smaller WebP variant next to an uploaded image for browsers that accept it."""
+    filename = payload["filename"]
+    webp_filename = filename.rsplit(".", 1)[0] + ".webp"
+    if await storage.exists(webp_filename) or not await storage.exists(filename):
+        return
+    contents = await storage.read(filename)
+    webp = await asyncio.to_thread(encode_webp_variant, contents)
+    if len(webp) < len(contents):
+        await storage.save(webp_filename, webp, "image/webp")
+        image_cache.invalidate(filename)
+
+@api_router.get("/admin/jobs")
+async def get_job_stats(token: str):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return await job_queue.stats()
+
+@api_router.get("/admin/products/coalescing")
+async def get_product_coalescing_stats(token: str):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return product_list_flight.stats()
+
+@api_router.get("/admin/db/commands")
+async def get_command_stats(token: str, reset: bool = False):
+    """MongoDB commands per route since start (or the last reset); needs MONGO_COMMAND_STATS=1."""
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    routes = command_stats.snapshot()
+    if reset:
+        command_stats.reset()
+    return {"enabled": COMMAND_STATS_ENABLED, "routes": routes}
+
+@api_router.get("/admin/jobs/{job_id}")
+async def get_job_status(token: str, job_id: str):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    job = await job_queue.status(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {k: v for k, v in job.items() if k != "_id"}
+
+# ==================== CATALOG SNAPSHOT ====================
+
+_product_adapter = TypeAdapter(Product)
+_catalog_snapshot_build = {"task": None, "dirty": False}
+
+async def rebuild_catalog_snapshot(force: bool = True):
+    """Write a new snapshot file; without ``force`` only if the mapped one is behind."""
+    lock = await asyncio.to_thread(acquire_build_lock, CATALOG_SNAPSHOT_PATH)
+    try:
+        # Read before the products, so the snapshot never claims a newer version than it holds
+        state = await catalog_versions.current()
+        catalog_snapshot.refresh()
+        current = catalog_snapshot.snapshot
+        if not force and current is not None and current.version >= state["version"]:
+            return
+        products = await db.products.find({}, {"_id": 0}).to_list(None)
+        categories = await db.categories.find({}, {"_id": 0}).to_list(1000)
+        
+        def build():
+            entries = [
+                (p["id"], p["category"], p["price"], _product_adapter.dump_json(_product_adapter.validate_python(p)))
+                for p in products
+            ]
+            categories_json = _category_list.dump_json(_category_list.validate_python(categories))
+            write_snapshot(CATALOG_SNAPSHOT_PATH, state["version"], entries, categories_json)
+        
+        await asyncio.to_thread(build)
+    finally:
+        lock.close()
+    catalog_snapshot.refresh()
+
+async def refresh_catalog_snapshot():
+    try:
+        while True:
+            _catalog_snapshot_build["dirty"] = False
+            await rebuild_catalog_snapshot()
+            if not _catalog_snapshot_build["dirty"]:
+                break
+    except Exception:
+        # Still stale, so this worker keeps reading MongoDB; catalog_snapshot_loop retries
+        logger.exception("Catalog snapshot rebuild failed, retrying within %ss", CATALOG_SNAPSHOT_CHECK_SECONDS)
+        return
+    catalog_snapshot.stale = False
+
+@on_catalog_change
+def schedule_catalog_snapshot_rebuild() -> asyncio.Task:
+    # This worker reads from MongoDB until its own write is in the snapshot
+    catalog_snapshot.stale = True
+    task = _catalog_snapshot_build["task"]
+    if task is not None and not task.done():
+        _catalog_snapshot_build["dirty"] = True
+        return task
+    _catalog_snapshot_build["task"] = run_in_background(refresh_catalog_snapshot(), "catalog-snapshot-rebuild")
+    return _catalog_snapshot_build["task"]
+
+async def catalog_snapshot_loop():
+    """Build the snapshot if missing, and catch up with writes whose rebuild was lost."""
+    while True:
+        task = _catalog_snapshot_build["task"]
+        if catalog_snapshot.stale and task is not None and task.done():
+            # The rebuild after this worker's last write failed
+            schedule_catalog_snapshot_rebuild()
+        else:
+            try:
+                await rebuild_catalog_snapshot(force=False)
+            except Exception:
+                logger.exception("Catalog snapshot check failed")
+        await asyncio.sleep(CATALOG_SNAPSHOT_CHECK_SECONDS)
+
+# ==================== RECOMMENDATIONS ====================
+
+# "Also bought" neighbours per product, refreshed in each worker (see recommendations.py)
+RECOMMENDATIONS_REFRESH_SECONDS = float(os.environ.get("RECOMMENDATIONS_REFRESH_SECONDS", 600))
+recommender = CoOccurrenceModel(
+    top_k=int(os.environ.get("RECOMMENDATIONS_TOP_K", 8)),
+    min_support=int(os.environ.get("RECOMMENDATIONS_MIN_SUPPORT", 1)),
+)
+_recommendations_refresh = {"task": None, "dirty": False}
+
+async def refresh_recommendations():
+    while True:
+        _recommendations_refresh["dirty"] = False
+        report = await recommender.refresh(db.orders, db.products)
+        logger.debug("Recommendations refreshed: %s", report)
+        if not _recommendations_refresh["dirty"]:
+            break
+
+@on_catalog_change
+def schedule_recommendations_refresh() -> asyncio.Task:
+    # New, deleted and re-priced products change the neighbours, not the counts
+    task = _recommendations_refresh["task"]
+    if task is not None and not task.done():
+        _recommendations_refresh["dirty"] = True
+        return task
+    _recommendations_refresh["task"] = run_in_background(refresh_recommendations(), "recommendations-refresh")
+    return _recommendations_refresh["task"]
+
+async def recommendations_loop():
+    while True:
+        try:
+            await asyncio.shield(schedule_recommendations_refresh())
+        except Exception:
+            logger.exception("Recommendations refresh failed")
+        await asyncio.sleep(RECOMMENDATIONS_REFRESH_SECONDS)
+
+# ==================== SIMILAR PRODUCTS ====================
+
+# TF-IDF neighbours per product, kept current from /products/changes (see similarity.py)
+SIMILARITY_REFRESH_SECONDS = float(os.environ.get("SIMILARITY_REFRESH_SECONDS", 60))
+similarity_index = SimilarityIndex(top_k=int(os.environ.get("SIMILARITY_TOP_K", 8)))
+_similarity_refresh = {"version": 0, "task": None, "dirty": False}
+
+async def refresh_similarity():
+    while True:
+        _similarity_refresh["dirty"] = False
+        since, changed, deleted = _similarity_refresh["version"], [], []
+        while True:
+            page = await catalog_versions.changes(since, CATALOG_CHANGES_MAX)
+            if page["reset"]:
+                # Deletions were pruned before we saw them; start over from the whole catalog
+                similarity_index.terms.clear()
+                since, changed, deleted = 0, [], []
+                continue
+            changed += page["changes"]
+            deleted += page["deleted"]
+            since = page["version"]
+            if not page["has_more"]:
+                break
+        if changed or deleted:
+            report = await asyncio.to_thread(similarity_index.apply, changed, deleted)
+            logger.debug("Similarity index updated: %s", report)
+        _similarity_refresh["version"] = since
+        if page["settling"]:
+            # Recent writes are held back until they settle (see catalog_versions.py)
+            await asyncio.sleep(catalog_versions.settle_seconds)
+            continue
+        if not _similarity_refresh["dirty"]:
+            break
+
+@on_catalog_change
+def schedule_similarity_refresh() -> asyncio.Task:
+    task = _similarity_refresh["task"]
+    if task is not None and not task.done():
+        _similarity_refresh["dirty"] = True
+        return task
+    _similarity_refresh["task"] = run_in_background(refresh_similarity(), "similarity-refresh")
+    return _similarity_refresh["task"]
+
+async def similarity_loop():
+    # Picks up writes handled by other workers; an idle poll is one indexed query
+    while True:
+        try:
+            await asyncio.shield(schedule_similarity_refresh())
+        except Exception:
+            logger.exception("Similarity refresh failed")
+        await asyncio.sleep(SIMILARITY_REFRESH_SECONDS)
+
+# ==================== MAINTENANCE ====================
+
+MAINTENANCE_INTERVAL_SECONDS = int(os.environ.get("MAINTENANCE_INTERVAL_SECONDS", 24 * 3600))
+CART_STALE_DAYS = int(os.environ.get("CART_STALE_DAYS", 90))
+ORDER_ARCHIVE_DAYS = int(os.environ.get("ORDER_ARCHIVE_DAYS", 365))
+# Pause between batches; each pass idles at least as long as it works
+MAINTENANCE_BATCH_SIZE = int(os.environ.get("MAINTENANCE_BATCH_SIZE", 200))
+MAINTENANCE_BATCH_PAUSE = float(os.environ.get("MAINTENANCE_BATCH_PAUSE", 0.1))
+
+@job_queue.job("maintenance", max_attempts=2)
+async def maintenance_job(payload: dict):
+    """Compact carts, archive old orders, backfill order summaries, prune tombstones and expired uploads,
+    recount the order totals; record what was reclaimed."""
+    throttle = Throttle(pause=MAINTENANCE_BATCH_PAUSE)
+    started_at = datetime.now(timezone.utc)
+    carts = await compact_carts(
+        db.carts, stale_days=CART_STALE_DAYS, max_lines=CART_MAX_LINES,
+        batch_size=MAINTENANCE_BATCH_SIZE, throttle=throttle
+    )
+    orders = await archive_orders(
+        db.orders, order_partitions, older_than_days=ORDER_ARCHIVE_DAYS,
+        batch_size=MAINTENANCE_BATCH_SIZE, throttle=throttle
+    )
+    summaries = await summarize_orders(
+        [db.orders] + [db[partition["_id"]] for partition in await order_partitions.partitions()],
+        batch_size=MAINTENANCE_BATCH_SIZE, throttle=throttle
+    )
+    tombstones = await catalog_versions.prune_tombstones(CATALOG_TOMBSTONE_DAYS)
+    uploads = await upload_sessions.expire()
+    # Corrects any drift of the running dashboard counts
+    order_counts = await order_totals.rebuild()
+    report = {
+        "id": str(uuid.uuid4()),
+        "started_at": started_at.isoformat(),
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+        "carts": carts,
+        "orders": orders,
+        "order_summaries": summaries,
+        "tombstones": tombstones,
+        "uploads": uploads,
+        "order_totals": order_counts,
+        "bytes_reclaimed": carts["bytes_reclaimed"] + orders["bytes_reclaimed"] + uploads["bytes_reclaimed"],
+    }
+    await db.maintenance_reports.insert_one(report)
+    logger.info("Maintenance reclaimed %d bytes: carts %s, orders %s", report["bytes_reclaimed"], carts, orders)
+
+async def claim_maintenance_interval(interval: int) -> bool:
+    """Every worker runs the loop; only the first to move the schedule to ``interval`` enqueues."""
+    try:
+        result = await db.counters.update_one(
+            {"_id": "maintenance", "interval": {"$lt": interval}},
+            {"$set": {"interval": interval}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        # The schedule is already at this interval, so the upsert tried a second document
+        return False
+    return result.modified_count == 1 or result.upserted_id is not None
+
+async def maintenance_loop():
+    # First run at startup, so backfills such as the order summaries do not wait an interval
+    while True:
+        now = datetime.now(timezone.utc).timestamp()
+        try:
+            if await claim_maintenance_interval(int(now // MAINTENANCE_INTERVAL_SECONDS)):
+                await job_queue.enqueue("maintenance", {})
+        except Exception:
+            logger.exception("Scheduling maintenance failed")
+        # Until the next interval starts, the same moment in every worker
+        await asyncio.sleep(MAINTENANCE_INTERVAL_SECONDS - now % MAINTENANCE_INTERVAL_SECONDS)
+
+@api_router.post("/admin/maintenance")
+async def run_maintenance(token: str):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return {"job_id": await job_queue.enqueue("maintenance", {})}
+
+@api_router.get("/admin/maintenance")
+async def get_maintenance_reports(token: str, limit: int = 10):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return await db.maintenance_reports.find({}, {"_id": 0}).sort("started_at", -1).to_list(min(limit, 100))
+
 # ==================== IMAGE SERVING & UPLOAD ROUTES ====================
-from fastapi.responses import FileResponse
+from fastapi.responses import RedirectResponse
 
-@api_router.get("/images/{filename}")
-async def serve_image(filename: str):
+@api_router.api_route("/images/{filename}", methods=["GET", "HEAD"])
+async def serve_image(filename: str, request: Request):
     """Serve product images through API route"""
-    file_path = UPLOAD_DIR / filename
-    if not file_path.exists():
+    if not safe_filename(filename):
         raise HTTPException(status_code=404, detail="Image not found")
-    return FileResponse(file_path)
+    
+    redirect = await storage.redirect_url(filename)
+    if redirect:
+        # Object-store backends: the client fetches the bytes directly
+        return RedirectResponse(redirect, status_code=307)
+    
+    # Cached stat lookup, WebP/AVIF variant negotiation, Range and conditional requests
+    entry, negotiated = await image_cache.negotiate(filename, request.headers.get("accept", ""))
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+    return ImageFileResponse(entry, request.headers, vary_accept=negotiated, cache=image_cache)
 
-@api_router.post("/admin/upload-image")
+@api_router.post("/admin/upload-image", dependencies=[IMAGE_UPLOAD_SLOTS])
 async def upload_image(token: str, file: UploadFile = File(...)):
     """Upload product image - Admin only"""
     user = await get_current_user(token)
@@ -571,41 +2195,60 @@ async def upload_image(token: str, file: UploadFile = File(...)):
     if not file.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="File must be an image")
     
-    # Read and validate image
-    contents = await file.read()
-    try:
-        img = Image.open(io.BytesIO(contents))
-        width, height = img.size
-        
-        # Optional: Resize if too large
-        max_size = 1200
-        if width > max_size or height > max_size:
-            img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-            # Save resized image
-            output = io.BytesIO()
-            img.save(output, format='JPEG', quality=85)
-            contents = output.getvalue()
-            width, height = img.size
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid image file: {str(e)}")
+    # Processed from the spooled temp file; only a resized copy is held in memory
+    return await ingest_upload(file.file)
+
+# Large photos over unreliable connections: create a session, PATCH chunks, then
+# complete it (see resumable_uploads.py)
+
+@api_router.post("/admin/uploads")
+async def create_upload(token: str, size: int, filename: Optional[str] = None, sha256: Optional[str] = None):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    return await upload_sessions.create(user["id"], size, filename, sha256)
+
+@api_router.get("/admin/uploads/{upload_id}")
+async def get_upload(token: str, upload_id: str):
+    """Where to resume: the number of bytes received so far is ``offset``."""
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
     
-    # Generate unique filename
-    file_ext = file.filename.split('.')[-1] if '.' in file.filename else 'jpg'
-    filename = f"{uuid.uuid4()}.{file_ext}"
-    file_path = UPLOAD_DIR / filename
+    return await upload_sessions.status(upload_id, user["id"])
+
+@api_router.patch("/admin/uploads/{upload_id}")
+async def upload_chunk(request: Request, token: str, upload_id: str, offset: int, checksum: str):
+    """Raw chunk bytes as the body; ``checksum`` is their hex SHA-256."""
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
     
-    # Save image
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    return await upload_sessions.write_chunk(upload_id, user["id"], offset, checksum, request.stream())
+
+@api_router.post("/admin/uploads/{upload_id}/complete", dependencies=[IMAGE_UPLOAD_SLOTS])
+async def complete_upload(token: str, upload_id: str):
+    """Process the received file like ``/admin/upload-image`` and end the session."""
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
     
-    # Return image URL and metadata
-    return {
-        "url": f"/api/images/{filename}",
-        "filename": filename,
-        "size": len(contents),
-        "width": width,
-        "height": height
-    }
+    path = await upload_sessions.complete(upload_id, user["id"])
+    with open(path, "rb") as fileobj:
+        image = await ingest_upload(fileobj)
+    await upload_sessions.discard(upload_id)
+    return image
+
+@api_router.delete("/admin/uploads/{upload_id}")
+async def cancel_upload(token: str, upload_id: str):
+    user = await get_current_user(token)
+    if user["role"] != "admin":
+        raise HTTPException(status_code=403, detail="Admin access required")
+    
+    await upload_sessions.get(upload_id, user["id"])
+    await upload_sessions.discard(upload_id)
+    return {"message": "Upload cancelled"}
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -620,6 +2263,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def start_image_reconciler():
+    await db.images.create_index("filename", unique=True)
+    # Garbage collection checks that no product uses a file before deleting it
+    await db.products.create_index("images.filename")
+    app.state.image_reconciler = asyncio.create_task(image_reconcile_loop())
+
+@app.on_event("startup")
+async def start_job_queue():
+    await job_queue.start()
+    app.state.maintenance = asyncio.create_task(maintenance_loop())
+
+@app.on_event("startup")
+async def prepare_catalog_versions():
+    await catalog_versions.ensure_indexes()
+    stamped = await catalog_versions.stamp_unversioned()
+    if stamped:
+        logger.info("Stamped %d products with a catalog version", stamped)
+
+@app.on_event("startup")
+async def start_catalog_snapshot():
+    # After prepare_catalog_versions, so every product carries a version
+    app.state.catalog_snapshot = asyncio.create_task(catalog_snapshot_loop())
+    app.state.recommendations = asyncio.create_task(recommendations_loop())
+    app.state.similarity = asyncio.create_task(similarity_loop())
+
+@app.on_event("startup")
+async def create_user_indexes():
+    # Registration and cart upserts rely on these instead of checking first
+    for collection, field in ((db.users, "email"), (db.carts, "user_id")):
+        try:
+            await collection.create_index(field, unique=True)
+        except OperationFailure as e:
+            # Duplicates written before the index existed; they need merging by hand
+            logger.error("Unique index on %s.%s not created: %s", collection.name, field, e)
+
+@app.on_event("startup")
+async def create_upload_session_indexes():
+    await upload_sessions.ensure_indexes()
+
+@app.on_event("startup")
+async def create_guest_cart_index():
+    await db.guest_carts.create_index("id", unique=True)
+    await db.guest_carts.create_index("expires_at", expireAfterSeconds=0)
+
+@app.on_event("startup")
+async def prepare_rate_limits():
+    if isinstance(rate_limiter.store, MongoBucketStore):
+        await rate_limiter.store.ensure_indexes()
+
+@app.on_event("startup")
+async def start_order_events():
+    order_events.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    app.state.image_reconciler.cancel()
+    app.state.maintenance.cancel()
+    app.state.catalog_snapshot.cancel()
+    app.state.recommendations.cancel()
+    app.state.similarity.cancel()
+    await order_events.stop()
+    # Let queued side effects finish while the database is still reachable
+    await job_queue.drain(JOB_DRAIN_TIMEOUT_SECONDS)
     client.close()
\ No newline at end of file
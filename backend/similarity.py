@@ -0,0 +1,221 @@
+"""Content-based "similar products" from TF-IDF text features.
+
+Each product becomes a bag of weighted terms: words of its name (counted double)
+and description, ``color:<c>`` for every color, ``category:<c>`` and a logarithmic
+price bucket (with half weight on the neighbouring buckets, so close prices still
+overlap). Vectors are TF-IDF weighted and L2-normalized, so a dot product is the
+cosine similarity.
+
+The matrix is held in CSR form (``indptr``/``indices``/``data``) and split by
+term frequency. Frequent terms (colors, categories, price buckets, common words)
+form a small dense block, scored with one matrix product per batch. The long
+tail of rare terms is scored through postings (the transpose, grouped by term):
+the batch's terms are walked and the products summed with one ``np.bincount``.
+The top K per row then comes from ``np.argpartition``; batches are sized so the
+dense score block stays within ``batch_cells``.
+
+``apply`` takes the products changed and deleted since the last call. Terms are
+only recomputed for those; the matrix is rebuilt (linear in its size) and, when
+few products changed, only the changed rows are scored. Every other product
+merges its stored neighbours with its scores against the changed rows, which the
+symmetric similarity gives for free. A full recompute happens once the changes
+since the last one exceed ``full_rebuild_ratio`` of the catalog, or on ``rebuild``.
+"""
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+TOKEN = re.compile(r"[a-z0-9]+")
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from in is it of on or our the this to with your you".split()
+)
+PRICE_BUCKET_RATIO = 1.3
+
+
+def _ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenation of ``range(start, start + length)`` for each pair."""
+    total = int(lengths.sum())
+    if total == 0:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.arange(total, dtype=np.int64) - offsets + np.repeat(starts, lengths)
+
+
+def product_terms(product: dict) -> Counter:
+    terms = Counter()
+    for word in TOKEN.findall((product.get("name") or "").lower()):
+        if len(word) > 1 and word not in STOP_WORDS:
+            terms[word] += 2.0
+    for word in TOKEN.findall((product.get("description") or "").lower()):
+        if len(word) > 1 and word not in STOP_WORDS:
+            terms[word] += 1.0
+    for color in product.get("colors") or []:
+        terms[f"color:{color.lower()}"] += 1.0
+    if product.get("category"):
+        terms[f"category:{product['category'].lower()}"] += 1.0
+    price = product.get("price") or 0
+    if price > 0:
+        bucket = round(math.log(price, PRICE_BUCKET_RATIO))
+        terms[f"price:{bucket}"] += 1.0
+        terms[f"price:{bucket - 1}"] += 0.5
+        terms[f"price:{bucket + 1}"] += 0.5
+    return terms
+
+
+class SimilarityIndex:
+    def __init__(self, top_k: int = 8, max_df: float = 0.5, batch_cells: int = 4_000_000,
+                 full_rebuild_ratio: float = 0.1, max_dense_terms: int = 256):
+        self.top_k = top_k
+        # Terms in more than this share of products (e.g. a dominant category) carry
+        # little signal and are the longest postings, so they are dropped
+        self.max_df = max_df
+        self.batch_cells = batch_cells
+        self.full_rebuild_ratio = full_rebuild_ratio
+        self.max_dense_terms = max_dense_terms
+        # Incremental updates keep old IDF weights and cannot refill a slot freed by a
+        # changed neighbour, so they drift; once enough have accumulated, recompute
+        self.changed_since_rebuild = 0
+        self.terms: Dict[str, Counter] = {}
+        self.ids: List[str] = []
+        self.rows: Dict[str, int] = {}
+        self.neighbours: Dict[str, List[Tuple[str, float]]] = {}
+
+    def _build_matrix(self):
+        self.ids = list(self.terms)
+        self.rows = {product_id: row for row, product_id in enumerate(self.ids)}
+        n = len(self.ids)
+        df = Counter(term for terms in self.terms.values() for term in terms)
+        vocabulary = {}
+        for term, count in df.items():
+            if n < 10 or count <= self.max_df * n:
+                vocabulary[term] = len(vocabulary)
+        idf = np.ones(len(vocabulary))
+        for term, column in vocabulary.items():
+            idf[column] = math.log((1 + n) / (1 + df[term])) + 1
+
+        indptr, indices, data = [0], [], []
+        for product_id in self.ids:
+            for term, weight in self.terms[product_id].items():
+                column = vocabulary.get(term)
+                if column is not None:
+                    indices.append(column)
+                    data.append(weight)
+            indptr.append(len(indices))
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.data = np.array(data, dtype=np.float64) * idf[self.indices] if indices else np.zeros(0)
+        # L2-normalize every row
+        lengths = np.diff(self.indptr)
+        row_of = np.repeat(np.arange(n), lengths)
+        norms = np.sqrt(np.bincount(row_of, weights=self.data ** 2, minlength=n))
+        norms[norms == 0] = 1.0
+        self.data = self.data / norms[row_of]
+
+        # Terms in more than ~1% of products have postings too long to walk; they go
+        # into the dense block instead
+        column_df = np.bincount(self.indices, minlength=len(vocabulary))
+        frequent = np.argsort(-column_df, kind="stable")[:self.max_dense_terms]
+        frequent = frequent[column_df[frequent] > max(8, n // 100)]
+        self.dense_column = np.full(len(vocabulary), -1, dtype=np.int64)
+        self.dense_column[frequent] = np.arange(len(frequent))
+        in_dense = self.dense_column[self.indices] >= 0
+        self.dense = np.zeros((n, len(frequent)))
+        self.dense[row_of[in_dense], self.dense_column[self.indices[in_dense]]] = self.data[in_dense]
+
+        # Postings of the remaining terms: the matrix grouped by term
+        sparse = np.flatnonzero(~in_dense)
+        order = sparse[np.argsort(self.indices[sparse], kind="stable")]
+        self.posting_rows = row_of[order]
+        self.posting_data = self.data[order]
+        self.term_ptr = np.concatenate([[0], np.cumsum(np.bincount(self.indices[order], minlength=len(vocabulary)))])
+
+    def _scores(self, rows: np.ndarray) -> np.ndarray:
+        """Cosine similarity of ``rows`` against every product, as a dense block."""
+        n = len(self.ids)
+        starts = self.indptr[rows]
+        lengths = self.indptr[rows + 1] - starts
+        query = np.repeat(np.arange(len(rows)), lengths)
+        positions = _ranges(starts, lengths)
+        sparse = self.dense_column[self.indices[positions]] < 0
+        query, positions = query[sparse], positions[sparse]
+        terms, weights = self.indices[positions], self.data[positions]
+        posting_starts = self.term_ptr[terms]
+        posting_lengths = self.term_ptr[terms + 1] - posting_starts
+        postings = _ranges(posting_starts, posting_lengths)
+        cells = np.repeat(query, posting_lengths) * n + self.posting_rows[postings]
+        contributions = np.repeat(weights, posting_lengths) * self.posting_data[postings]
+        scores = np.bincount(cells, weights=contributions, minlength=len(rows) * n).reshape(len(rows), n)
+        return scores + self.dense[rows] @ self.dense.T
+
+    def _batches(self, rows: np.ndarray) -> Iterable[Tuple[np.ndarray, np.ndarray]]:
+        size = max(1, self.batch_cells // max(1, len(self.ids)))
+        for start in range(0, len(rows), size):
+            batch = rows[start:start + size]
+            yield batch, self._scores(batch)
+
+    def _top(self, batch: np.ndarray, scores: np.ndarray) -> List[List[Tuple[str, float]]]:
+        """Best ``top_k`` neighbours of each row of a score block (modified in place)."""
+        scores[np.arange(len(batch)), batch] = 0.0
+        k = min(self.top_k, scores.shape[1] - 1)
+        if k <= 0:
+            return [[] for _ in batch]
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        best_scores = np.take_along_axis(scores, best, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind="stable")
+        best, best_scores = np.take_along_axis(best, order, axis=1), np.take_along_axis(best_scores, order, axis=1)
+        return [
+            [(self.ids[i], float(score)) for i, score in zip(row_best, row_scores) if score > 0]
+            for row_best, row_scores in zip(best.tolist(), best_scores.tolist())
+        ]
+
+    def rebuild(self):
+        self._build_matrix()
+        neighbours = {}
+        for batch, scores in self._batches(np.arange(len(self.ids))):
+            for row, top in zip(batch, self._top(batch, scores)):
+                neighbours[self.ids[row]] = top
+        # Swapped in whole, so readers never see a partial index
+        self.neighbours = neighbours
+        self.changed_since_rebuild = 0
+
+    def apply(self, changed: List[dict], deleted: Iterable[str] = ()) -> dict:
+        """Update the index for changed and deleted products."""
+        deleted = set(deleted)
+        for product_id in deleted:
+            self.terms.pop(product_id, None)
+        for product in changed:
+            self.terms[product["id"]] = product_terms(product)
+        touched = {product["id"] for product in changed} | deleted
+        self.changed_since_rebuild += len(touched)
+        if not self.neighbours or self.changed_since_rebuild > self.full_rebuild_ratio * max(1, len(self.terms)):
+            self.rebuild()
+            return {"products": len(self.ids), "scored": len(self.ids)}
+
+        self._build_matrix()
+        changed_rows = np.array([self.rows[p["id"]] for p in changed if p["id"] in self.rows], dtype=np.int64)
+        for product_id in deleted:
+            self.neighbours.pop(product_id, None)
+        fresh = {}
+        for batch, scores in self._batches(changed_rows):
+            for offset, row in enumerate(batch):
+                fresh[row] = scores[offset].copy()
+            for row, top in zip(batch, self._top(batch, scores)):
+                self.neighbours[self.ids[row]] = top
+        changed_ids = {self.ids[row] for row in fresh}
+        for product_id, current in self.neighbours.items():
+            if product_id in changed_ids:
+                continue
+            row = self.rows[product_id]
+            kept = [(other, score) for other, score in current if other not in touched]
+            kept += [(self.ids[changed_row], float(scores[row])) for changed_row, scores in fresh.items()
+                     if scores[row] > 0]
+            kept.sort(key=lambda entry: -entry[1])
+            self.neighbours[product_id] = kept[:self.top_k]
+        return {"products": len(self.ids), "scored": len(fresh)}
+
+    def get(self, product_id: str) -> Optional[List[str]]:
+        neighbours = self.neighbours.get(product_id)
+        return None if neighbours is None else [other for other, _ in neighbours]
@@ -0,0 +1,72 @@
+"""Request coalescing for hot read endpoints.
+
+``SingleFlight.get(key, load)`` runs ``load`` once for any number of concurrent
+callers with the same key: the first caller starts it and the others await the same
+future. The result is then kept for a short micro-cache window (``ttl``), so a burst
+of identical requests - a promotion going live - costs one database query and one
+serialization instead of one per client.
+
+``clear()`` starts a new generation: loads already in flight still answer their
+waiters but are not cached, so nothing read before a catalog write outlives it.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    def __init__(self, ttl: float = 1.0, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._generation = 0
+        self.counters = {"requests": 0, "cache_hits": 0, "coalesced": 0, "loads": 0, "errors": 0}
+
+    async def get(self, key: Hashable, load: Callable[[], Awaitable]):
+        self.counters["requests"] += 1
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self.counters["cache_hits"] += 1
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.counters["coalesced"] += 1
+        else:
+            # A task of its own, so the first caller disconnecting does not cancel the others
+            task = asyncio.create_task(load())
+            self._inflight[key] = task
+            self.counters["loads"] += 1
+            task.add_done_callback(lambda t, generation=self._generation: self._finished(key, t, generation))
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task, generation: int):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            self.counters["errors"] += 1
+            return
+        if generation == self._generation and self.ttl > 0:
+            self._cache[key] = (time.monotonic() + self.ttl, task.result())
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        self._generation += 1
+        self._cache.clear()
+        # Later callers start a fresh load instead of joining one that read old data
+        self._inflight.clear()
+
+    def stats(self) -> dict:
+        requests = self.counters["requests"]
+        served = self.counters["cache_hits"] + self.counters["coalesced"]
+        return {
+            **self.counters,
+            "inflight": len(self._inflight),
+            "cached": len(self._cache),
+            # Share of requests answered without their own database query
+            "coalescing_ratio": round(served / requests, 4) if requests else 0.0,
+        }
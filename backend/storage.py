@@ -0,0 +1,225 @@
+"""Image storage backends.
+
+``server.py`` only talks to the ``ImageStorage`` interface, so product images can
+live on the local disk (single node) or in any S3-compatible object store (AWS S3,
+MinIO, moto's server mode for local testing). Select the backend with
+``IMAGE_STORAGE=filesystem|s3``; see ``build_storage`` for the S3 settings.
+"""
+import asyncio
+import os
+import uuid
+from pathlib import Path
+from typing import BinaryIO, List, Optional
+
+# Keys are content hashes, so a stored object never changes
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class ImageStorage:
+    """Interface for image backends. Keys are bare filenames such as ``<sha256>.jpg``."""
+
+    async def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    async def read(self, key: str) -> bytes:
+        raise NotImplementedError
+
+    async def save(self, key: str, data: bytes, content_type: Optional[str] = None):
+        raise NotImplementedError
+
+    async def save_file(self, key: str, fileobj: BinaryIO, content_type: Optional[str] = None):
+        """Stream a file object into storage without loading it into memory."""
+        raise NotImplementedError
+
+    async def delete(self, key: str):
+        raise NotImplementedError
+
+    async def list_keys(self) -> List[str]:
+        raise NotImplementedError
+
+    def public_url(self, key: str) -> Optional[str]:
+        """Direct URL clients can fetch without going through the API, if the backend has one."""
+        return None
+
+    async def redirect_url(self, key: str) -> Optional[str]:
+        """URL ``/api/images/{key}`` should redirect to instead of proxying the bytes."""
+        return None
+
+    def local_path(self, key: str) -> Optional[Path]:
+        """Path on this node's disk, for backends that serve files locally."""
+        return None
+
+
+class FileSystemStorage(ImageStorage):
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def local_path(self, key: str) -> Path:
+        return self.root / key
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self.local_path(key).exists)
+
+    async def read(self, key: str) -> bytes:
+        return await asyncio.to_thread(self.local_path(key).read_bytes)
+
+    async def save(self, key: str, data: bytes, content_type: Optional[str] = None):
+        await asyncio.to_thread(self._write, key, lambda f: f.write(data))
+
+    async def save_file(self, key: str, fileobj: BinaryIO, content_type: Optional[str] = None):
+        def copy(f):
+            while chunk := fileobj.read(1024 * 1024):
+                f.write(chunk)
+        await asyncio.to_thread(self._write, key, copy)
+
+    def _write(self, key: str, writer):
+        # Write to a temporary name and rename so readers never see a partial file
+        path = self.local_path(key)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                writer(f)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    async def delete(self, key: str):
+        def unlink():
+            try:
+                self.local_path(key).unlink()
+            except FileNotFoundError:
+                pass
+        await asyncio.to_thread(unlink)
+
+    async def list_keys(self) -> List[str]:
+        return await asyncio.to_thread(
+            lambda: [p.name for p in self.root.iterdir() if p.is_file() and not p.name.startswith(".")]
+        )
+
+
+class S3Storage(ImageStorage):
+    """S3-compatible backend. boto3 calls run in worker threads to keep the event loop free."""
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "products/",
+        endpoint_url: Optional[str] = None,
+        region_name: Optional[str] = None,
+        public_base_url: Optional[str] = None,
+        presign_expires: int = 3600,
+        part_size: int = 8 * 1024 * 1024,
+        client=None,
+    ):
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.public_base_url = public_base_url.rstrip("/") if public_base_url else None
+        self.presign_expires = presign_expires
+        self.client = client or boto3.client("s3", endpoint_url=endpoint_url, region_name=region_name)
+        self.transfer_config = TransferConfig(multipart_threshold=part_size, multipart_chunksize=part_size)
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _extra_args(self, content_type: Optional[str]) -> dict:
+        extra = {"CacheControl": IMMUTABLE_CACHE_CONTROL}
+        if content_type:
+            extra["ContentType"] = content_type
+        return extra
+
+    async def exists(self, key: str) -> bool:
+        from botocore.exceptions import ClientError
+
+        try:
+            await asyncio.to_thread(self.client.head_object, Bucket=self.bucket, Key=self._object_key(key))
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return False
+            raise
+
+    async def read(self, key: str) -> bytes:
+        def get():
+            return self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))["Body"].read()
+        return await asyncio.to_thread(get)
+
+    async def save(self, key: str, data: bytes, content_type: Optional[str] = None):
+        await asyncio.to_thread(
+            self.client.put_object,
+            Bucket=self.bucket,
+            Key=self._object_key(key),
+            Body=data,
+            **self._extra_args(content_type)
+        )
+
+    async def save_file(self, key: str, fileobj: BinaryIO, content_type: Optional[str] = None):
+        # upload_fileobj switches to a multipart upload above part_size and
+        # reads the file one part at a time
+        await asyncio.to_thread(
+            self.client.upload_fileobj,
+            fileobj,
+            self.bucket,
+            self._object_key(key),
+            ExtraArgs=self._extra_args(content_type),
+            Config=self.transfer_config
+        )
+
+    async def delete(self, key: str):
+        await asyncio.to_thread(self.client.delete_object, Bucket=self.bucket, Key=self._object_key(key))
+
+    async def list_keys(self) -> List[str]:
+        def list_all():
+            keys = []
+            paginator = self.client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+                for obj in page.get("Contents", []):
+                    keys.append(obj["Key"][len(self.prefix):])
+            return keys
+        return await asyncio.to_thread(list_all)
+
+    def public_url(self, key: str) -> Optional[str]:
+        if self.public_base_url:
+            return f"{self.public_base_url}/{self._object_key(key)}"
+        return None
+
+    async def redirect_url(self, key: str) -> Optional[str]:
+        url = self.public_url(key)
+        if url:
+            return url
+        return await asyncio.to_thread(
+            self.client.generate_presigned_url,
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": self._object_key(key)},
+            ExpiresIn=self.presign_expires
+        )
+
+
+def build_storage(upload_dir: Path) -> ImageStorage:
+    """Create the backend selected by the environment.
+
+    IMAGE_STORAGE         filesystem (default) or s3
+    S3_BUCKET             bucket name (required for s3)
+    S3_PREFIX             key prefix, default ``products/``
+    S3_ENDPOINT_URL       custom endpoint for MinIO or a local moto server
+    S3_REGION             AWS region
+    S3_PUBLIC_BASE_URL    CDN/public bucket URL; when unset, presigned URLs are used
+    S3_PRESIGN_EXPIRES    presigned URL lifetime in seconds, default 3600
+    """
+    backend = os.environ.get("IMAGE_STORAGE", "filesystem").lower()
+    if backend == "filesystem":
+        return FileSystemStorage(upload_dir)
+    if backend == "s3":
+        return S3Storage(
+            bucket=os.environ["S3_BUCKET"],
+            prefix=os.environ.get("S3_PREFIX", "products/"),
+            endpoint_url=os.environ.get("S3_ENDPOINT_URL"),
+            region_name=os.environ.get("S3_REGION"),
+            public_base_url=os.environ.get("S3_PUBLIC_BASE_URL"),
+            presign_expires=int(os.environ.get("S3_PRESIGN_EXPIRES", 3600)),
+        )
+    raise ValueError(f"Unknown IMAGE_STORAGE backend: {backend}")
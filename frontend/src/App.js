@@ -25,14 +25,20 @@ export const AuthContext = React.createContext();
 function App() {
   const [user, setUser] = useState(null);
   const [token, setToken] = useState(localStorage.getItem('token'));
+  const [guestCart, setGuestCart] = useState(localStorage.getItem('guestCart'));
   const [cartCount, setCartCount] = useState(0);
 
+  // Signed-in users own a cart; anonymous visitors get a server-side guest cart
+  const cartParams = token ? `token=${token}` : guestCart ? `guest_cart=${guestCart}` : null;
+
   useEffect(() => {
     if (token) {
       loadUser();
+    }
+    if (cartParams) {
       loadCartCount();
     }
-  }, [token]);
+  }, [token, guestCart]);
 
   const loadUser = async () => {
     try {
@@ -44,17 +50,26 @@ function App() {
     }
   };
 
-  const loadCartCount = async () => {
+  // Callers that just changed the cart's owner pass the new params; state updates land on the next render
+  const loadCartCount = async (params = cartParams) => {
     try {
-      const response = await axios.get(`${API}/cart?token=${token}`);
+      const response = await axios.get(`${API}/cart?${params}`);
       setCartCount(response.data.items?.length || 0);
     } catch (error) {
       console.error('Failed to load cart', error);
     }
   };
 
+  const saveGuestCart = (guestCartId) => {
+    localStorage.setItem('guestCart', guestCartId);
+    setGuestCart(guestCartId);
+  };
+
   const login = (newToken, userData) => {
     localStorage.setItem('token', newToken);
+    // The server merged the guest cart into the user's cart during login
+    localStorage.removeItem('guestCart');
+    setGuestCart(null);
     setToken(newToken);
     setUser(userData);
   };
@@ -67,14 +82,14 @@ function App() {
   };
 
   return (
-    <AuthContext.Provider value={{ user, token, login, logout, cartCount, setCartCount, loadCartCount }}>
+    <AuthContext.Provider value={{ user, token, guestCart, cartParams, saveGuestCart, login, logout, cartCount, setCartCount, loadCartCount }}>
       <div className="App">
         <BrowserRouter>
           <Header />
           <Routes>
             <Route path="/" element={<Home />} />
             <Route path="/product/:id" element={<ProductDetail />} />
-            <Route path="/cart" element={token ? <Cart /> : <Navigate to="/login" />} />
+            <Route path="/cart" element={<Cart />} />
             <Route path="/checkout" element={token ? <Checkout /> : <Navigate to="/login" />} />
             <Route path="/orders" element={token ? <Orders /> : <Navigate to="/login" />} />
             <Route path="/login" element={<Login />} />
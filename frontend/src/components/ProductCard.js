@@ -7,6 +7,8 @@ const ProductCard = ({ product }) => {
   const imageUrl = product.images && product.images.length > 0 && product.images[0].url
     ? `${BACKEND_URL}${product.images[0].url}`
     : 'https://via.placeholder.com/300x400?text=No+Image';
+  // Dominant colour from upload time, painted until the image arrives
+  const placeholderColor = product.images?.[0]?.palette?.[0]?.hex;
 
   console.log('ProductCard image URL:', imageUrl);
 
@@ -16,7 +18,10 @@ const ProductCard = ({ product }) => {
       className="product-card block bg-white rounded-xl overflow-hidden shadow-lg hover:shadow-2xl"
       data-testid={`product-card-${product.id}`}
     >
-      <div className="relative h-64 overflow-hidden bg-gray-100">
+      <div
+        className="relative h-64 overflow-hidden bg-gray-100"
+        style={placeholderColor ? { backgroundColor: placeholderColor } : undefined}
+      >
         <img
           src={imageUrl}
           alt={product.name}
@@ -0,0 +1,89 @@
+import axios from 'axios';
+
+// Files above this go through a resumable upload session instead of one request
+export const RESUMABLE_THRESHOLD = 5 * 1024 * 1024;
+const MAX_RETRIES = 5;
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+const toHex = (buffer) =>
+  Array.from(new Uint8Array(buffer), (b) => b.toString(16).padStart(2, '0')).join('');
+
+const sha256 = async (blob) => toHex(await crypto.subtle.digest('SHA-256', await blob.arrayBuffer()));
+
+// The session of an interrupted upload is remembered per file, so picking the
+// same file again (even after a reload) continues where it stopped
+const sessionKey = (file) => `upload:${file.name}:${file.size}:${file.lastModified}`;
+
+const uploadWhole = async (api, token, file) => {
+  const formData = new FormData();
+  formData.append('file', file);
+  const response = await axios.post(`${api}/admin/upload-image?token=${token}`, formData, {
+    headers: { 'Content-Type': 'multipart/form-data' }
+  });
+  return response.data;
+};
+
+const openSession = async (api, token, file) => {
+  const saved = localStorage.getItem(sessionKey(file));
+  if (saved) {
+    try {
+      const response = await axios.get(`${api}/admin/uploads/${saved}?token=${token}`);
+      return response.data;
+    } catch (error) {
+      // Expired or already completed; start over
+      localStorage.removeItem(sessionKey(file));
+    }
+  }
+  // No whole-file hash: WebCrypto cannot hash incrementally, so it would read the
+  // entire file into memory. Each chunk carries its own checksum instead.
+  const response = await axios.post(`${api}/admin/uploads`, null, {
+    params: { token, size: file.size, filename: file.name }
+  });
+  localStorage.setItem(sessionKey(file), response.data.id);
+  return response.data;
+};
+
+/**
+ * Upload an image, in checksummed chunks when it is large. Failed chunks are
+ * retried; the server's offset decides where to continue. Resolves with the
+ * image metadata, like /admin/upload-image.
+ */
+export const uploadImage = async (api, token, file, onProgress) => {
+  if (file.size <= RESUMABLE_THRESHOLD || !window.crypto?.subtle) {
+    return uploadWhole(api, token, file);
+  }
+
+  const session = await openSession(api, token, file);
+  let offset = session.offset;
+  let failures = 0;
+  while (offset < file.size) {
+    const chunk = file.slice(offset, offset + session.chunk_size);
+    try {
+      const response = await axios.patch(`${api}/admin/uploads/${session.id}`, chunk, {
+        params: { token, offset, checksum: await sha256(chunk) },
+        headers: { 'Content-Type': 'application/octet-stream' }
+      });
+      offset = response.data.offset;
+      failures = 0;
+      if (onProgress) onProgress(offset / file.size);
+    } catch (error) {
+      const detail = error.response?.data?.detail;
+      if (error.response?.status === 404 || ++failures > MAX_RETRIES) {
+        localStorage.removeItem(sessionKey(file));
+        throw error;
+      }
+      if (detail && typeof detail.offset === 'number') {
+        offset = detail.offset;
+      }
+      await sleep(500 * 2 ** failures);
+    }
+  }
+
+  try {
+    const response = await axios.post(`${api}/admin/uploads/${session.id}/complete?token=${token}`);
+    return response.data;
+  } finally {
+    localStorage.removeItem(sessionKey(file));
+  }
+};
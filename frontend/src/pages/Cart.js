@@ -10,7 +10,7 @@ import { Toaster } from '../components/ui/sonner';
 const Cart = () => {
   const [cart, setCart] = useState({ items: [] });
   const [loading, setLoading] = useState(true);
-  const { token, loadCartCount } = useContext(AuthContext);
+  const { cartParams, loadCartCount } = useContext(AuthContext);
   const navigate = useNavigate();
 
   useEffect(() => {
@@ -18,8 +18,13 @@ const Cart = () => {
   }, []);
 
   const loadCart = async () => {
+    if (!cartParams) {
+      // Nothing added yet, so there is no guest cart
+      setLoading(false);
+      return;
+    }
     try {
-      const response = await axios.get(`${API}/cart?token=${token}`);
+      const response = await axios.get(`${API}/cart?${cartParams}`);
       setCart(response.data);
       setLoading(false);
     } catch (error) {
@@ -35,8 +40,9 @@ const Cart = () => {
     updatedItems[itemIndex].quantity = newQuantity;
 
     try {
-      await axios.put(`${API}/cart/update?token=${token}`, updatedItems);
-      setCart({ ...cart, items: updatedItems });
+      await axios.put(`${API}/cart/update?${cartParams}`, updatedItems);
+      // Reload to get the totals and stock checks recomputed by the server
+      loadCart();
       loadCartCount();
     } catch (error) {
       toast.error('Failed to update cart');
@@ -45,7 +51,7 @@ const Cart = () => {
 
   const removeItem = async (productId) => {
     try {
-      await axios.delete(`${API}/cart/remove/${productId}?token=${token}`);
+      await axios.delete(`${API}/cart/remove/${productId}?${cartParams}`);
       loadCart();
       loadCartCount();
       toast.success('Item removed from cart');
@@ -55,7 +61,14 @@ const Cart = () => {
   };
 
   const getTotalPrice = () => {
-    return cart.items.reduce((total, item) => total + item.price * item.quantity, 0).toFixed(2);
+    return (cart.summary?.total ?? 0).toFixed(2);
+  };
+
+  const ISSUE_LABELS = {
+    unavailable: 'No longer available',
+    out_of_stock: 'Out of stock',
+    insufficient_stock: 'Not enough stock',
+    option_unavailable: 'Size or color no longer available',
   };
 
   if (loading) {
@@ -107,12 +120,24 @@ const Cart = () => {
 
                 <div className="flex-1">
                   <h3 className="text-xl font-bold mb-1" data-testid={`item-product-id-${index}`}>
-                    Product ID: {item.product_id.substring(0, 8)}...
+                    {item.product_name || `Product ID: ${item.product_id.substring(0, 8)}...`}
                   </h3>
                   <div className="text-sm text-gray-600 space-y-1">
                     <p>Size: <span className="font-semibold">{item.size}</span></p>
                     <p>Color: <span className="font-semibold">{item.color}</span></p>
-                    <p className="text-lg font-bold text-orange-600">₹{item.price}</p>
+                    <p className="text-lg font-bold text-orange-600">
+                      ₹{item.price}
+                      {item.previous_price != null && (
+                        <span className="ml-2 text-sm text-gray-400 line-through">₹{item.previous_price}</span>
+                      )}
+                    </p>
+                    {item.issues?.filter((issue) => ISSUE_LABELS[issue]).map((issue) => (
+                      <p key={issue} className="text-red-600 font-semibold">
+                        {issue === 'insufficient_stock'
+                          ? `Only ${item.available_quantity} left`
+                          : ISSUE_LABELS[issue]}
+                      </p>
+                    ))}
                   </div>
                 </div>
 
@@ -154,8 +179,8 @@ const Cart = () => {
 
               <div className="space-y-4 mb-6">
                 <div className="flex justify-between text-gray-600">
-                  <span>Subtotal ({cart.items.length} items)</span>
-                  <span data-testid="subtotal">₹{getTotalPrice()}</span>
+                  <span>Subtotal ({cart.summary?.item_count ?? 0} items)</span>
+                  <span data-testid="subtotal">₹{(cart.summary?.subtotal ?? 0).toFixed(2)}</span>
                 </div>
                 <div className="flex justify-between text-gray-600">
                   <span>Shipping</span>
@@ -169,6 +194,7 @@ const Cart = () => {
 
               <Button
                 onClick={() => navigate('/checkout')}
+                disabled={!cart.summary?.can_checkout}
                 className="w-full bg-gradient-to-r from-orange-500 to-pink-600 text-white font-bold py-6 rounded-full text-lg hover:shadow-2xl"
                 data-testid="checkout-button"
               >
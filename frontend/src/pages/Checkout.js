@@ -27,7 +27,7 @@ const Checkout = () => {
   const loadCart = async () => {
     try {
       const response = await axios.get(`${API}/cart?token=${token}`);
-      if (response.data.items.length === 0) {
+      if (response.data.items.length === 0 || !response.data.summary.can_checkout) {
         navigate('/cart');
         return;
       }
@@ -40,7 +40,7 @@ const Checkout = () => {
   };
 
   const getTotalPrice = () => {
-    return cart.items.reduce((total, item) => total + item.price * item.quantity, 0).toFixed(2);
+    return (cart.summary?.total ?? 0).toFixed(2);
   };
 
   const handlePlaceOrder = async (e) => {
@@ -53,10 +53,10 @@ const Checkout = () => {
     setProcessing(true);
 
     try {
-      // Create order items with product names
+      // Prices and names are re-checked against the catalog by the server
       const orderItems = cart.items.map(item => ({
         product_id: item.product_id,
-        product_name: `Product ${item.product_id.substring(0, 8)}`,
+        product_name: item.product_name,
         quantity: item.quantity,
         size: item.size,
         color: item.color,
@@ -66,7 +66,7 @@ const Checkout = () => {
       const orderData = {
         items: orderItems,
         shipping_address: address,
-        total_amount: parseFloat(getTotalPrice())
+        total_amount: cart.summary.total
       };
 
       await axios.post(`${API}/orders/create?token=${token}`, orderData);
@@ -79,7 +79,13 @@ const Checkout = () => {
       }, 1500);
     } catch (error) {
       console.error('Order failed', error);
-      toast.error('Failed to place order');
+      if (error.response?.status === 409) {
+        // Prices or stock changed since the cart was loaded: show the updated cart
+        toast.error(error.response.data.detail.message);
+        loadCart();
+      } else {
+        toast.error('Failed to place order');
+      }
       setProcessing(false);
     }
   };
@@ -149,9 +155,9 @@ const Checkout = () => {
               {cart.items.map((item, index) => (
                 <div key={index} className="flex justify-between text-gray-700" data-testid={`order-item-${index}`}>
                   <span>
-                    Product {item.product_id.substring(0, 8)} ({item.size}, {item.color}) x {item.quantity}
+                    {item.product_name} ({item.size}, {item.color}) x {item.quantity}
                   </span>
-                  <span className="font-semibold">₹{(item.price * item.quantity).toFixed(2)}</span>
+                  <span className="font-semibold">₹{item.line_total.toFixed(2)}</span>
                 </div>
               ))}
             </div>
@@ -6,10 +6,24 @@ import { Package, Clock, Truck, CheckCircle } from 'lucide-react';
 const Orders = () => {
   const [orders, setOrders] = useState([]);
   const [loading, setLoading] = useState(true);
+  // Lists carry summaries only; full orders are loaded when expanded
+  const [details, setDetails] = useState({});
+  const [expanded, setExpanded] = useState(null);
   const { token } = useContext(AuthContext);
 
   useEffect(() => {
     loadOrders();
+
+    // Status changes are pushed by the server instead of re-fetching the list
+    const events = new EventSource(`${API}/orders/stream?token=${token}`);
+    events.addEventListener('order_status', (e) => {
+      const update = JSON.parse(e.data);
+      setOrders((current) =>
+        current.map((order) => (order.id === update.id ? { ...order, ...update } : order))
+      );
+    });
+    events.addEventListener('resync', () => loadOrders());
+    return () => events.close();
   }, []);
 
   const loadOrders = async () => {
@@ -23,6 +37,23 @@ const Orders = () => {
     }
   };
 
+  const toggleItems = async (order) => {
+    if (expanded === order.id) {
+      setExpanded(null);
+      return;
+    }
+    setExpanded(order.id);
+    if (details[order.id]) return;
+    try {
+      const response = await axios.get(`${API}/orders/${order.id}`, {
+        params: { token, created_at: order.created_at }
+      });
+      setDetails((current) => ({ ...current, [order.id]: response.data }));
+    } catch (error) {
+      console.error('Failed to load order', error);
+    }
+  };
+
   const getStatusIcon = (status) => {
     switch (status) {
       case 'pending':
@@ -107,25 +138,52 @@ const Orders = () => {
                 </div>
               </div>
 
-              <div className="border-t pt-4">
-                <h4 className="font-bold mb-3">Items:</h4>
-                <div className="space-y-2">
-                  {order.items.map((item, idx) => (
-                    <div key={idx} className="flex justify-between text-gray-700" data-testid={`order-item-${order.id}-${idx}`}>
-                      <span>
-                        {item.product_name} ({item.size}, {item.color}) x {item.quantity}
-                      </span>
-                      <span className="font-semibold">₹{(item.price * item.quantity).toFixed(2)}</span>
-                    </div>
-                  ))}
+              <div className="border-t pt-4 flex items-center justify-between">
+                <div className="flex items-center space-x-3 text-gray-700">
+                  {order.first_item_image && (
+                    <img
+                      src={`${process.env.REACT_APP_BACKEND_URL || ''}${order.first_item_image}`}
+                      alt=""
+                      className="w-12 h-12 rounded-lg object-cover"
+                    />
+                  )}
+                  <span data-testid={`order-summary-${order.id}`}>
+                    {order.first_item_name}
+                    {order.item_count > 1 && ` and ${order.item_count - 1} more`} ({order.quantity} items)
+                  </span>
                 </div>
+                <button
+                  onClick={() => toggleItems(order)}
+                  className="text-orange-600 font-semibold hover:underline"
+                  data-testid={`order-toggle-${order.id}`}
+                >
+                  {expanded === order.id ? 'Hide details' : 'View details'}
+                </button>
               </div>
 
-              <div className="border-t mt-4 pt-4">
-                <p className="text-gray-600">
-                  <span className="font-semibold">Shipping to:</span> {order.shipping_address}
-                </p>
-              </div>
+              {expanded === order.id && details[order.id] && (
+                <>
+                  <div className="border-t mt-4 pt-4">
+                    <h4 className="font-bold mb-3">Items:</h4>
+                    <div className="space-y-2">
+                      {details[order.id].items.map((item, idx) => (
+                        <div key={idx} className="flex justify-between text-gray-700" data-testid={`order-item-${order.id}-${idx}`}>
+                          <span>
+                            {item.product_name} ({item.size}, {item.color}) x {item.quantity}
+                          </span>
+                          <span className="font-semibold">₹{(item.price * item.quantity).toFixed(2)}</span>
+                        </div>
+                      ))}
+                    </div>
+                  </div>
+
+                  <div className="border-t mt-4 pt-4">
+                    <p className="text-gray-600">
+                      <span className="font-semibold">Shipping to:</span> {details[order.id].shipping_address}
+                    </p>
+                  </div>
+                </>
+              )}
             </div>
           ))}
         </div>
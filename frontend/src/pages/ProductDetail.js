@@ -15,7 +15,7 @@ const ProductDetail = () => {
   const [selectedColor, setSelectedColor] = useState('');
   const [selectedImage, setSelectedImage] = useState(0);
   const [quantity, setQuantity] = useState(1);
-  const { token, loadCartCount } = useContext(AuthContext);
+  const { cartParams, saveGuestCart, loadCartCount } = useContext(AuthContext);
   const navigate = useNavigate();
 
   useEffect(() => {
@@ -37,22 +37,21 @@ const ProductDetail = () => {
   };
 
   const handleAddToCart = async () => {
-    if (!token) {
-      toast.error('Please login to add items to cart');
-      navigate('/login');
-      return;
-    }
-
     try {
-      await axios.post(`${API}/cart/add?token=${token}`, {
+      // Without a token or guest cart the server starts a new guest cart
+      const response = await axios.post(`${API}/cart/add${cartParams ? `?${cartParams}` : ''}`, {
         product_id: product.id,
         quantity,
         size: selectedSize,
         color: selectedColor,
         price: product.price
       });
+      const newGuestCart = response.data.guest_cart;
+      if (newGuestCart) {
+        saveGuestCart(newGuestCart);
+      }
       toast.success('Added to cart!');
-      loadCartCount();
+      loadCartCount(newGuestCart ? `guest_cart=${newGuestCart}` : cartParams);
     } catch (error) {
       toast.error('Failed to add to cart');
     }
@@ -18,7 +18,7 @@ const Register = () => {
     address: ''
   });
   const [loading, setLoading] = useState(false);
-  const { login } = useContext(AuthContext);
+  const { login, guestCart } = useContext(AuthContext);
   const navigate = useNavigate();
 
   const handleChange = (e) => {
@@ -30,7 +30,9 @@ const Register = () => {
     setLoading(true);
 
     try {
-      const response = await axios.post(`${API}/auth/register`, formData);
+      const response = await axios.post(`${API}/auth/register`, formData, {
+        params: guestCart ? { guest_cart: guestCart } : {}
+      });
       login(response.data.token, response.data.user);
       toast.success('Account created successfully!');
       navigate('/');
@@ -21,19 +21,13 @@ const AdminDashboard = () => {
 
   const loadStats = async () => {
     try {
-      const [productsRes, ordersRes] = await Promise.all([
-        axios.get(`${API}/products`),
-        axios.get(`${API}/admin/orders?token=${token}`)
-      ]);
-
-      const totalRevenue = ordersRes.data.reduce((sum, order) => sum + order.total_amount, 0);
-      const pendingOrders = ordersRes.data.filter(order => order.status === 'pending').length;
+      const response = await axios.get(`${API}/admin/summary?token=${token}`);
 
       setStats({
-        totalProducts: productsRes.data.length,
-        totalOrders: ordersRes.data.length,
-        totalRevenue: totalRevenue,
-        pendingOrders: pendingOrders
+        totalProducts: response.data.total_products,
+        totalOrders: response.data.total_orders,
+        totalRevenue: response.data.total_revenue,
+        pendingOrders: response.data.pending_orders
       });
       setLoading(false);
     } catch (error) {
@@ -11,12 +11,27 @@ const AdminOrders = () => {
   const [orders, setOrders] = useState([]);
   const [loading, setLoading] = useState(true);
   const [filter, setFilter] = useState('all');
+  // Lists carry summaries only; full orders are loaded when expanded
+  const [details, setDetails] = useState({});
+  const [expanded, setExpanded] = useState(null);
   const { token } = useContext(AuthContext);
 
   useEffect(() => {
     loadOrders();
+
+    // Status changes are pushed by the server instead of re-fetching the list
+    const events = new EventSource(`${API}/admin/orders/stream?token=${token}`);
+    events.addEventListener('order_status', (e) => applyUpdate(JSON.parse(e.data)));
+    events.addEventListener('resync', () => loadOrders());
+    return () => events.close();
   }, []);
 
+  const applyUpdate = (update) => {
+    setOrders((current) =>
+      current.map((order) => (order.id === update.id ? { ...order, ...update } : order))
+    );
+  };
+
   const loadOrders = async () => {
     try {
       const response = await axios.get(`${API}/admin/orders?token=${token}`);
@@ -28,13 +43,30 @@ const AdminOrders = () => {
     }
   };
 
+  const toggleItems = async (order) => {
+    if (expanded === order.id) {
+      setExpanded(null);
+      return;
+    }
+    setExpanded(order.id);
+    if (details[order.id]) return;
+    try {
+      const response = await axios.get(`${API}/admin/orders/${order.id}`, {
+        params: { token, created_at: order.created_at }
+      });
+      setDetails((current) => ({ ...current, [order.id]: response.data }));
+    } catch (error) {
+      toast.error('Failed to load order');
+    }
+  };
+
   const handleStatusUpdate = async (orderId, newStatus) => {
     try {
       await axios.put(
         `${API}/admin/orders/${orderId}/status?token=${token}&status=${newStatus}`
       );
+      applyUpdate({ id: orderId, status: newStatus });
       toast.success('Order status updated!');
-      loadOrders();
     } catch (error) {
       toast.error('Failed to update order status');
     }
@@ -45,8 +77,8 @@ const AdminOrders = () => {
       await axios.put(
         `${API}/admin/orders/${orderId}/status?token=${token}&status=${orders.find(o => o.id === orderId).status}&payment_status=${paymentStatus}`
       );
+      applyUpdate({ id: orderId, payment_status: paymentStatus });
       toast.success('Payment status updated!');
-      loadOrders();
     } catch (error) {
       toast.error('Failed to update payment status');
     }
@@ -147,26 +179,44 @@ const AdminOrders = () => {
                       </div>
                     </div>
 
-                    <div className="mb-4">
-                      <h4 className="font-bold mb-2">Items:</h4>
-                      <div className="space-y-2">
-                        {order.items.map((item, idx) => (
-                          <div key={idx} className="flex justify-between text-gray-700 bg-gray-50 p-3 rounded-lg" data-testid={`admin-order-item-${order.id}-${idx}`}>
-                            <span>
-                              {item.product_name} ({item.size}, {item.color}) x {item.quantity}
-                            </span>
-                            <span className="font-semibold">₹{(item.price * item.quantity).toFixed(2)}</span>
-                          </div>
-                        ))}
-                      </div>
+                    <div className="mb-4 flex items-center justify-between">
+                      <span className="text-gray-700" data-testid={`admin-order-summary-${order.id}`}>
+                        {order.first_item_name}
+                        {order.item_count > 1 && ` and ${order.item_count - 1} more`}
+                      </span>
+                      <button
+                        onClick={() => toggleItems(order)}
+                        className="text-blue-600 font-semibold hover:underline"
+                        data-testid={`admin-order-toggle-${order.id}`}
+                      >
+                        {expanded === order.id ? 'Hide details' : 'View details'}
+                      </button>
                     </div>
 
-                    <div className="bg-blue-50 p-4 rounded-lg">
-                      <p className="text-sm">
-                        <span className="font-semibold">Shipping Address:</span>
-                      </p>
-                      <p className="text-gray-700">{order.shipping_address}</p>
-                    </div>
+                    {expanded === order.id && details[order.id] && (
+                      <>
+                        <div className="mb-4">
+                          <h4 className="font-bold mb-2">Items:</h4>
+                          <div className="space-y-2">
+                            {details[order.id].items.map((item, idx) => (
+                              <div key={idx} className="flex justify-between text-gray-700 bg-gray-50 p-3 rounded-lg" data-testid={`admin-order-item-${order.id}-${idx}`}>
+                                <span>
+                                  {item.product_name} ({item.size}, {item.color}) x {item.quantity}
+                                </span>
+                                <span className="font-semibold">₹{(item.price * item.quantity).toFixed(2)}</span>
+                              </div>
+                            ))}
+                          </div>
+                        </div>
+
+                        <div className="bg-blue-50 p-4 rounded-lg">
+                          <p className="text-sm">
+                            <span className="font-semibold">Shipping Address:</span>
+                          </p>
+                          <p className="text-gray-700">{details[order.id].shipping_address}</p>
+                        </div>
+                      </>
+                    )}
 
                     <div className="mt-4 flex items-center justify-between">
                       <span className="text-sm text-gray-600">User ID: {order.user_id.substring(0, 12)}</span>
@@ -223,13 +273,11 @@ const AdminOrders = () => {
                       <div className="space-y-2 text-sm">
                         <div className="flex justify-between">
                           <span className="text-gray-600">Total Items:</span>
-                          <span className="font-semibold">{order.items.length}</span>
+                          <span className="font-semibold">{order.item_count}</span>
                         </div>
                         <div className="flex justify-between">
                           <span className="text-gray-600">Total Quantity:</span>
-                          <span className="font-semibold">
-                            {order.items.reduce((sum, item) => sum + item.quantity, 0)}
-                          </span>
+                          <span className="font-semibold">{order.quantity}</span>
                         </div>
                       </div>
                     </div>
@@ -9,6 +9,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '.
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from '../../components/ui/dialog';
 import { Plus, Edit, Trash2, Upload } from 'lucide-react';
 import { toast, Toaster } from 'sonner';
+import { uploadImage } from '../../lib/resumableUpload';
 
 const AdminProducts = () => {
   const [products, setProducts] = useState([]);
@@ -26,6 +27,8 @@ const AdminProducts = () => {
     imageUrls: []
   });
   const [uploadedFiles, setUploadedFiles] = useState([]);
+  // Full metadata (size, palette, blurhash) of uploaded and existing images by URL
+  const [imageMeta, setImageMeta] = useState({});
   const [uploading, setUploading] = useState(false);
   const { token } = useContext(AuthContext);
 
@@ -81,25 +84,18 @@ const AdminProducts = () => {
     
     try {
       const uploadedUrls = [];
+      const uploadedMeta = {};
       
       for (const file of files) {
-        const formData = new FormData();
-        formData.append('file', file);
-        
-        // Upload to backend
-        const response = await axios.post(
-          `${API}/admin/upload-image?token=${token}`,
-          formData,
-          {
-            headers: {
-              'Content-Type': 'multipart/form-data'
-            }
-          }
-        );
-        
-        uploadedUrls.push(response.data.url);
+        // Large files go up in resumable chunks
+        const image = await uploadImage(API, token, file);
+
+        uploadedUrls.push(image.url);
+        uploadedMeta[image.url] = image;
       }
       
+      setImageMeta(prev => ({ ...prev, ...uploadedMeta }));
+      
       // Add uploaded URLs to form
       setFormData(prev => ({
         ...prev,
@@ -135,7 +131,7 @@ const AdminProducts = () => {
     }
 
     // Create image metadata from selected URLs
-    const images = formData.imageUrls.map(url => ({
+    const images = formData.imageUrls.map(url => imageMeta[url] || ({
       url: url,
       filename: url.split('/').pop(),
       size: 150000,
@@ -174,6 +170,10 @@ const AdminProducts = () => {
 
   const handleEdit = (product) => {
     setEditingProduct(product);
+    setImageMeta(prev => ({
+      ...prev,
+      ...Object.fromEntries(product.images.map(img => [img.url, img]))
+    }));
     setFormData({
       name: product.name,
       description: product.description,
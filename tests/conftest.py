@@ -0,0 +1,165 @@
+"""Shared fixtures for the backend tests.
+
+The app runs in-process against the MongoDB server in ``TEST_MONGO_URL`` (a
+throwaway database, dropped at the end), or against mongomock when it is unset.
+pymongo reports every command to the ``CommandStats`` listener; mongomock sends
+none, so there each collection call is reported as the command pymongo would send
+for it, and the per-request counts are the same in both modes.
+"""
+import functools
+import os
+import sys
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+
+TEST_MONGO_URL = os.environ.get("TEST_MONGO_URL")
+
+os.environ.update(
+    MONGO_URL=TEST_MONGO_URL or "mongodb://localhost:27017",
+    DB_NAME=f"mstex_test_{uuid.uuid4().hex[:8]}",
+    MONGO_COMMAND_STATS="1",
+    RATE_LIMIT_ENABLED="0",
+    CATALOG_SETTLE_SECONDS="0",
+    CATALOG_SNAPSHOT_PATH=str(Path(tempfile.mkdtemp()) / "catalog.snap"),
+)
+
+requires_mongodb = pytest.mark.skipif(not TEST_MONGO_URL, reason="needs a MongoDB server (TEST_MONGO_URL)")
+
+# Collection method -> command name; the callables look at the requests of a bulk write
+_COMMANDS = {
+    "find": "find",
+    "find_one": "find",
+    "insert_one": "insert",
+    "insert_many": "insert",
+    "update_one": "update",
+    "update_many": "update",
+    "replace_one": "update",
+    "delete_one": "delete",
+    "delete_many": "delete",
+    "find_one_and_update": "findAndModify",
+    "find_one_and_replace": "findAndModify",
+    "find_one_and_delete": "findAndModify",
+    "aggregate": "aggregate",
+    "count_documents": "aggregate",
+    "estimated_document_count": "count",
+    "distinct": "distinct",
+    "create_index": "createIndexes",
+    "create_indexes": "createIndexes",
+    "bulk_write": lambda requests, *args, **kwargs: sorted({_BULK_COMMANDS[type(op).__name__] for op in requests}),
+}
+_BULK_COMMANDS = {
+    "InsertOne": "insert",
+    "UpdateOne": "update",
+    "UpdateMany": "update",
+    "ReplaceOne": "update",
+    "DeleteOne": "delete",
+    "DeleteMany": "delete",
+}
+
+
+def use_mongomock():
+    import motor.motor_asyncio
+    from mongomock.collection import Collection
+    from mongomock_motor import AsyncMongoMockClient
+
+    listeners = []
+    nesting = threading.local()
+
+    def client(url, event_listeners=(), **kwargs):
+        listeners.extend(event_listeners)
+        return AsyncMongoMockClient()
+
+    def reported(method, command):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            # mongomock implements some methods with others; only the outer call is a command
+            depth = getattr(nesting, "depth", 0)
+            if depth == 0:
+                names = command(*args, **kwargs) if callable(command) else [command]
+                for name in names:
+                    for listener in listeners:
+                        listener.started(SimpleNamespace(command_name=name))
+            nesting.depth = depth + 1
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                nesting.depth = depth
+        return wrapper
+
+    for name, command in _COMMANDS.items():
+        setattr(Collection, name, reported(getattr(Collection, name), command))
+    # server.py imports the client class by name, so this must run before it is imported
+    motor.motor_asyncio.AsyncIOMotorClient = client
+
+
+if not TEST_MONGO_URL:
+    use_mongomock()
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    import server
+
+    with TestClient(server.app) as test_client:
+        yield test_client
+        if TEST_MONGO_URL:
+            test_client.portal.call(server.client.drop_database, os.environ["DB_NAME"])
+
+
+@pytest.fixture
+def run(client):
+    """Call an async function (a Motor method, say) on the app's event loop."""
+    return client.portal.call
+
+
+@pytest.fixture
+def make_user(run):
+    import server
+
+    def make(role: str = "user", password: str = "secret") -> tuple:
+        user_id = str(uuid.uuid4())
+        email = f"{user_id}@example.com"
+        run(server.db.users.insert_one, {
+            "id": user_id,
+            "email": email,
+            "name": "Test User",
+            "role": role,
+            "password": server.hash_password(password),
+            "created_at": "2026-01-01T00:00:00+00:00",
+        })
+        return {"id": user_id, "email": email, "password": password}, server.create_token(user_id, email, role)
+    return make
+
+
+@pytest.fixture
+def make_product(run):
+    import server
+
+    def make(**fields) -> dict:
+        product = {
+            "id": str(uuid.uuid4()),
+            "name": "Linen Shirt",
+            "description": "Test product",
+            "category": "men",
+            "price": 20.0,
+            "sizes": ["M"],
+            "colors": ["blue"],
+            "stock": 10,
+            "images": [],
+            "created_at": "2026-01-01T00:00:00+00:00",
+            "version": 0,
+            **fields,
+        }
+        run(server.db.products.insert_one, dict(product))
+        return product
+    return make
@@ -0,0 +1,179 @@
+"""MongoDB commands issued per request by the write paths.
+
+The counts are part of each route's contract: a handler that gains a read fails
+here. They come from the ``X-DB-Commands`` header (see command_stats.py).
+"""
+import server
+from tests.conftest import requires_mongodb
+
+
+def commands(response) -> int:
+    assert response.status_code == 200, response.text
+    return int(response.headers["X-DB-Commands"])
+
+
+def cart_line(product: dict, quantity: int = 1) -> dict:
+    return {"product_id": product["id"], "quantity": quantity, "size": "M", "color": "blue", "price": product["price"]}
+
+
+def test_register_relies_on_the_unique_email_index(client):
+    response = client.post("/api/auth/register", json={"email": "new@example.com", "name": "New", "password": "pw"})
+    assert commands(response) == 1  # insert
+
+    response = client.post("/api/auth/register", json={"email": "new@example.com", "name": "New", "password": "pw"})
+    assert response.status_code == 400
+
+
+def test_update_profile(client, make_user):
+    _, token = make_user()
+    response = client.put("/api/auth/profile", params={"token": token}, json={"email": "renamed@example.com", "name": "Renamed"})
+    assert commands(response) == 2  # user, findAndModify
+    assert response.json()["name"] == "Renamed"
+
+
+def test_add_to_cart(client, make_user, make_product):
+    _, token = make_user()
+    product = make_product()
+
+    assert commands(client.post("/api/cart/add", params={"token": token}, json=cart_line(product))) == 2  # user, upsert
+    assert commands(client.post("/api/cart/add", params={"token": token}, json=cart_line(product, 2))) == 2
+
+    cart = client.get("/api/cart", params={"token": token}).json()
+    assert [line["quantity"] for line in cart["items"]] == [3]
+
+
+def test_add_to_guest_cart(client, make_product):
+    product = make_product()
+
+    response = client.post("/api/cart/add", json=cart_line(product))
+    assert commands(response) == 1  # insert
+    guest_cart = response.json()["guest_cart"]
+    assert commands(client.post("/api/cart/add", params={"guest_cart": guest_cart}, json=cart_line(product))) == 1
+
+
+@requires_mongodb  # mongomock has no $anyElementTrue
+def test_login_merges_the_guest_cart(client, make_user, make_product):
+    user, token = make_user()
+    product = make_product()
+    client.post("/api/cart/add", params={"token": token}, json=cart_line(product))
+    guest_cart = client.post("/api/cart/add", json=cart_line(product, 2)).json()["guest_cart"]
+
+    response = client.post(
+        "/api/auth/login", params={"guest_cart": guest_cart}, json={"email": user["email"], "password": user["password"]}
+    )
+    assert commands(response) == 3  # user, claim the guest cart, merge
+
+    cart = client.get("/api/cart", params={"token": token}).json()
+    assert [line["quantity"] for line in cart["items"]] == [3]
+
+
+def test_create_order(client, make_user, make_product):
+    _, token = make_user()
+    product = make_product(price=25.0)
+    item = {**cart_line(product, 2), "product_name": product["name"]}
+
+    response = client.post(
+        "/api/orders/create", params={"token": token},
+        json={"items": [item], "shipping_address": "1 Test Street", "total_amount": 50.0}
+    )
+    assert commands(response) == 4  # user, products, insert, dashboard counts; the cart is cleared by a job
+
+
+def test_update_product(client, make_user, make_product):
+    _, admin = make_user("admin")
+    product = make_product()
+    fields = {key: product[key] for key in ("name", "description", "category", "sizes", "colors", "stock", "images")}
+
+    response = client.put(f"/api/admin/products/{product['id']}", params={"token": admin}, json={**fields, "price": 30.0})
+    assert commands(response) == 3  # user, version, findAndModify
+    assert response.json()["price"] == 30.0
+
+
+def test_bulk_update_products(client, make_user, make_product):
+    _, admin = make_user("admin")
+    products = [make_product(category="bulk-test") for _ in range(3)]
+
+    changes = [{"id": product["id"], "stock": 0} for product in products]
+    response = client.post("/api/admin/products/bulk", params={"token": admin}, json={"changes": changes})
+    assert commands(response) == 3  # user, versions, bulk write
+    assert response.json()["updated"] == 3
+
+    # A shortfall is explained with one more read
+    response = client.post("/api/admin/products/bulk", params={"token": admin}, json={"changes": changes + [{"id": "missing", "stock": 1}]})
+    assert commands(response) == 4
+    assert [result["status"] for result in response.json()["results"]] == ["updated"] * 3 + ["not_found"]
+
+    response = client.post(
+        "/api/admin/products/bulk", params={"token": admin}, json={"filter": {"category": "bulk-test"}, "price_factor": 0.5}
+    )
+    assert commands(response) == 4  # user, matches, versions, bulk write
+    assert response.json()["updated"] == 3
+
+
+def test_bulk_update_orders(client, run, make_user):
+    user, admin = make_user("admin")
+    orders = [
+        {
+            "id": f"bulk-{user['id']}-{n}", "user_id": user["id"], "items": [], "total_amount": 10.0,
+            "shipping_address": "1 Test Street", "status": "bulk-test", "payment_status": "completed",
+            "created_at": "2026-01-01T00:00:00+00:00",
+        }
+        for n in range(3)
+    ]
+    run(server.db.orders.insert_many, [dict(order) for order in orders])
+
+    response = client.post(
+        "/api/admin/orders/bulk", params={"token": admin}, json={"filter": {"status": "bulk-test"}, "status": "shipped"}
+    )
+    assert commands(response) == 4  # user, matches, bulk write, dashboard counts
+    assert response.json()["updated"] == 3
+
+    changes = [{"id": order["id"], "status": "delivered"} for order in orders] + [{"id": "missing", "status": "delivered"}]
+    response = client.post("/api/admin/orders/bulk", params={"token": admin}, json={"changes": changes})
+    assert commands(response) == 4  # user, previous statuses, bulk write, dashboard counts
+    assert [result["status"] for result in response.json()["results"]] == ["updated"] * 3 + ["not_found"]
+
+
+def test_admin_summary_reads_running_totals(client, run, make_user, make_product):
+    _, admin = make_user("admin")
+    _, token = make_user()
+    product = make_product(price=10.0)
+    run(server.order_totals.rebuild)
+
+    item = {**cart_line(product), "product_name": product["name"]}
+    order = client.post(
+        "/api/orders/create", params={"token": token},
+        json={"items": [item], "shipping_address": "1 Test Street", "total_amount": 10.0}
+    ).json()
+    client.put(f"/api/admin/orders/{order['id']}/status", params={"token": admin, "status": "shipped"})
+    client.post("/api/admin/orders/bulk", params={"token": admin}, json={"changes": [{"id": order["id"], "status": "delivered"}]})
+
+    running = run(server.order_totals.get)
+    recounted = run(server.order_totals.rebuild)
+    assert running["orders"] == recounted["orders"]
+    assert round(running["revenue"], 2) == round(recounted["revenue"], 2)
+    assert {status: n for status, n in running["by_status"].items() if n} == recounted["by_status"]
+
+    server._admin_summary_cache["expires"] = 0.0
+    response = client.get("/api/admin/summary", params={"token": admin})
+    assert commands(response) == 4  # user, two estimated counts, the totals
+    assert response.json()["total_orders"] == recounted["orders"]
+
+
+def test_orders_before_the_first_recount_are_not_counted_alone(client, run, make_user, make_product):
+    _, admin = make_user("admin")
+    _, token = make_user()
+    product = make_product(price=10.0)
+    run(server.order_totals.reset)
+
+    item = {**cart_line(product), "product_name": product["name"]}
+    client.post(
+        "/api/orders/create", params={"token": token},
+        json={"items": [item], "shipping_address": "1 Test Street", "total_amount": 10.0}
+    )
+    # No counter document holding just this order's delta
+    assert run(server.order_totals.get) is None
+
+    server._admin_summary_cache["expires"] = 0.0
+    summary = client.get("/api/admin/summary", params={"token": admin}).json()
+    assert summary["total_orders"] == run(server.order_totals.get)["orders"] == run(server.db.orders.count_documents, {})
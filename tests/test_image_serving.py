@@ -0,0 +1,87 @@
+"""``/api/images/{filename}`` on the filesystem backend: ranges, conditional requests,
+variant negotiation and file name checks."""
+import pytest
+
+import server
+from image_serving import ImageFileCache, safe_filename
+from storage import FileSystemStorage
+
+NAME = "c" * 64 + ".jpg"
+BODY = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def images(tmp_path, monkeypatch):
+    root = tmp_path / "products"
+    monkeypatch.setattr(server, "storage", FileSystemStorage(root))
+    monkeypatch.setattr(server, "image_cache", ImageFileCache(root))
+    root.mkdir(parents=True, exist_ok=True)
+    (root / NAME).write_bytes(BODY)
+    return root
+
+
+def get(client, headers=None, name=NAME):
+    return client.get(f"/api/images/{name}", headers={"Accept-Encoding": "identity", **(headers or {})})
+
+
+def test_serves_content_addressed_files_as_immutable(client, images):
+    response = get(client)
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["content-type"] == "image/jpeg"
+    assert response.headers["etag"] == f'"{NAME}"'
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_ranges(client, images):
+    response = get(client, {"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes 10-19/{len(BODY)}"
+    assert response.content == BODY[10:20]
+
+    response = get(client, {"Range": "bytes=-5"})
+    assert response.status_code == 206
+    assert response.content == BODY[-5:]
+
+    assert get(client, {"Range": f"bytes={len(BODY)}-"}).status_code == 416
+    # A range for another version of the file is ignored
+    response = get(client, {"Range": "bytes=0-9", "If-Range": '"other"'})
+    assert response.status_code == 200
+    assert response.content == BODY
+
+
+def test_conditional_requests(client, images):
+    etag = get(client).headers["etag"]
+    assert get(client, {"If-None-Match": etag}).status_code == 304
+    assert get(client, {"If-None-Match": '"other"'}).status_code == 200
+
+    assert get(client, {"If-Match": etag}).status_code == 200
+    assert get(client, {"If-Match": '"other"'}).status_code == 412
+    assert get(client, {"If-Unmodified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"}).status_code == 412
+
+
+def test_variants_written_later_are_served_at_once(client, images):
+    accept = {"Accept": "image/webp,image/*"}
+    assert get(client, accept).headers["content-type"] == "image/jpeg"
+
+    # Written by another worker: nothing invalidated this worker's cache
+    (images / NAME.replace(".jpg", ".webp")).write_bytes(b"webp bytes")
+    response = get(client, accept)
+    assert response.headers["content-type"] == "image/webp"
+    assert response.headers["vary"] == "Accept"
+
+
+def test_missing_and_unsafe_names(client, images):
+    missing = "d" * 64 + ".jpg"
+    assert get(client, name=missing).status_code == 404
+    (images / missing).write_bytes(BODY)
+    assert get(client, name=missing).status_code == 200
+
+    # Deleted elsewhere after its stat was cached
+    (images / NAME).unlink()
+    assert get(client).status_code == 404
+
+    assert get(client, name=".env").status_code == 404
+    for name in ("", ".hidden", "../secret", "a/b", "a\\b", "a\x00b"):
+        assert not safe_filename(name)
+    assert safe_filename(NAME)
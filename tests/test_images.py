@@ -0,0 +1,70 @@
+"""Image storage bookkeeping: content-addressed names, refcounts and garbage collection."""
+import io
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from PIL import Image
+
+import server
+from storage import FileSystemStorage
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    storage = FileSystemStorage(tmp_path / "products")
+    monkeypatch.setattr(server, "storage", storage)
+    return storage
+
+
+def image_file(image_format: str, **options) -> io.BytesIO:
+    fileobj = io.BytesIO()
+    Image.new("RGB", (8, 8), "red").save(fileobj, format=image_format, **options)
+    fileobj.seek(0)
+    return fileobj
+
+
+def register_orphan(run, name: str, refcount: int = 0):
+    long_ago = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+    run(server.db.images.insert_one, {"filename": name, "refcount": refcount, "uploaded_at": long_ago})
+
+
+def test_uploads_are_stored_in_a_known_format(run, storage):
+    # A multi-picture JPEG, as some cameras write, is stored and served as a JPEG
+    mpo = image_file("MPO", save_all=True, append_images=[Image.new("RGB", (8, 8), "blue")])
+    resized, image_format, width, height = server.normalize_upload(mpo)
+    assert (resized, image_format) == (None, "JPEG")
+
+    filename, _ = run(server.store_image_file, mpo, image_format, width, height)
+    assert filename.endswith(".jpg")
+    assert run(storage.exists, filename)
+    assert run(server.db.images.find_one, {"filename": filename}) is not None
+
+    with pytest.raises(ValueError):
+        server.normalize_upload(image_file("BMP"))
+
+
+def test_collection_spares_files_a_product_still_uses(run, storage, make_product):
+    name = "a" * 64 + ".jpg"
+    run(storage.save, name, b"image bytes")
+    # The count is behind: a product write has not applied its increment yet
+    register_orphan(run, name)
+    make_product(images=[{"filename": name, "url": f"/api/images/{name}"}])
+
+    assert run(server.collect_orphaned_images, [name]) == 0
+    assert run(storage.exists, name)
+
+
+def test_reconciliation_leaves_counts_moved_during_the_pass(run, storage, monkeypatch):
+    name = "b" * 64 + ".jpg"
+    run(storage.save, name, b"image bytes")
+    register_orphan(run, name)
+    list_keys = storage.list_keys
+
+    async def list_keys_while_a_product_write_lands():
+        await server.db.images.update_one({"filename": name}, {"$inc": {"refcount": 1}})
+        return await list_keys()
+
+    monkeypatch.setattr(storage, "list_keys", list_keys_while_a_product_write_lands)
+    run(server.reconcile_images)
+    assert run(server.db.images.find_one, {"filename": name})["refcount"] == 1
+    assert run(storage.exists, name)
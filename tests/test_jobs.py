@@ -0,0 +1,112 @@
+"""The background job queue and the scheduling built on it."""
+import asyncio
+
+import server
+from jobs import FAILED, QUEUED, RUNNING, SUCCEEDED, JobQueue, MongoJobStore
+from tests.conftest import requires_mongodb
+
+
+def test_maintenance_is_enqueued_once_per_interval(run):
+    run(server.db.counters.delete_one, {"_id": "maintenance"})
+
+    # Every worker tries; only the first claim of an interval wins
+    assert run(server.claim_maintenance_interval, 100)
+    assert not run(server.claim_maintenance_interval, 100)
+    assert not run(server.claim_maintenance_interval, 99)
+    assert run(server.claim_maintenance_interval, 101)
+
+
+def test_finished_jobs_expire(run):
+    collection = server.db.jobs_retention_test
+    store = MongoJobStore(collection, retention_seconds=3600)
+    run(collection.insert_one, {"id": "old", "type": "t", "status": SUCCEEDED})
+    run(store.ensure_indexes)
+
+    indexes = run(collection.index_information)
+    [ttl] = [index for index in indexes.values() if index["key"] == [("finished_at", 1)]]
+    assert ttl["expireAfterSeconds"] == 3600
+    # Jobs finished before the field existed are given one
+    assert run(collection.find_one, {"id": "old"})["finished_at"] is not None
+
+    run(collection.insert_one, {"id": "new", "type": "t", "status": "running", "lease": "l"})
+    run(store.finish, {"id": "new", "lease": "l"}, FAILED, "boom")
+    assert run(collection.find_one, {"id": "new"})["finished_at"] is not None
+
+
+async def wait_for(queue: JobQueue, job_id: str, statuses=(SUCCEEDED, FAILED)) -> dict:
+    for _ in range(500):
+        job = await queue.status(job_id)
+        if job["status"] in statuses:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"job stayed {job['status']}")
+
+
+def test_failed_jobs_are_retried():
+    calls = []
+
+    async def check():
+        queue = JobQueue(poll_interval=0.01)
+
+        @queue.job("flaky", max_attempts=3, backoff=0.01)
+        async def flaky(payload):
+            calls.append(payload)
+            if len(calls) < 3:
+                raise RuntimeError("not yet")
+
+        await queue.start()
+        job = await wait_for(queue, await queue.enqueue("flaky", {"n": 1}))
+        await queue.drain(1)
+        return job
+
+    job = asyncio.run(check())
+    assert job["status"] == SUCCEEDED
+    assert job["attempts"] == 3
+    assert calls == [{"n": 1}] * 3
+
+
+def test_jobs_fail_after_their_last_attempt():
+    async def check():
+        queue = JobQueue(poll_interval=0.01)
+
+        @queue.job("broken", max_attempts=2, backoff=0.01)
+        async def broken(payload):
+            raise ValueError("bad payload")
+
+        @queue.job("slow", max_attempts=1, timeout=0.01)
+        async def slow(payload):
+            await asyncio.sleep(1)
+
+        await queue.start()
+        jobs = [await wait_for(queue, await queue.enqueue(name, {})) for name in ("broken", "slow")]
+        await queue.drain(1)
+        return jobs
+
+    broken, slow = asyncio.run(check())
+    assert (broken["status"], broken["attempts"], broken["last_error"]) == (FAILED, 2, "ValueError: bad payload")
+    assert (slow["status"], slow["attempts"]) == (FAILED, 1)
+    assert slow["last_error"].startswith("TimeoutError")
+
+
+@requires_mongodb  # mongomock's find_one_and_update returns None when the update changes a filtered field
+def test_an_expired_lease_is_taken_over(run):
+    collection = server.db.jobs_lease_test
+    store = MongoJobStore(collection, lease_seconds=60)
+    run(collection.insert_one, {"id": "job", "type": "t", "payload": {}, "status": QUEUED, "attempts": 0, "run_at": 0})
+
+    first = run(store.claim, "t")
+    assert run(store.claim, "t") is None  # leased
+    assert run(store.renew, first)
+
+    # The first worker died: its lease runs out and another worker claims the job
+    run(collection.update_one, {"id": "job"}, {"$set": {"lease_until": 0}})
+    second = run(store.claim, "t")
+    assert second["attempts"] == 2
+    assert second["lease"] != first["lease"]
+
+    # The first worker's late result and renewals no longer apply
+    assert not run(store.renew, first)
+    run(store.finish, first, FAILED, "late")
+    assert run(collection.find_one, {"id": "job"})["status"] == RUNNING
+    run(store.finish, second, SUCCEEDED)
+    assert run(collection.find_one, {"id": "job"})["status"] == SUCCEEDED
@@ -0,0 +1,25 @@
+"""Order list reads."""
+import server
+
+
+def test_orders_written_before_summaries_are_summarized_on_read(client, run, make_user):
+    user, token = make_user()
+    _, admin = make_user("admin")
+    # As stored before orders carried their list summary
+    run(server.db.orders.insert_one, {
+        "id": f"legacy-{user['id']}", "user_id": user["id"], "total_amount": 40.0,
+        "items": [
+            {"product_id": "p1", "product_name": "Linen Shirt", "image": "shirt.jpg", "quantity": 2, "price": 10.0},
+            {"product_id": "p2", "product_name": "Scarf", "quantity": 1, "price": 20.0},
+        ],
+        "shipping_address": "1 Test Street", "status": "pending", "payment_status": "completed",
+        "created_at": "2025-06-01T00:00:00+00:00",
+    })
+
+    expected = {"item_count": 2, "quantity": 3, "first_item_name": "Linen Shirt", "first_item_image": "shirt.jpg"}
+    [order] = client.get("/api/orders", params={"token": token}).json()
+    assert {key: order[key] for key in expected} == expected
+
+    orders = client.get("/api/admin/orders", params={"token": admin}).json()
+    [order] = [order for order in orders if order["id"] == f"legacy-{user['id']}"]
+    assert {key: order[key] for key in expected} == expected
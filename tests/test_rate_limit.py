@@ -0,0 +1,79 @@
+"""Token buckets and concurrency slots (see rate_limit.py)."""
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+import rate_limit
+from rate_limit import MemoryBucketStore, RateLimiter
+
+
+def make_client(**limit) -> TestClient:
+    limiter = RateLimiter(MemoryBucketStore(), identify=lambda token: {"t1": "u1", "t2": "u2"}.get(token))
+    app = FastAPI()
+
+    @app.get("/limited", dependencies=[Depends(limiter.limit("test", **limit))])
+    def limited():
+        return {}
+
+    return TestClient(app)
+
+
+def test_buckets_allow_a_burst_then_answer_429():
+    client = make_client(rate=0.1, burst=2)
+    assert [client.get("/limited", params={"token": "t1"}).status_code for _ in range(3)] == [200, 200, 429]
+    response = client.get("/limited", params={"token": "t1"})
+    assert int(response.headers["Retry-After"]) >= 1
+
+    # Another user, and anonymous clients by IP, have their own buckets
+    assert client.get("/limited", params={"token": "t2"}).status_code == 200
+    assert client.get("/limited").status_code == 200
+    # An invalid token counts against the IP
+    assert client.get("/limited", params={"token": "forged"}).status_code == 200
+    assert client.get("/limited").status_code == 429
+
+
+def test_by_ip_ignores_the_token():
+    client = make_client(rate=0.1, burst=1, by_ip=True)
+    assert client.get("/limited", params={"token": "t1"}).status_code == 200
+    assert client.get("/limited", params={"token": "t2"}).status_code == 429
+
+
+def test_only_matching_requests_are_limited():
+    client = make_client(rate=0.1, burst=1, when=lambda request: "search" in request.query_params)
+    assert client.get("/limited", params={"search": "a"}).status_code == 200
+    assert client.get("/limited", params={"search": "a"}).status_code == 429
+    assert client.get("/limited").status_code == 200
+
+
+def test_buckets_refill(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    store = MemoryBucketStore()
+
+    async def take():
+        return await store.take("key", rate=2, burst=1)
+
+    assert asyncio.run(take()) == 0
+    assert asyncio.run(take()) == pytest.approx(0.5)
+    now[0] += 0.5
+    assert asyncio.run(take()) == 0
+
+
+def test_concurrency_slots_turn_away_requests_that_cannot_get_one():
+    limiter = RateLimiter(MemoryBucketStore(), identify=lambda token: None)
+    slot = limiter.concurrency("test", 1, wait=0.01)
+
+    async def check():
+        held = slot(None)
+        await held.__anext__()
+        with pytest.raises(HTTPException) as error:
+            await slot(None).__anext__()
+        assert error.value.status_code == 503
+        assert error.value.headers["Retry-After"] == "1"
+
+        # Released when the first request finishes
+        await held.aclose()
+        await slot(None).__anext__()
+    asyncio.run(check())
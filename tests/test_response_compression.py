@@ -0,0 +1,84 @@
+"""Accept-Encoding negotiation, cached payloads and the compression middleware."""
+import asyncio
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from response_compression import ENCODINGS, CompressedPayload, CompressionMiddleware, negotiate
+
+LARGE = {"items": ["x" * 40] * 100}
+
+
+def request(**headers) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_negotiation():
+    assert negotiate(None) is None
+    assert negotiate("identity") is None
+    assert negotiate("gzip") == "gzip"
+    # Ties go to the server's preference, higher q-values win
+    assert negotiate("gzip, br, zstd") == ENCODINGS[0]
+    assert negotiate("br;q=0.5, gzip") == "gzip"
+    assert negotiate("*") == ENCODINGS[0]
+    # q=0 refuses an encoding even when a wildcard would allow it
+    assert negotiate("gzip;q=0, *;q=0.1") == next(e for e in ENCODINGS if e != "gzip")
+    assert negotiate("gzip;q=0") is None
+    assert negotiate("gzip;q=bogus") is None
+
+
+def test_payloads_serve_their_stored_encodings():
+    body = b'{"items": [' + b'"abcdefgh",' * 200 + b'"end"]}'
+    payload = CompressedPayload(body, etag='"v1"')
+    # Not compressed yet: served as it is, with the tag the middleware's output gets
+    response = payload.response(request(accept_encoding="gzip"))
+    assert response.body == body
+    assert "content-encoding" not in response.headers
+
+    asyncio.run(payload.precompress())
+    response = payload.response(request(accept_encoding="gzip"))
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == '"v1-gzip"'
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert gzip.decompress(response.body) == body
+
+    # Every tag of the payload revalidates, whichever encoding it was sent in
+    for tag in ('"v1"', '"v1-gzip"', f'"v1-{ENCODINGS[0]}"'):
+        assert payload.response(request(accept_encoding="gzip", if_none_match=tag)).status_code == 304
+    assert payload.response(request(if_none_match='"v0"')).status_code == 200
+
+
+def make_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/large")
+    def large():
+        return JSONResponse(LARGE, headers={"ETag": '"large"'})
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_middleware_compresses_large_responses():
+    client = make_client()
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    # A strong tag names the compressed representation
+    assert response.headers["etag"] == '"large-gzip"'
+    assert response.json() == LARGE
+
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"large"'
+
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,64 @@
+"""Resumable upload sessions: chunk leases and expiry."""
+import asyncio
+import hashlib
+import uuid
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+import resumable_uploads
+import server
+from resumable_uploads import UploadSessions
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    return UploadSessions(server.db[f"upload_sessions_{uuid.uuid4().hex[:8]}"], tmp_path, max_size=1024, chunk_size=64, ttl=timedelta(hours=1))
+
+
+async def chunks(*pieces, between=None):
+    for n, piece in enumerate(pieces):
+        if n and between is not None:
+            await between()
+        yield piece
+
+
+def test_chunks_advance_the_offset(run, sessions):
+    session = run(sessions.create, "user", 16)
+    data = b"0123456789abcdef"
+    result = run(sessions.write_chunk, session["id"], "user", 0, hashlib.sha256(data[:8]).hexdigest(), chunks(data[:8]))
+    assert result["offset"] == 8
+    result = run(sessions.write_chunk, session["id"], "user", 8, hashlib.sha256(data[8:]).hexdigest(), chunks(data[8:]))
+    assert result["offset"] == 16
+    assert run(sessions.complete, session["id"], "user").read_bytes() == data
+
+
+def test_a_writer_that_lost_its_lease_leaves_the_session_alone(run, sessions, monkeypatch):
+    monkeypatch.setattr(resumable_uploads, "LEASE_SECONDS", 0.3)
+    session = run(sessions.create, "user", 16)
+    path = sessions._path(session["id"])
+
+    async def taken_over():
+        # The lease lapsed while the client stalled, and a retry of the chunk claimed it
+        await asyncio.sleep(0.3)
+        await sessions.collection.update_one({"id": session["id"]}, {"$set": {"lease": "retry", "lease_until": 1e12}})
+        path.write_bytes(b"retry data")
+
+    with pytest.raises(HTTPException) as error:
+        run(sessions.write_chunk, session["id"], "user", 0, "0" * 64, chunks(b"abcd", b"efgh", between=taken_over))
+    assert error.value.status_code == 409
+    # Neither the other writer's bytes nor the offset were touched
+    assert path.read_bytes() == b"retry data"
+    assert run(sessions.collection.find_one, {"id": session["id"]})["offset"] == 0
+
+
+def test_expiry_skips_sessions_with_a_chunk_in_flight(run, sessions):
+    writing, idle = run(sessions.create, "user", 16), run(sessions.create, "user", 16)
+    run(sessions.collection.update_many, {}, {"$set": {"expires_at": "2000-01-01T00:00:00+00:00"}})
+    run(sessions.collection.update_one, {"id": writing["id"]}, {"$set": {"lease_until": 1e12}})
+
+    assert run(sessions.expire)["expired"] == 1
+    assert run(sessions.collection.find_one, {"id": writing["id"]}) is not None
+    assert sessions._path(writing["id"]).exists()
+    assert not sessions._path(idle["id"]).exists()
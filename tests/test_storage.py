@@ -0,0 +1,88 @@
+"""The image storage backends against the same checks: the local filesystem, and S3
+through moto's in-process mock of the API."""
+import asyncio
+import io
+from urllib.parse import urlparse
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from storage import FileSystemStorage, S3Storage
+
+BUCKET = "mstex-images"
+KEY = "0" * 64 + ".jpg"
+
+
+@pytest.fixture
+def filesystem(tmp_path):
+    return FileSystemStorage(tmp_path / "products")
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    for name, value in (("AWS_ACCESS_KEY_ID", "testing"), ("AWS_SECRET_ACCESS_KEY", "testing"),
+                        ("AWS_DEFAULT_REGION", "us-east-1")):
+        monkeypatch.setenv(name, value)
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=BUCKET)
+        # The smallest part S3 accepts, so a multipart upload stays small
+        yield S3Storage(BUCKET, client=client, part_size=5 * 1024 * 1024)
+
+
+@pytest.fixture(params=["filesystem", "s3"])
+def storage(request):
+    return request.getfixturevalue(request.param)
+
+
+def test_save_read_delete(storage):
+    async def check():
+        assert not await storage.exists(KEY)
+        await storage.save(KEY, b"image bytes", "image/jpeg")
+        assert await storage.exists(KEY)
+        assert await storage.read(KEY) == b"image bytes"
+        assert await storage.list_keys() == [KEY]
+
+        await storage.delete(KEY)
+        assert not await storage.exists(KEY)
+        assert await storage.list_keys() == []
+        # Deleting again is not an error
+        await storage.delete(KEY)
+    asyncio.run(check())
+
+
+def test_save_file_streams_large_files(storage):
+    data = bytes(range(256)) * (6 * 1024 * 1024 // 256)
+
+    async def check():
+        await storage.save_file(KEY, io.BytesIO(data), "image/jpeg")
+        assert await storage.read(KEY) == data
+    asyncio.run(check())
+
+
+def test_filesystem_serves_locally(filesystem):
+    asyncio.run(filesystem.save(KEY, b"image bytes"))
+    assert filesystem.local_path(KEY).read_bytes() == b"image bytes"
+    assert filesystem.public_url(KEY) is None
+    assert asyncio.run(filesystem.redirect_url(KEY)) is None
+
+
+def test_s3_objects_are_immutable(s3):
+    asyncio.run(s3.save(KEY, b"image bytes", "image/jpeg"))
+    head = s3.client.head_object(Bucket=BUCKET, Key=f"products/{KEY}")
+    assert head["ContentType"] == "image/jpeg"
+    assert head["CacheControl"] == "public, max-age=31536000, immutable"
+
+
+def test_s3_redirects_to_a_presigned_url(s3):
+    url = urlparse(asyncio.run(s3.redirect_url(KEY)))
+    assert url.path.endswith(f"/products/{KEY}")
+    assert "Signature=" in url.query or "X-Amz-Signature=" in url.query
+    assert s3.public_url(KEY) is None
+    assert s3.local_path(KEY) is None
+
+
+def test_s3_redirects_to_the_public_base_url(s3):
+    public = S3Storage(BUCKET, client=s3.client, public_base_url="https://cdn.example.com/")
+    assert asyncio.run(public.redirect_url(KEY)) == f"https://cdn.example.com/products/{KEY}"